@@ -0,0 +1,111 @@
+"""Run the benchmark suite and write the results as a JSON document.
+
+Run with `python -m benchmarks [BENCHMARK ...] [--output PATH] [--compare PATH]`.
+
+The document contains the results of each benchmark together with the commit and
+package versions they were measured with. Passing a previous document with
+`--compare` prints the ratio of each metric to its baseline value.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+from importlib.metadata import version
+from typing import Any
+
+BENCHMARKS = (
+    "startup",
+    "swarm_cache",
+    "handoff",
+    "turns",
+    "checkpoint_dedup",
+    "throughput",
+    "async_swarm",
+    "replay",
+    "pool",
+)
+
+
+def _get_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _get_metadata() -> dict[str, Any]:
+    return {
+        "commit": _get_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": {
+            package: version(package) for package in ("langgraph", "langchain-core")
+        },
+    }
+
+
+def _get_key(result: dict[str, Any]) -> str:
+    return json.dumps([result["benchmark"], result["params"]], sort_keys=True)
+
+
+def _compare(results: list[dict[str, Any]], baseline: dict[str, Any]) -> None:
+    baseline_results = {_get_key(result): result for result in baseline["results"]}
+    for result in results:
+        baseline_result = baseline_results.get(_get_key(result))
+        if baseline_result is None:
+            continue
+        for metric, value in result["metrics"].items():
+            baseline_value = baseline_result["metrics"].get(metric)
+            if not baseline_value:
+                continue
+            print(  # noqa: T201
+                f"{result['benchmark']} {result['params']} {metric}: "
+                f"{value / baseline_value:.2f}x",
+                file=sys.stderr,
+            )
+
+
+def main() -> None:
+    """Run the selected benchmarks and write the results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)}).",
+    )
+    parser.add_argument("--output", help="File to write the results to.")
+    parser.add_argument("--compare", help="Results of a previous run to compare to.")
+    args = parser.parse_args()
+    if unknown := set(args.benchmarks) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in args.benchmarks or BENCHMARKS:
+        module = importlib.import_module(f"benchmarks.{name}")
+        results.extend(module.run())
+
+    document = {"metadata": _get_metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:  # noqa: PTH123
+            json.dump(document, f, indent=2)
+    else:
+        print(json.dumps(document, indent=2))  # noqa: T201
+
+    if args.compare:
+        with open(args.compare) as f:  # noqa: PTH123
+            _compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Helpers for measuring checkpoint storage in the benchmarks."""
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+def get_stored_bytes(checkpointer: InMemorySaver) -> int:
+    """Get the total size of the serialized checkpoints, channel values and writes."""
+    blob_bytes = sum(len(blob) for _, blob in checkpointer.blobs.values())
+    checkpoint_bytes = sum(
+        len(checkpoint[1]) + len(metadata[1])
+        for namespaces in checkpointer.storage.values()
+        for checkpoints in namespaces.values()
+        for checkpoint, metadata, _ in checkpoints.values()
+    )
+    write_bytes = sum(
+        len(value[1])
+        for writes in checkpointer.writes.values()
+        for _, _, value, _ in writes.values()
+    )
+    return blob_bytes + checkpoint_bytes + write_bytes
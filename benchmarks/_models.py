@@ -0,0 +1,49 @@
+"""Scripted fake chat models used by the benchmarks."""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain.chat_models import BaseChatModel
+from langchain.messages import AIMessage
+from langchain.tools import BaseTool
+from langchain_core.callbacks.manager import CallbackManagerForLLMRun
+from langchain_core.messages.base import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from typing_extensions import override
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Fake chat model that returns its scripted responses in a loop."""
+
+    idx: int = 0
+    responses: list[BaseMessage] = []  # noqa: RUF012
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake-model"
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if not self.responses:
+            message: BaseMessage = AIMessage(content="ok")
+        else:
+            # copy the response, so that every generation gets a new message id
+            message = self.responses[self.idx % len(self.responses)].model_copy()
+            self.idx += 1
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> "ScriptedChatModel":
+        return self
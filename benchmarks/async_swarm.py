@@ -0,0 +1,93 @@
+"""Benchmark async swarm throughput with many concurrent threads.
+
+Each thread runs a single turn in which Alice hands off to Bob, who replies.
+The handoff tool runs either natively as a coroutine, or (as before) as a sync
+function dispatched to the thread pool executor.
+
+Run with `python -m benchmarks.async_swarm`.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langchain.tools import BaseTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import create_handoff_tool, create_swarm
+
+CONCURRENT_THREADS = 1_000
+
+
+def _make_app(handoff_tool: BaseTool) -> Any:
+    alice = create_agent(
+        ScriptedChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": handoff_tool.name, "args": {}, "id": "call_1"}
+                    ],
+                )
+            ]
+        ),
+        tools=[handoff_tool],
+        name="Alice",
+    )
+    bob = create_agent(
+        ScriptedChatModel(responses=[AIMessage(content="Hi, I'm Bob.")]),
+        tools=[],
+        name="Bob",
+    )
+    workflow = create_swarm([alice, bob], default_active_agent="Alice")
+    return workflow.compile(checkpointer=InMemorySaver())
+
+
+async def _run_threads(app: Any, count: int, prefix: str) -> float:
+    async def run_thread(thread_id: int) -> None:
+        config = {"configurable": {"thread_id": f"{prefix}-{thread_id}"}}
+        await app.ainvoke(
+            {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]},
+            config,
+        )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_thread(i) for i in range(count)))
+    return time.perf_counter() - start
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    native_tool = create_handoff_tool(agent_name="Bob")
+    tools = {
+        "coroutine": native_tool,
+        "executor": native_tool.model_copy(update={"coroutine": None}),
+    }
+    for mode, tool in tools.items():
+        app = _make_app(tool)
+        # warm up the graph and the executor
+        asyncio.run(_run_threads(app, 10, "warmup"))
+        seconds = asyncio.run(_run_threads(app, CONCURRENT_THREADS, "run"))
+        yield {
+            "benchmark": "async_swarm",
+            "params": {"handoff_tool": mode, "threads": CONCURRENT_THREADS},
+            "metrics": {
+                "seconds": seconds,
+                "turns_per_second": CONCURRENT_THREADS / seconds,
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
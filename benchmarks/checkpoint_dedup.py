@@ -0,0 +1,127 @@
+"""Benchmark the checkpoint storage of a long multi-handoff conversation.
+
+Each turn starts with Alice, who looks something up and hands off to Bob, who
+hands off to Charlie, who replies. Compares the checkpoint bytes written per turn
+with the default serializer and with `MessageStoreSerializer`, which stores each
+message once and references it from the parent and subgraph checkpoints.
+
+Run with `python -m benchmarks.checkpoint_dedup`.
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langchain_core.stores import InMemoryByteStore
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._checkpoint import get_stored_bytes
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import MessageStoreSerializer, create_handoff_tool, create_swarm
+
+TURNS = 50
+
+
+def lookup(query: str) -> str:
+    """Look up a query."""
+    return f"Result for {query}: " + "lorem ipsum " * 20
+
+
+def _make_app(checkpointer: InMemorySaver) -> Any:
+    alice = create_agent(
+        ScriptedChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "lookup", "args": {"query": "order"}, "id": "call_1"}
+                    ],
+                ),
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "transfer_to_bob", "args": {}, "id": "call_2"}
+                    ],
+                ),
+            ]
+        ),
+        tools=[lookup, create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob = create_agent(
+        ScriptedChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "transfer_to_charlie", "args": {}, "id": "call_3"}
+                    ],
+                )
+            ]
+        ),
+        tools=[create_handoff_tool(agent_name="Charlie")],
+        name="Bob",
+    )
+    charlie = create_agent(
+        ScriptedChatModel(responses=[AIMessage(content="Your order has shipped.")]),
+        tools=[],
+        name="Charlie",
+    )
+    workflow = create_swarm([alice, bob, charlie], default_active_agent="Alice")
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _get_store_bytes(store: InMemoryByteStore) -> int:
+    return sum(len(value) for value in store.store.values())
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for serializer in ("default", "message_store"):
+        store = InMemoryByteStore()
+        checkpointer = InMemorySaver(
+            serde=MessageStoreSerializer(store)
+            if serializer == "message_store"
+            else None
+        )
+        app = _make_app(checkpointer)
+        config = {"configurable": {"thread_id": "1"}}
+
+        latencies = []
+        for turn in range(TURNS):
+            start = time.perf_counter()
+            app.invoke(
+                {
+                    "messages": [
+                        {"role": "user", "content": f"where is my order #{turn}?"}
+                    ],
+                    "active_agent": "Alice",
+                },
+                config,
+            )
+            latencies.append(time.perf_counter() - start)
+        stored_bytes = get_stored_bytes(checkpointer) + _get_store_bytes(store)
+
+        yield {
+            "benchmark": "checkpoint_dedup",
+            "params": {"serializer": serializer, "turns": TURNS},
+            "metrics": {
+                "turn_seconds_mean": statistics.mean(latencies),
+                "checkpoint_bytes_per_turn": stored_bytes / TURNS,
+                "message_store_bytes": _get_store_bytes(store),
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
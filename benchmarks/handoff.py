@@ -0,0 +1,81 @@
+"""Benchmark the cost of a single handoff as the conversation history grows.
+
+Run with `python -m benchmarks.handoff`.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.messages import AIMessage, AnyMessage, HumanMessage
+from langgraph.graph.message import add_messages
+
+from langgraph_swarm import create_handoff_tool
+
+HISTORY_SIZES = (10, 100, 1_000, 10_000)
+ITERATIONS = 50
+
+
+def _make_history(size: int) -> list[AnyMessage]:
+    messages: list[AnyMessage] = []
+    for i in range(size - 1):
+        cls = HumanMessage if i % 2 == 0 else AIMessage
+        messages.append(cls(content=f"message {i}", id=f"msg-{i}"))
+
+    messages.append(
+        AIMessage(
+            content="",
+            id=f"msg-{size - 1}",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+        )
+    )
+    return messages
+
+
+def _time_handoff(transfer_messages: Any, history: list[AnyMessage]) -> dict[str, Any]:
+    tool = create_handoff_tool(agent_name="Bob", transfer_messages=transfer_messages)
+    tool_call = {
+        "type": "tool_call",
+        "name": tool.name,
+        "args": {"state": {"messages": history}},
+        "id": "call_1",
+    }
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        command = tool.invoke(tool_call)
+    tool_seconds = (time.perf_counter() - start) / ITERATIONS
+
+    # apply the update the same way the parent graph's reducer would
+    update = command.update["messages"]
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        add_messages(history, update)
+    reducer_seconds = (time.perf_counter() - start) / ITERATIONS
+    return {
+        "update_messages": len(update),
+        "tool_seconds": tool_seconds,
+        "reducer_seconds": reducer_seconds,
+    }
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for size in HISTORY_SIZES:
+        history = _make_history(size)
+        for mode in ("full", "delta"):
+            yield {
+                "benchmark": "handoff",
+                "params": {"transfer_messages": mode, "history_size": size},
+                "metrics": _time_handoff(mode, history),
+            }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
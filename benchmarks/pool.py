@@ -0,0 +1,100 @@
+"""Benchmark the scaling of a swarm served by a worker pool across processes.
+
+Each thread is a turn in which Alice and Bob hand off control back and forth
+before Alice replies, checkpointed in memory. The model calls are instant, so the
+turns are CPU-bound and a single process is limited by the GIL. The threads are
+run through `SwarmWorkerPool` with an increasing number of worker processes;
+the throughput scales with the workers up to the number of CPU cores.
+
+Run with `python -m benchmarks.pool`.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import SwarmWorkerPool, create_handoff_tool, create_swarm
+
+WORKERS = (1, 2, 4)
+THREADS = 64
+HANDOFFS_PER_THREAD = 10
+
+
+def _make_handoff(agent_name: str) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": f"transfer_to_{agent_name.lower()}", "args": {}, "id": "call_1"}
+        ],
+    )
+
+
+def _make_app() -> Any:
+    """Create the swarm, in each worker process."""
+    alice = create_agent(
+        ScriptedChatModel(
+            responses=[
+                *([_make_handoff("Bob")] * (HANDOFFS_PER_THREAD // 2)),
+                AIMessage(content="Done."),
+            ]
+        ),
+        tools=[create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob = create_agent(
+        ScriptedChatModel(responses=[_make_handoff("Alice")]),
+        tools=[create_handoff_tool(agent_name="Alice")],
+        name="Bob",
+    )
+    workflow = create_swarm([alice, bob], default_active_agent="Alice")
+    return workflow.compile(checkpointer=InMemorySaver())
+
+
+def _run_threads(pool: SwarmWorkerPool, prefix: str, count: int) -> None:
+    futures = [
+        pool.submit(
+            {"messages": [{"role": "user", "content": "hi"}]},
+            {"configurable": {"thread_id": f"{prefix}-{i}"}, "recursion_limit": 100},
+        )
+        for i in range(count)
+    ]
+    for future in futures:
+        future.result()
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for workers in WORKERS:
+        # the scripted models are shared by the runs of a worker, so run them
+        # one at a time to keep the scripts in order
+        with SwarmWorkerPool(_make_app, workers=workers, max_concurrency=1) as pool:
+            # start the workers (spawning and importing) before measuring
+            _run_threads(pool, "warmup", workers * 4)
+            start = time.perf_counter()
+            _run_threads(pool, "thread", THREADS)
+            seconds = time.perf_counter() - start
+
+        yield {
+            "benchmark": "pool",
+            "params": {"workers": workers, "threads": THREADS},
+            "metrics": {
+                "threads_per_second": THREADS / seconds,
+                "handoffs_per_second": THREADS * HANDOFFS_PER_THREAD / seconds,
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
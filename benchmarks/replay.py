@@ -0,0 +1,135 @@
+"""Benchmark the throughput of a swarm replaying a recorded cassette.
+
+A conversation (Alice looks something up and hands off to Bob, who hands off to
+Charlie, who replies) is recorded once into a cassette, then replayed offline in
+many concurrent threads with `ReplayChatModel`, with and without a synthetic model
+latency. Reports the threads and handoffs per second.
+
+Run with `python -m benchmarks.replay`.
+"""
+
+import asyncio
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.chat_models import BaseChatModel
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import (
+    BatchStats,
+    Cassette,
+    CassetteRecorder,
+    ReplayChatModel,
+    astream_batch,
+    create_handoff_tool,
+    create_swarm,
+)
+
+LATENCIES = (0.0, 0.01)
+THREADS = 200
+MAX_CONCURRENCY = 32
+HANDOFFS_PER_THREAD = 2
+
+
+def lookup(query: str) -> str:
+    """Look up a query."""
+    return f"Result for {query}"
+
+
+def _make_handoff(agent_name: str) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": f"transfer_to_{agent_name.lower()}", "args": {}, "id": "call_1"}
+        ],
+    )
+
+
+def _make_app(models: dict[str, BaseChatModel]) -> Any:
+    alice = create_agent(
+        models["Alice"],
+        tools=[lookup, create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob = create_agent(
+        models["Bob"], tools=[create_handoff_tool(agent_name="Charlie")], name="Bob"
+    )
+    charlie = create_agent(models["Charlie"], tools=[], name="Charlie")
+    workflow = create_swarm([alice, bob, charlie], default_active_agent="Alice")
+    return workflow.compile(checkpointer=InMemorySaver())
+
+
+def _make_input() -> dict[str, Any]:
+    return {"messages": [{"role": "user", "content": "where is my order?"}]}
+
+
+def _record_cassette() -> Cassette:
+    """Record the conversation, with scripted models standing in for real ones."""
+    models: dict[str, BaseChatModel] = {
+        "Alice": ScriptedChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "lookup", "args": {"query": "order"}, "id": "call_1"}
+                    ],
+                ),
+                _make_handoff("Bob"),
+            ]
+        ),
+        "Bob": ScriptedChatModel(responses=[_make_handoff("Charlie")]),
+        "Charlie": ScriptedChatModel(
+            responses=[AIMessage(content="Your order has shipped.")]
+        ),
+    }
+    recorder = CassetteRecorder()
+    _make_app(models).invoke(
+        _make_input(), {"configurable": {"thread_id": "0"}, "callbacks": [recorder]}
+    )
+    return recorder.cassette
+
+
+async def _replay(cassette: Cassette, latency: float) -> BatchStats:
+    model = ReplayChatModel(cassette=cassette, latency=latency)
+    app = _make_app({"Alice": model, "Bob": model, "Charlie": model})
+    items = ((str(i), _make_input()) for i in range(THREADS))
+    stats = BatchStats()
+    async for result in astream_batch(
+        app, items, max_concurrency=MAX_CONCURRENCY, stats=stats
+    ):
+        if result.error is not None:
+            raise result.error
+    return stats
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    cassette = _record_cassette()
+    for latency in LATENCIES:
+        stats = asyncio.run(_replay(cassette, latency))
+        yield {
+            "benchmark": "replay",
+            "params": {
+                "latency": latency,
+                "threads": THREADS,
+                "max_concurrency": MAX_CONCURRENCY,
+            },
+            "metrics": {
+                "threads_per_second": stats.threads_per_second,
+                "handoffs_per_second": stats.threads_per_second * HANDOFFS_PER_THREAD,
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmark `create_swarm` build time for swarms of increasing size.
+
+Also compares the time and memory it takes to build a swarm from scratch, with
+all agents created up front or lazily (`LazyAgent`).
+
+Run with `python -m benchmarks.startup`.
+"""
+
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any
+
+from langchain.agents import create_agent
+from langgraph.prebuilt import ToolNode
+
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import LazyAgent, create_handoff_tool, create_swarm
+from langgraph_swarm.handoff import METADATA_KEY_HANDOFF_DESTINATION
+
+AGENT_COUNTS = (10, 100, 500)
+PEERS_PER_AGENT = 5
+
+
+def _get_names(count: int) -> list[str]:
+    return [f"agent_{i}" for i in range(count)]
+
+
+def _get_peers(names: list[str], index: int) -> list[str]:
+    return [names[(index + j) % len(names)] for j in range(1, PEERS_PER_AGENT + 1)]
+
+
+def _make_agent(model: ScriptedChatModel, name: str, peers: list[str]) -> Any:
+    return create_agent(
+        model,
+        tools=[create_handoff_tool(agent_name=peer) for peer in peers],
+        name=name,
+    )
+
+
+def _make_agents(count: int) -> list[Any]:
+    model = ScriptedChatModel()
+    names = _get_names(count)
+    return [
+        _make_agent(model, name, _get_peers(names, i)) for i, name in enumerate(names)
+    ]
+
+
+def _make_lazy_agents(count: int) -> list[Any]:
+    model = ScriptedChatModel()
+    names = _get_names(count)
+    return [
+        LazyAgent(
+            name,
+            partial(_make_agent, model, name, _get_peers(names, i)),
+            destinations=_get_peers(names, i),
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def _build_swarm(make_agents: Callable[[int], list[Any]], count: int) -> Any:
+    """Build a swarm from scratch, including its agents."""
+    workflow = create_swarm(make_agents(count), default_active_agent="agent_0")
+    return workflow.compile()
+
+
+def _time_cold_start(
+    make_agents: Callable[[int], list[Any]], count: int
+) -> tuple[float, int]:
+    """Get the time and the memory it takes to build a swarm from scratch."""
+    start = time.perf_counter()
+    _build_swarm(make_agents, count)
+    seconds = time.perf_counter() - start
+
+    # measured separately, as tracing allocations slows down the build
+    tracemalloc.start()
+    app = _build_swarm(make_agents, count)
+    memory_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del app
+    return seconds, memory_bytes
+
+
+def _get_destinations_from_graph(agent: Any) -> list[str]:
+    """Discover handoff destinations by drawing the agent graph."""
+    nodes = agent.get_graph().nodes
+    tool_node = nodes["tools"].data
+    if not isinstance(tool_node, ToolNode):
+        return []
+    return [
+        tool.metadata[METADATA_KEY_HANDOFF_DESTINATION]
+        for tool in tool_node.tools_by_name.values()
+        if tool.metadata and METADATA_KEY_HANDOFF_DESTINATION in tool.metadata
+    ]
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for count in AGENT_COUNTS:
+        agents = _make_agents(count)
+
+        start = time.perf_counter()
+        for agent in agents:
+            _get_destinations_from_graph(agent)
+        graph_discovery_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        create_swarm(agents, default_active_agent="agent_0")
+        cold_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        workflow = create_swarm(agents, default_active_agent="agent_0")
+        warm_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        workflow.compile()
+        compile_seconds = time.perf_counter() - start
+
+        eager_seconds, eager_memory = _time_cold_start(_make_agents, count)
+        lazy_seconds, lazy_memory = _time_cold_start(_make_lazy_agents, count)
+
+        yield {
+            "benchmark": "startup",
+            "params": {"agents": count},
+            "metrics": {
+                "graph_discovery_seconds": graph_discovery_seconds,
+                "create_swarm_cold_seconds": cold_seconds,
+                "create_swarm_warm_seconds": warm_seconds,
+                "compile_seconds": compile_seconds,
+                "eager_cold_start_seconds": eager_seconds,
+                "eager_cold_start_memory_bytes": eager_memory,
+                "lazy_cold_start_seconds": lazy_seconds,
+                "lazy_cold_start_memory_bytes": lazy_memory,
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
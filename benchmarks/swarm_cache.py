@@ -0,0 +1,63 @@
+"""Benchmark getting a compiled swarm with and without a `SwarmCache`.
+
+Cold builds and compiles the swarm on every request, warm gets it from the cache.
+
+Run with `python -m benchmarks.swarm_cache`.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks.startup import AGENT_COUNTS, _make_agents
+from langgraph_swarm import SwarmCache, create_swarm
+
+ITERATIONS = 20
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for count in AGENT_COUNTS:
+        agents = _make_agents(count)
+        checkpointer = InMemorySaver()
+
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            create_swarm(agents, default_active_agent="agent_0").compile(
+                checkpointer=checkpointer
+            )
+        cold_seconds = (time.perf_counter() - start) / ITERATIONS
+
+        cache = SwarmCache()
+        cache.get_or_compile(
+            agents, default_active_agent="agent_0", checkpointer=checkpointer
+        )
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            cache.get_or_compile(
+                agents, default_active_agent="agent_0", checkpointer=checkpointer
+            )
+        warm_seconds = (time.perf_counter() - start) / ITERATIONS
+
+        yield {
+            "benchmark": "swarm_cache",
+            "params": {"agents": count},
+            "metrics": {
+                "cold_seconds": cold_seconds,
+                "warm_seconds": warm_seconds,
+                "cached_memory_bytes": cache.info().memory_bytes,
+            },
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the number of handoffs per second.
+
+Alice and Bob hand off control back and forth a fixed number of times per turn
+before Alice replies, with and without a checkpointer.
+
+Run with `python -m benchmarks.throughput`.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import create_handoff_tool, create_swarm
+
+HANDOFFS_PER_TURN = 20
+TURNS = 20
+
+
+def _make_handoff(agent_name: str) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": f"transfer_to_{agent_name.lower()}", "args": {}, "id": "call_1"}
+        ],
+    )
+
+
+def _make_app(checkpointer: InMemorySaver | None) -> Any:
+    alice = create_agent(
+        ScriptedChatModel(
+            responses=[
+                *([_make_handoff("Bob")] * (HANDOFFS_PER_TURN // 2)),
+                AIMessage(content="Done."),
+            ]
+        ),
+        tools=[create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob = create_agent(
+        ScriptedChatModel(responses=[_make_handoff("Alice")]),
+        tools=[create_handoff_tool(agent_name="Alice")],
+        name="Bob",
+    )
+    workflow = create_swarm([alice, bob], default_active_agent="Alice")
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for checkpointer in (None, InMemorySaver()):
+        app = _make_app(checkpointer)
+        start = time.perf_counter()
+        for i in range(TURNS):
+            # every turn starts a new thread, so the history length stays the same
+            config = {"configurable": {"thread_id": str(i)}, "recursion_limit": 100}
+            app.invoke({"messages": [{"role": "user", "content": "hi"}]}, config)
+        seconds = time.perf_counter() - start
+
+        yield {
+            "benchmark": "throughput",
+            "params": {
+                "checkpointer": type(checkpointer).__name__ if checkpointer else None,
+                "handoffs_per_turn": HANDOFFS_PER_TURN,
+            },
+            "metrics": {"handoffs_per_second": HANDOFFS_PER_TURN * TURNS / seconds},
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
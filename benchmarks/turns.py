@@ -0,0 +1,123 @@
+"""Benchmark the cost of a turn as the conversation history grows.
+
+Each turn starts with Alice, who hands off to Bob, who replies. Reports the
+per-turn latency, the checkpoint bytes written per turn and the peak memory
+allocated during a turn, both with the default checkpointing and with ephemeral
+agents that only checkpoint the swarm's state at the end of each turn.
+
+Run with `python -m benchmarks.turns`.
+"""
+
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, AnyMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks._checkpoint import get_stored_bytes
+from benchmarks._models import ScriptedChatModel
+from langgraph_swarm import create_handoff_tool, create_swarm
+
+HISTORY_SIZES = (10, 100, 1_000)
+MODES = ("default", "ephemeral")
+TURNS = 20
+
+
+def _make_app(checkpointer: InMemorySaver, *, ephemeral_agents: bool = False) -> Any:
+    alice = create_agent(
+        ScriptedChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "transfer_to_bob", "args": {}, "id": "call_1"}
+                    ],
+                )
+            ]
+        ),
+        tools=[create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob = create_agent(
+        ScriptedChatModel(responses=[AIMessage(content="Hi, I'm Bob.")]),
+        tools=[],
+        name="Bob",
+    )
+    workflow = create_swarm(
+        [alice, bob], default_active_agent="Alice", ephemeral_agents=ephemeral_agents
+    )
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _make_history(size: int) -> list[AnyMessage]:
+    return [
+        (HumanMessage if i % 2 == 0 else AIMessage)(content=f"message {i}")
+        for i in range(size)
+    ]
+
+
+def _run_turn(app: Any, config: Any, durability: Any = None) -> None:
+    app.invoke(
+        {
+            "messages": [{"role": "user", "content": "i'd like to speak to Bob"}],
+            "active_agent": "Alice",
+        },
+        config,
+        durability=durability,
+    )
+
+
+def run() -> Iterator[dict[str, Any]]:
+    """Run the benchmark and yield the results."""
+    for mode in MODES:
+        for size in HISTORY_SIZES:
+            yield _run(mode, size)
+
+
+def _run(mode: str, size: int) -> dict[str, Any]:
+    ephemeral = mode == "ephemeral"
+    durability = "exit" if ephemeral else None
+    checkpointer = InMemorySaver()
+    app = _make_app(checkpointer, ephemeral_agents=ephemeral)
+    config = {"configurable": {"thread_id": "1"}}
+    app.invoke({"messages": _make_history(size)}, config)
+
+    stored_bytes = get_stored_bytes(checkpointer)
+    latencies = []
+    for _ in range(TURNS):
+        start = time.perf_counter()
+        _run_turn(app, config, durability)
+        latencies.append(time.perf_counter() - start)
+    checkpoint_bytes = (get_stored_bytes(checkpointer) - stored_bytes) / TURNS
+
+    # measured separately, as tracing allocations slows down the turn
+    tracemalloc.start()
+    _run_turn(app, config, durability)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": "turns",
+        "params": {"history_size": size, "mode": mode},
+        "metrics": {
+            "turn_seconds_mean": statistics.mean(latencies),
+            "turn_seconds_p50": statistics.median(latencies),
+            "checkpoint_bytes_per_turn": checkpoint_bytes,
+            "peak_memory_bytes": peak_bytes,
+        },
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON lines."""
+    for result in run():
+        print(json.dumps(result))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,61 @@
-from langgraph_swarm.handoff import create_handoff_tool
+from langgraph_swarm.batch import BatchResult, BatchStats, astream_batch
+from langgraph_swarm.cache import SwarmCache, SwarmCacheInfo
+from langgraph_swarm.cassette import Cassette, CassetteRecorder, ReplayChatModel
+from langgraph_swarm.context import (
+    ContextPolicy,
+    keep_last_messages,
+    keep_messages_since_last_active,
+    keep_messages_within_tokens,
+)
+from langgraph_swarm.deadline import TurnDeadline, get_remaining_time, with_deadline
+from langgraph_swarm.fallback import AgentFallbacks
+from langgraph_swarm.fanout import create_fanout_tool
+from langgraph_swarm.handoff import create_handoff_directory_tool, create_handoff_tool
+from langgraph_swarm.hedging import HedgedChatModel, HedgeInfo
+from langgraph_swarm.lazy import LazyAgent
+from langgraph_swarm.limits import HandoffLimit
+from langgraph_swarm.message_store import MessageStoreSerializer
+from langgraph_swarm.metrics import AgentMetrics, SwarmMetricsCallbackHandler
+from langgraph_swarm.pool import SwarmWorkerPool
+from langgraph_swarm.response_cache import ResponseCacheInfo, SwarmResponseCache
+from langgraph_swarm.router import PreRouter, create_keyword_router
 from langgraph_swarm.swarm import SwarmState, add_active_agent_router, create_swarm
+from langgraph_swarm.tracing import SwarmTraceCallbackHandler
 
 __all__ = [
+    "AgentFallbacks",
+    "AgentMetrics",
+    "BatchResult",
+    "BatchStats",
+    "Cassette",
+    "CassetteRecorder",
+    "ContextPolicy",
+    "HandoffLimit",
+    "HedgeInfo",
+    "HedgedChatModel",
+    "LazyAgent",
+    "MessageStoreSerializer",
+    "PreRouter",
+    "ReplayChatModel",
+    "ResponseCacheInfo",
+    "SwarmCache",
+    "SwarmCacheInfo",
+    "SwarmMetricsCallbackHandler",
+    "SwarmResponseCache",
     "SwarmState",
+    "SwarmTraceCallbackHandler",
+    "SwarmWorkerPool",
+    "TurnDeadline",
     "add_active_agent_router",
+    "astream_batch",
+    "create_fanout_tool",
+    "create_handoff_directory_tool",
     "create_handoff_tool",
+    "create_keyword_router",
     "create_swarm",
+    "get_remaining_time",
+    "keep_last_messages",
+    "keep_messages_since_last_active",
+    "keep_messages_within_tokens",
+    "with_deadline",
 ]
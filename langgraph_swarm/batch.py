@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.pregel import Pregel
+
+
+@dataclass
+class BatchResult:
+    """The result of running a single thread of a batch."""
+
+    thread_id: str
+    """ID of the thread."""
+
+    output: Any = None
+    """Output of the swarm, or `None` if the run failed."""
+
+    error: BaseException | None = None
+    """Error raised by the run, or `TimeoutError` if it timed out."""
+
+    seconds: float = 0.0
+    """Wall time of the run."""
+
+
+@dataclass
+class BatchStats:
+    """Aggregate statistics of a batch, updated as the results are produced."""
+
+    completed: int = 0
+    """Number of threads that ran successfully."""
+
+    failed: int = 0
+    """Number of threads that raised an error (excluding timeouts)."""
+
+    timed_out: int = 0
+    """Number of threads that timed out."""
+
+    seconds: float = 0.0
+    """Wall time of the batch so far."""
+
+    @property
+    def threads_per_second(self) -> float:
+        """Number of threads finished per second."""
+        finished = self.completed + self.failed + self.timed_out
+        return finished / self.seconds if self.seconds else 0.0
+
+
+def _get_thread_config(config: RunnableConfig | None, thread_id: str) -> RunnableConfig:
+    config = config or {}
+    return {
+        **config,
+        "configurable": {**config.get("configurable", {}), "thread_id": thread_id},
+    }
+
+
+async def astream_batch(  # noqa: C901, PLR0913
+    app: Pregel,
+    items: Iterable[tuple[str, Any]],
+    *,
+    max_concurrency: int = 16,
+    timeout: float | None = None,
+    config: RunnableConfig | None = None,
+    stats: BatchStats | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Run many independent threads through a compiled swarm, with bounded concurrency.
+
+    All threads share the compiled graph (and its checkpointer). At most
+    `max_concurrency` threads run at a time, and new threads are only taken from
+    `items` as running ones finish, so `items` can be a lazy iterable.
+    Results are yielded in completion order. A failing or timed-out thread
+    doesn't stop the batch: its error is reported in its result instead.
+
+    Args:
+        app: The compiled swarm, e.g. `create_swarm(...).compile(checkpointer=...)`.
+        items: `(thread_id, input)` pairs to run.
+        max_concurrency: Maximum number of threads to run concurrently.
+        timeout: Optional timeout for each thread, in seconds.
+        config: Optional config to run each thread with.
+            The `thread_id` is set for each thread.
+        stats: Optional `BatchStats` to update with aggregate statistics
+            (completed, failed and timed-out threads, and the throughput).
+
+    Example:
+        ```python
+        app = create_swarm([alice, bob], default_active_agent="Alice").compile(
+            checkpointer=InMemorySaver()
+        )
+        items = [
+            (f"thread-{i}", {"messages": [{"role": "user", "content": question}]})
+            for i, question in enumerate(questions)
+        ]
+        stats = BatchStats()
+        async for result in astream_batch(app, items, max_concurrency=32, stats=stats):
+            print(result.thread_id, result.error or result.output["messages"][-1])
+        print(stats.threads_per_second)
+        ```
+
+    """
+    if max_concurrency < 1:
+        msg = "max_concurrency must be a positive integer"
+        raise ValueError(msg)
+
+    stats = stats if stats is not None else BatchStats()
+    start = time.perf_counter()
+
+    async def run_thread(thread_id: str, input_: Any) -> BatchResult:
+        thread_start = time.perf_counter()
+        result = BatchResult(thread_id=thread_id)
+        try:
+            result.output = await asyncio.wait_for(
+                app.ainvoke(input_, _get_thread_config(config, thread_id)), timeout
+            )
+        # `asyncio.TimeoutError` is only an alias of `TimeoutError` since Python 3.11
+        except asyncio.TimeoutError as e:
+            result.error = e
+            stats.timed_out += 1
+        except Exception as e:  # noqa: BLE001
+            result.error = e
+            stats.failed += 1
+        else:
+            stats.completed += 1
+        result.seconds = time.perf_counter() - thread_start
+        stats.seconds = time.perf_counter() - start
+        return result
+
+    pending_items = iter(items)
+    running: set[asyncio.Task[BatchResult]] = set()
+    try:
+        while True:
+            for thread_id, input_ in pending_items:
+                running.add(asyncio.create_task(run_thread(thread_id, input_)))
+                if len(running) >= max_concurrency:
+                    break
+            if not running:
+                break
+
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # the consumer stopped early (or was cancelled): don't leave threads running
+        for task in running:
+            task.cancel()
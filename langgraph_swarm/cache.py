@@ -0,0 +1,243 @@
+import gc
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.pregel import Pregel
+
+from langgraph_swarm.lazy import LazyAgent
+from langgraph_swarm.swarm import create_swarm
+
+# Default maximum number of compiled swarms to keep in a cache.
+SWARM_CACHE_SIZE = 32
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+@dataclass(frozen=True)
+class SwarmCacheInfo:
+    """Statistics of a `SwarmCache`."""
+
+    hits: int
+    """Number of lookups that returned a cached swarm."""
+
+    misses: int
+    """Number of lookups that compiled a new swarm."""
+
+    evictions: int
+    """Number of swarms evicted from the cache."""
+
+    size: int
+    """Number of swarms in the cache."""
+
+    memory_bytes: int
+    """Estimated memory used by the swarms in the cache."""
+
+
+@dataclass
+class _CacheEntry:
+    app: CompiledStateGraph
+    memory_bytes: int
+    # keeps the objects the key refers to by id alive, so ids are not reused
+    referents: list[Any]
+
+
+def _freeze(value: Any, referents: list[Any]) -> Hashable:
+    """Turn a configuration value into a hashable key.
+
+    Containers are compared by value, and all other objects (agents, schemas,
+    checkpointers, policies, ...) by identity.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item, referents)) for key, item in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, referents) for item in value)
+    referents.append(value)
+    return ("id", id(value))
+
+
+def _estimate_memory(app: CompiledStateGraph, shared: Sequence[Any]) -> int:
+    """Estimate the memory used by a compiled swarm.
+
+    Sums the sizes of the objects reachable from the compiled graph, excluding the
+    objects it shares with the rest of the process: agents, checkpointers and other
+    objects it was compiled with, as well as modules, classes and functions.
+    """
+    seen = {id(obj) for obj in shared}
+    stack: list[Any] = [app]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+class SwarmCache:
+    """A cache of compiled swarms, with least-recently-used eviction.
+
+    Compiled swarms are keyed by the identity of the agents, the default active agent,
+    the state and context schemas, and the other `create_swarm` and `compile` options.
+    Options are compared by value if they are plain values or containers (e.g. agent
+    names, interrupt lists), and by identity otherwise (e.g. checkpointers, context
+    policies), so reuse the same objects across lookups to hit the cache.
+
+    Compiled swarms don't hold any per-thread state, so a cached swarm can be shared
+    by concurrent requests.
+
+    Example:
+        ```python
+        cache = SwarmCache(maxsize=64)
+
+        def handle_request(request):
+            app = cache.get_or_compile(
+                [alice, bob],
+                default_active_agent="Alice",
+                checkpointer=checkpointer,
+            )
+            return app.invoke(...)
+
+        print(cache.info())
+        ```
+
+    """
+
+    def __init__(
+        self, maxsize: int = SWARM_CACHE_SIZE, max_memory_bytes: int | None = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of compiled swarms to keep.
+            max_memory_bytes: Optional maximum estimated memory of the compiled swarms
+                to keep. The least recently used swarms are evicted to stay below it.
+
+        """
+        if maxsize < 1:
+            msg = "maxsize must be a positive integer"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._memory_bytes = 0
+
+    def get_or_compile(  # noqa: PLR0913
+        self,
+        agents: Sequence[Pregel | LazyAgent],
+        *,
+        default_active_agent: str,
+        checkpointer: Any = None,
+        store: Any = None,
+        interrupt_before: Any = None,
+        interrupt_after: Any = None,
+        debug: bool = False,
+        name: str | None = None,
+        **swarm_kwargs: Any,
+    ) -> CompiledStateGraph:
+        """Get a compiled swarm from the cache, or create and compile it.
+
+        Args:
+            agents: List of agents to add to the swarm. See `create_swarm`.
+            default_active_agent: Name of the agent to route to by default.
+            checkpointer: Checkpointer to compile the swarm with.
+            store: Store to compile the swarm with.
+            interrupt_before: Nodes to interrupt before.
+            interrupt_after: Nodes to interrupt after.
+            debug: Whether to compile the swarm in debug mode.
+            name: Name of the compiled swarm.
+            **swarm_kwargs: Other arguments to pass to `create_swarm`,
+                e.g. `state_schema` or `context_policies`.
+
+        Returns:
+            The compiled swarm.
+
+        """
+        compile_kwargs = {
+            "checkpointer": checkpointer,
+            "store": store,
+            "interrupt_before": interrupt_before,
+            "interrupt_after": interrupt_after,
+            "debug": debug,
+            "name": name,
+        }
+        referents: list[Any] = []
+        key = _freeze(
+            (
+                tuple(agents),
+                default_active_agent,
+                swarm_kwargs,
+                compile_kwargs,
+            ),
+            referents,
+        )
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.app
+            self._misses += 1
+
+        # compile outside of the lock, concurrent misses for the same key
+        # may compile the swarm twice, but only one of them is cached
+        app = create_swarm(
+            agents, default_active_agent=default_active_agent, **swarm_kwargs
+        ).compile(**compile_kwargs)
+        entry = _CacheEntry(
+            app=app,
+            memory_bytes=_estimate_memory(app, referents),
+            referents=referents,
+        )
+        with self._lock:
+            if (existing := self._entries.get(key)) is not None:
+                return existing.app
+            self._entries[key] = entry
+            self._memory_bytes += entry.memory_bytes
+            self._evict()
+        return app
+
+    def _evict(self) -> None:
+        """Evict the least recently used swarms until the cache is within its limits."""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.maxsize
+            or (
+                self.max_memory_bytes is not None
+                and self._memory_bytes > self.max_memory_bytes
+            )
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._memory_bytes -= entry.memory_bytes
+            self._evictions += 1
+
+    def info(self) -> SwarmCacheInfo:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return SwarmCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                memory_bytes=self._memory_bytes,
+            )
+
+    def clear(self) -> None:
+        """Remove all compiled swarms from the cache and reset its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._memory_bytes = 0
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Literal
+from uuid import UUID
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    BaseCallbackHandler,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult, LLMResult
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from langgraph_swarm.metrics import _get_agent_name
+
+CASSETTE_VERSION = 1
+
+
+@dataclass
+class Cassette:
+    """Model responses recorded from a swarm run, per agent and in call order."""
+
+    responses: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    """Recorded responses, keyed by agent name. Each response holds the serialized
+    message and the latency of the model call."""
+
+    def add(self, agent_name: str, message: BaseMessage, seconds: float) -> None:
+        """Add a model response to the cassette.
+
+        Args:
+            agent_name: Name of the agent that called the model.
+            message: The model's response.
+            seconds: Latency of the model call.
+
+        """
+        # ids and provider metadata are specific to the recorded run
+        message = message.model_copy(update={"id": None, "response_metadata": {}})
+        self.responses.setdefault(agent_name, []).append(
+            {"message": message_to_dict(message), "seconds": round(seconds, 6)}
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette to a JSON file.
+
+        Args:
+            path: Path of the file to write.
+
+        """
+        data = {"version": CASSETTE_VERSION, "responses": self.responses}
+        Path(path).write_text(json.dumps(data, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette from a JSON file written by `save`.
+
+        Args:
+            path: Path of the file to read.
+
+        """
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != CASSETTE_VERSION:
+            msg = f"Unsupported cassette version: {data.get('version')}"
+            raise ValueError(msg)
+        return cls(responses=data["responses"])
+
+
+class CassetteRecorder(BaseCallbackHandler):
+    """Callback handler that records the swarm agents' model responses into a cassette.
+
+    Record a run against real models, save the cassette, and replay it offline with
+    `ReplayChatModel`, for example to benchmark a swarm without network access.
+    Responses are recorded per agent in call order, so record one conversation at a
+    time.
+
+    Example:
+        ```python
+        recorder = CassetteRecorder()
+        app.invoke(
+            {"messages": [{"role": "user", "content": "book a flight to NYC"}]},
+            {"configurable": {"thread_id": "1"}, "callbacks": [recorder]},
+        )
+        recorder.cassette.save("customer_support.json")
+        ```
+
+    """
+
+    # recording a response is cheap, so it is run inline in async runs
+    run_inline = True
+
+    def __init__(self, cassette: Cassette | None = None) -> None:
+        """Initialize the recorder.
+
+        Args:
+            cassette: Optional cassette to add the responses to.
+                Defaults to a new, empty cassette.
+
+        """
+        self.cassette = cassette if cassette is not None else Cassette()
+        self._lock = Lock()
+        self._llm_runs: dict[UUID, tuple[str, float]] = {}
+
+    @override
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record the agent and the start time of a chat model call."""
+        if (agent_name := _get_agent_name(metadata)) is None:
+            return
+        with self._lock:
+            self._llm_runs[run_id] = (agent_name, time.perf_counter())
+
+    @override
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record the response of a chat model call."""
+        with self._lock:
+            if (llm_run := self._llm_runs.pop(run_id, None)) is None:
+                return
+            agent_name, start = llm_run
+            generation = response.generations[0][0]
+            if isinstance(generation, ChatGeneration):
+                self.cassette.add(
+                    agent_name, generation.message, time.perf_counter() - start
+                )
+
+    @override
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Discard a failed chat model call."""
+        with self._lock:
+            self._llm_runs.pop(run_id, None)
+
+
+class ReplayChatModel(BaseChatModel):
+    """Fake chat model that replays the responses recorded in a cassette.
+
+    Each agent gets its recorded responses in order, separately for each thread, so
+    the same cassette can be replayed in many concurrent threads. Once an agent's
+    responses are exhausted in a thread, they start over.
+
+    Example:
+        ```python
+        model = ReplayChatModel(
+            cassette=Cassette.load("customer_support.json"), latency=0.5
+        )
+        flight_assistant = create_agent(model, tools=[...], name="flight_assistant")
+        hotel_assistant = create_agent(model, tools=[...], name="hotel_assistant")
+        ```
+
+    """
+
+    cassette: Cassette
+    """The recorded responses."""
+
+    latency: float | Literal["recorded"] = 0.0
+    """Synthetic latency of each call, in seconds, or `"recorded"` to wait as long as
+    the recorded call took."""
+
+    _cursors: dict[tuple[str, str], int] = PrivateAttr(default_factory=dict)
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "cassette-replay"
+
+    def _next_response(
+        self,
+        run_manager: CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun | None,
+    ) -> tuple[BaseMessage, float]:
+        metadata = run_manager.metadata if run_manager is not None else {}
+        agent_name = _get_agent_name(metadata)
+        responses = self.cassette.responses.get(agent_name or "")
+        if not responses:
+            msg = f"No recorded responses for agent '{agent_name}'"
+            raise ValueError(msg)
+
+        key = (str(metadata.get("thread_id", "")), agent_name or "")
+        with self._lock:
+            index = self._cursors.pop(key, 0) % len(responses)
+            # the cursors of exhausted recordings are dropped, so that they start
+            # over and the cursors don't pile up across threads
+            if index + 1 < len(responses):
+                self._cursors[key] = index + 1
+        response = responses[index]
+        (message,) = messages_from_dict([response["message"]])
+        latency = response["seconds"] if self.latency == "recorded" else self.latency
+        return message, latency
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message, latency = self._next_response(run_manager)
+        if latency:
+            time.sleep(latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message, latency = self._next_response(run_manager)
+        if latency:
+            await asyncio.sleep(latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> "ReplayChatModel":
+        # the recorded responses already contain the tool calls
+        return self
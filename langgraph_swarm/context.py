@@ -0,0 +1,146 @@
+from collections.abc import Callable, Sequence
+from uuid import uuid4
+
+from langchain.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from langgraph_swarm.handoff import METADATA_KEY_HANDOFF_DESTINATION
+
+ContextPolicy = Callable[[Sequence[AnyMessage], str], list[AnyMessage]]
+"""A function that selects the messages an agent sees when it is activated.
+
+It is called with the swarm's message history and the name of the agent, and
+returns the list of messages to pass to the agent. The swarm's message history
+itself is not modified.
+"""
+
+
+def _get_valid_start(messages: Sequence[AnyMessage], start: int) -> int:
+    """Move the start of a window back to the tool call of its leading tool messages.
+
+    This keeps tool calls and tool results paired, as required by most providers.
+    """
+    while start > 0 and isinstance(messages[start], ToolMessage):
+        start -= 1
+    return start
+
+
+def _get_omitted_note(omitted: int) -> str:
+    return f"{omitted} earlier messages of the conversation are not shown."
+
+
+def _get_window(messages: Sequence[AnyMessage], start: int) -> list[AnyMessage]:
+    """Get the messages from `start`, making sure that they begin with a user turn.
+
+    If the window is cut before an AI or tool message, a note about the omitted
+    messages is prepended, since most providers expect the first message to be
+    from the user.
+    """
+    start = _get_valid_start(messages, start)
+    window = list(messages[start:])
+    if start > 0 and not isinstance(window[0], HumanMessage):
+        window.insert(
+            0, HumanMessage(content=_get_omitted_note(start), id=str(uuid4()))
+        )
+    return window
+
+
+def keep_last_messages(n: int) -> ContextPolicy:
+    """Create a context policy that keeps the last `n` messages.
+
+    If the window would start with a tool message, it is extended back to the
+    corresponding tool call. If it would not start with a user message, a note about
+    the omitted messages is prepended.
+
+    Args:
+        n: Maximum number of messages to keep.
+
+    """
+    if n < 1:
+        msg = "n must be a positive integer"
+        raise ValueError(msg)
+
+    def policy(messages: Sequence[AnyMessage], agent_name: str) -> list[AnyMessage]:  # noqa: ARG001
+        return _get_window(messages, max(len(messages) - n, 0))
+
+    return policy
+
+
+def keep_messages_within_tokens(
+    max_tokens: int,
+    *,
+    token_counter: Callable[[Sequence[AnyMessage]], int] = count_tokens_approximately,
+) -> ContextPolicy:
+    """Create a context policy that keeps the most recent messages within a token budget.
+
+    The last message is always kept, even if it exceeds the budget on its own.
+    If the window would start with a tool message, it is extended back to the
+    corresponding tool call. If it would not start with a user message, a note about
+    the omitted messages is prepended.
+
+    Args:
+        max_tokens: Maximum number of tokens to keep.
+        token_counter: Function that counts the tokens in a list of messages.
+            It is called on one message at a time.
+
+    """
+
+    def policy(messages: Sequence[AnyMessage], agent_name: str) -> list[AnyMessage]:  # noqa: ARG001
+        start = len(messages)
+        tokens = 0
+        while start > 0:
+            tokens += token_counter([messages[start - 1]])
+            if tokens > max_tokens and start < len(messages):
+                break
+            start -= 1
+
+        return _get_window(messages, start)
+
+    return policy
+
+
+def _summarize_handoffs(messages: Sequence[AnyMessage], omitted: int) -> AnyMessage:
+    """Create a message summarizing how control was handed off to the agent."""
+    path = [
+        message.response_metadata[METADATA_KEY_HANDOFF_DESTINATION]
+        for message in messages
+        if isinstance(message, ToolMessage)
+        and METADATA_KEY_HANDOFF_DESTINATION in message.response_metadata
+    ]
+    content = _get_omitted_note(omitted)
+    if path:
+        content += f" Handoffs since you were last active: {' -> '.join(path)}."
+    return HumanMessage(content=content, id=str(uuid4()))
+
+
+def keep_messages_since_last_active(*, summarize: bool = True) -> ContextPolicy:
+    """Create a context policy that keeps the messages since the agent was last active.
+
+    The window starts at the agent's last response, so it only walks back as far
+    as the agent's previous activation. If the agent has not been active yet, the
+    full message history is kept.
+
+    Args:
+        summarize: Whether to prepend a short summary message noting how many messages
+            were omitted and which handoffs happened since the agent was last active.
+
+    """
+
+    def policy(messages: Sequence[AnyMessage], agent_name: str) -> list[AnyMessage]:
+        start = len(messages)
+        while start > 0:
+            message = messages[start - 1]
+            if isinstance(message, AIMessage) and message.name == agent_name:
+                start -= 1
+                break
+            start -= 1
+
+        if start == 0:
+            return list(messages)
+
+        window = list(messages[start:])
+        if summarize:
+            window.insert(0, _summarize_handoffs(window, start))
+        return window
+
+    return policy
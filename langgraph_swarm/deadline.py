@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from langchain.messages import AIMessage, AnyMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_config
+from langgraph.graph import END
+from langgraph.types import Command
+
+# Config key of the deadline of the current turn (a `time.time()` timestamp).
+DEADLINE_CONFIG_KEY = "swarm_deadline"
+
+T = TypeVar("T")
+
+
+@dataclass
+class TurnDeadline:
+    """How the swarm enforces the deadline of a turn.
+
+    The deadline itself is set when invoking the swarm, with `with_deadline`, and
+    applies to the whole turn, across handoffs. An agent is not started if less than
+    `min_remaining_seconds` are left. Instead, the turn ends with the best partial
+    answer: the last text response of the turn (e.g. sent along with a handoff) is
+    left as the answer, or `message` is added if there is none.
+    In async runs, an agent that is still running when the deadline passes is
+    cancelled, and the turn ends the same way.
+
+    Example:
+        ```python
+        workflow = create_swarm(
+            [alice, bob],
+            default_active_agent="Alice",
+            turn_deadline=TurnDeadline(min_remaining_seconds=2),
+        )
+        app = workflow.compile(checkpointer=checkpointer)
+        app.invoke(
+            {"messages": [{"role": "user", "content": "hi"}]},
+            with_deadline(10, {"configurable": {"thread_id": "1"}}),
+        )
+        ```
+
+    """
+
+    min_remaining_seconds: float = 0.0
+    """Minimum remaining time to start an agent (e.g. after a handoff)."""
+
+    message: str = "Sorry, I ran out of time to answer your request."
+    """Response when the deadline is reached before any agent replied."""
+
+
+def with_deadline(
+    seconds: float, config: RunnableConfig | None = None
+) -> RunnableConfig:
+    """Set the deadline of a turn, `seconds` from now.
+
+    Args:
+        seconds: Time budget of the turn, in seconds.
+        config: Optional config to add the deadline to.
+
+    Returns:
+        A copy of the config with the deadline set.
+
+    """
+    config = config or {}
+    return {
+        **config,
+        "configurable": {
+            **config.get("configurable", {}),
+            DEADLINE_CONFIG_KEY: time.time() + seconds,
+        },
+    }
+
+
+def get_remaining_time(config: RunnableConfig | None = None) -> float | None:
+    """Get the time left before the deadline of the current turn.
+
+    Use it in tools or models to bound their own work (e.g. request timeouts)
+    by the remaining budget of the turn.
+
+    Args:
+        config: Optional config of the current run. Defaults to the config of the
+            runnable (e.g. tool or node) this is called from.
+
+    Returns:
+        The remaining time in seconds (negative if the deadline has passed),
+        or `None` if the turn has no deadline.
+
+    """
+    if config is None:
+        try:
+            config = get_config()
+        except RuntimeError:
+            return None
+    deadline = config.get("configurable", {}).get(DEADLINE_CONFIG_KEY)
+    if deadline is None:
+        return None
+    return float(deadline) - time.time()
+
+
+class _DeadlineExceededError(Exception):
+    """The deadline of the turn passed while an agent was running."""
+
+
+async def _wait_until_deadline(awaitable: Awaitable[T], timeout: float | None) -> T:
+    """Wait for an agent run, cancelling it once the deadline passes.
+
+    Unlike `asyncio.wait_for`, the deadline is reported as a `_DeadlineExceededError`,
+    so that it can't be confused with a `TimeoutError` raised by the run itself.
+    """
+    if timeout is None:
+        return await awaitable
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    finally:
+        # also cancel the run if the caller is cancelled
+        task.cancel()
+    if not done:
+        # let the run clean up before ending the turn
+        await asyncio.wait({task})
+        raise _DeadlineExceededError
+    return task.result()
+
+
+def _end_turn_at_deadline(
+    messages: Sequence[AnyMessage], deadline: TurnDeadline
+) -> Command:
+    """End the turn with the best partial answer, once the deadline is reached."""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, AIMessage) and message.text:
+            # the partial answer is already in the history
+            return Command(goto=END)
+    return Command(goto=END, update={"messages": [AIMessage(content=deadline.message)]})
@@ -0,0 +1,17 @@
+from langchain_core.runnables import RunnableConfig
+from langgraph.constants import CONFIG_KEY_CHECKPOINTER
+
+
+def _get_ephemeral_config(config: RunnableConfig) -> RunnableConfig:
+    """Get the config to run an agent subgraph without checkpoints.
+
+    Subgraphs inherit the checkpointer of the parent graph through the config,
+    so unsetting it makes the subgraph run as if it had no checkpointer.
+    """
+    return {
+        **config,
+        "configurable": {
+            **config.get("configurable", {}),
+            CONFIG_KEY_CHECKPOINTER: None,
+        },
+    }
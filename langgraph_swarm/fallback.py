@@ -0,0 +1,82 @@
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+
+from langgraph.types import Command
+
+
+@dataclass
+class AgentFallbacks:
+    """Agents to route to when an agent fails.
+
+    When an agent raises one of `errors` (e.g. its model provider is down), the swarm
+    routes to its fallback agent, which becomes the active agent and handles the
+    same messages, instead of failing the turn.
+
+    Example:
+        ```python
+        fallbacks = AgentFallbacks({"flight_assistant": "support"})
+        workflow = create_swarm(
+            [flight_assistant, support],
+            default_active_agent="flight_assistant",
+            agent_fallbacks=fallbacks,
+        )
+        ...
+        print(fallbacks.counters)  # {"flight_assistant": 1}
+        ```
+
+    """
+
+    fallbacks: dict[str, str]
+    """Name of the fallback agent of each agent."""
+
+    errors: tuple[type[Exception], ...] = (Exception,)
+    """Errors to fall back on. Other errors fail the turn."""
+
+    _counters: Counter[str] = field(default_factory=Counter, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Number of times each agent fell back to its fallback agent."""
+        with self._lock:
+            return dict(self._counters)
+
+    def _record(self, agent_name: str) -> None:
+        with self._lock:
+            self._counters[agent_name] += 1
+
+
+def _validate_agent_fallbacks(
+    fallbacks: AgentFallbacks, agent_names: Sequence[str]
+) -> None:
+    """Check that the fallback agents exist and don't fall back in a cycle."""
+    for agent_name, fallback_agent in fallbacks.fallbacks.items():
+        for name in (agent_name, fallback_agent):
+            if name not in agent_names:
+                msg = f"Agent fallbacks reference unknown agent '{name}'"
+                raise ValueError(msg)
+
+        seen = {agent_name}
+        next_agent: str | None = fallback_agent
+        while next_agent is not None:
+            if next_agent in seen:
+                msg = f"Agent fallbacks of '{agent_name}' contain a cycle"
+                raise ValueError(msg)
+            seen.add(next_agent)
+            next_agent = fallbacks.fallbacks.get(next_agent)
+
+
+def _apply_agent_fallback(
+    fallbacks: AgentFallbacks, agent_name: str, error: Exception
+) -> Command | None:
+    """Get the `Command` that routes to the fallback agent of a failed agent.
+
+    Returns `None` if the error should fail the turn instead.
+    """
+    fallback_agent = fallbacks.fallbacks.get(agent_name)
+    if fallback_agent is None or not isinstance(error, fallbacks.errors):
+        return None
+    fallbacks._record(agent_name)  # noqa: SLF001
+    return Command(goto=fallback_agent, update={"active_agent": fallback_agent})
@@ -0,0 +1,312 @@
+import operator
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal, cast
+
+from langchain.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain.tools import BaseTool, InjectedToolCallId
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.tools import StructuredTool
+from langgraph.errors import ParentCommand
+from langgraph.prebuilt import InjectedState
+from langgraph.pregel import Pregel
+from langgraph.types import Command, Overwrite, Send
+from pydantic import BaseModel, Field, create_model
+from typing_extensions import NotRequired, TypedDict
+
+from langgraph_swarm.ephemeral import _get_ephemeral_config
+from langgraph_swarm.handoff import (
+    _get_agent_tools,
+    _get_field,
+    _get_handoff_delta,
+    _HandoffToolArgs,
+)
+from langgraph_swarm.lazy import LazyAgent
+
+METADATA_KEY_FANOUT_DESTINATIONS = "__fanout_destinations"
+FANOUT_NODE = "__swarm_fanout__"
+FANOUT_JOIN_NODE = "__swarm_fanout_join__"
+FANOUT_RESULTS_KEY = "swarm_fanout_results"
+
+
+class FanoutTask(TypedDict):
+    """A task dispatched to an agent by a fan-out tool."""
+
+    agent: str
+    task: str
+    caller: str
+    tool_call_id: str
+    tool_name: str
+    messages: NotRequired[list[AnyMessage]]
+    """Messages to add to the swarm's message history before the results are merged.
+
+    Only set on the first task of a tool call."""
+
+
+class FanoutResult(TypedDict):
+    """The result of a task dispatched to an agent by a fan-out tool."""
+
+    agent: str
+    caller: str
+    tool_call_id: str
+    tool_name: str
+    result: str
+
+
+class FanoutState(TypedDict):
+    """State of the fan-out results, merged by appending the results of each task."""
+
+    swarm_fanout_results: Annotated[list[FanoutResult], operator.add]
+
+
+def _get_caller_agent(config: RunnableConfig) -> str:
+    """Get the name of the swarm agent (node) that is calling a tool."""
+    checkpoint_ns = config.get("configurable", {}).get("checkpoint_ns", "")
+    # the namespace looks like "...|<agent_name>:<task_id>|<tool_node_name>:<task_id>",
+    # possibly with numeric segments that don't correspond to a graph level
+    parts = [part for part in checkpoint_ns.split("|") if not part.isdigit()]
+    if len(parts) < 2:  # noqa: PLR2004
+        msg = "Fan-out tools can only be used by agents inside a swarm"
+        raise ValueError(msg)
+    return cast("str", parts[-2].split(":")[0])
+
+
+def create_fanout_tool(
+    *,
+    agent_names: list[str],
+    name: str = "delegate_to_agents",
+    description: str | None = None,
+    transfer_messages: Literal["delta", "full"] = "delta",
+) -> BaseTool:
+    """Create a tool that dispatches tasks to several agents in parallel.
+
+    Each agent receives only its task (not the conversation history), and the agents
+    run concurrently. Once all of them are done, their final responses are merged
+    into a single tool message, and control returns to the calling agent.
+
+    Agents that run as part of a fan-out are expected to respond directly:
+    if they try to hand off control, the handoff is reported as their result instead.
+
+    Args:
+        agent_names: The names of the agents that tasks can be dispatched to, i.e.
+            the names of the agent nodes in the multi-agent graph.
+        name: Optional name of the tool.
+        description: Optional description for the tool.
+
+            If not provided, the tool description will list the available agents.
+        transfer_messages: Which messages to send to the parent graph before
+            dispatching the tasks. See `create_handoff_tool` for details.
+
+    """
+    if not agent_names:
+        msg = "agent_names list cannot be empty"
+        raise ValueError(msg)
+
+    if description is None:
+        description = (
+            "Ask several agents for help in parallel, with a separate, self-contained "
+            f"task for each of them. Available agents: {', '.join(agent_names)}"
+        )
+
+    task_schema = create_model(
+        f"{name}_task",
+        agent=(
+            cast("type", Literal.__getitem__(tuple(agent_names))),
+            Field(description="Name of the agent to dispatch the task to."),
+        ),
+        task=(
+            str,
+            Field(description="Self-contained description of the task for the agent."),
+        ),
+    )
+    args_schema = create_model(
+        name,
+        __base__=_HandoffToolArgs,
+        tasks=(list[task_schema], Field(min_length=1)),  # type: ignore[valid-type]
+    )
+
+    def fanout_to_agents(
+        tasks: list[BaseModel],
+        state: Annotated[Any, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+        config: RunnableConfig,
+    ) -> Command:
+        caller = _get_caller_agent(config)
+        messages = _get_field(state, "messages")
+        if transfer_messages == "delta":
+            messages = _get_handoff_delta(messages)
+
+        fanout_tasks = [
+            FanoutTask(
+                agent=_get_field(task, "agent"),
+                task=_get_field(task, "task"),
+                caller=caller,
+                tool_call_id=tool_call_id,
+                tool_name=name,
+            )
+            for task in tasks
+        ]
+        # ToolNode drops the state updates of parent commands that only contain
+        # `Send`s, so the messages are passed along with the first task instead
+        fanout_tasks[0]["messages"] = messages
+        return Command(
+            goto=[Send(FANOUT_NODE, task) for task in fanout_tasks],
+            graph=Command.PARENT,
+        )
+
+    async def afanout_to_agents(
+        tasks: list[BaseModel],
+        state: Annotated[Any, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+        config: RunnableConfig,
+    ) -> Command:
+        return fanout_to_agents(tasks, state, tool_call_id, config)
+
+    return StructuredTool.from_function(
+        func=fanout_to_agents,
+        coroutine=afanout_to_agents,
+        name=name,
+        description=description,
+        args_schema=args_schema,
+        metadata={METADATA_KEY_FANOUT_DESTINATIONS: list(agent_names)},
+    )
+
+
+def has_fanout_tools(agent: Pregel, tool_node_name: str = "tools") -> bool:
+    """Check if the agent has fan-out tools."""
+    return any(
+        tool.metadata is not None and METADATA_KEY_FANOUT_DESTINATIONS in tool.metadata
+        for tool in _get_agent_tools(agent, tool_node_name)
+    )
+
+
+def _check_fanout_tools(agent: Pregel, tool_node_name: str = "tools") -> None:
+    """Check that the agent only has fan-out tools in its own tool node.
+
+    Fan-out tools send their tasks to the graph that runs the agent, so the ones in
+    the tool nodes of nested graphs would dispatch them to the wrong graph.
+    """
+    for namespace, subgraph in agent.get_subgraphs(recurse=True):
+        if isinstance(subgraph, Pregel) and has_fanout_tools(subgraph, tool_node_name):
+            msg = (
+                f"Agent '{agent.name}' has fan-out tools in its nested graph "
+                f"'{namespace}'. Fan-out tools must be in the agent's own "
+                f"'{tool_node_name}' node"
+            )
+            raise ValueError(msg)
+
+
+def _get_fanout_destinations(agent: Pregel, tool_node_name: str = "tools") -> list[str]:
+    """Get the agents the agent's fan-out tools can delegate tasks to."""
+    return list(
+        dict.fromkeys(
+            destination
+            for tool in _get_agent_tools(agent, tool_node_name)
+            if tool.metadata is not None
+            for destination in tool.metadata.get(METADATA_KEY_FANOUT_DESTINATIONS, ())
+        )
+    )
+
+
+def _get_result_text(agent_name: str, output: Any) -> str:
+    """Get the final response of an agent."""
+    messages = output.get("messages", []) if isinstance(output, dict) else []
+    for message in reversed(messages):
+        if isinstance(message, AIMessage):
+            return message.text
+    return f"Agent '{agent_name}' did not respond"
+
+
+def _create_fanout_node(  # noqa: C901
+    agents: Sequence[Pregel | LazyAgent],
+    callers: Sequence[str],
+    *,
+    ephemeral: bool = False,
+) -> RunnableLambda:
+    """Create the node that runs a single task dispatched by a fan-out tool.
+
+    If `ephemeral` is set, the agents run without checkpoints.
+    """
+    agents_by_name = {agent.name: agent for agent in agents}
+
+    def _prepare_input(task: FanoutTask) -> tuple[Pregel | LazyAgent, dict[str, Any]]:
+        if task["caller"] not in callers:
+            msg = (
+                f"Fan-out task dispatched by '{task['caller']}', which is not an "
+                f"agent with fan-out tools in the swarm: {list(callers)}"
+            )
+            raise ValueError(msg)
+        return agents_by_name[task["agent"]], {
+            "messages": [HumanMessage(content=task["task"])]
+        }
+
+    def _prepare_output(task: FanoutTask, result: str) -> dict[str, Any]:
+        output: dict[str, Any] = {
+            FANOUT_RESULTS_KEY: [
+                FanoutResult(
+                    agent=task["agent"],
+                    caller=task["caller"],
+                    tool_call_id=task["tool_call_id"],
+                    tool_name=task["tool_name"],
+                    result=result,
+                )
+            ]
+        }
+        if "messages" in task:
+            output["messages"] = task["messages"]
+        return output
+
+    def _get_handoff_result(task: FanoutTask) -> str:
+        return (
+            f"Agent '{task['agent']}' tried to hand off control instead of responding"
+        )
+
+    def run_task(task: FanoutTask, config: RunnableConfig) -> dict[str, Any]:
+        agent, agent_input = _prepare_input(task)
+        if ephemeral:
+            config = _get_ephemeral_config(config)
+        try:
+            result = _get_result_text(agent.name, agent.invoke(agent_input, config))
+        except ParentCommand:
+            result = _get_handoff_result(task)
+        return _prepare_output(task, result)
+
+    async def arun_task(task: FanoutTask, config: RunnableConfig) -> dict[str, Any]:
+        agent, agent_input = _prepare_input(task)
+        if ephemeral:
+            config = _get_ephemeral_config(config)
+        try:
+            output = await agent.ainvoke(agent_input, config)
+            result = _get_result_text(agent.name, output)
+        except ParentCommand:
+            result = _get_handoff_result(task)
+        return _prepare_output(task, result)
+
+    return RunnableLambda(run_task, afunc=arun_task, name=FANOUT_NODE)
+
+
+def _join_fanout_results(state: FanoutState) -> Command:
+    """Merge the results of the dispatched tasks and return control to the caller."""
+    results_by_tool_call: dict[str, list[FanoutResult]] = {}
+    for result in state["swarm_fanout_results"]:
+        results_by_tool_call.setdefault(result["tool_call_id"], []).append(result)
+
+    tool_messages = [
+        ToolMessage(
+            content="\n\n".join(
+                f"Result from {result['agent']}:\n{result['result']}"
+                for result in results
+            ),
+            name=results[0]["tool_name"],
+            tool_call_id=tool_call_id,
+        )
+        for tool_call_id, results in results_by_tool_call.items()
+    ]
+    caller = state["swarm_fanout_results"][0]["caller"]
+    return Command(
+        goto=caller,
+        update={
+            "messages": tool_messages,
+            "active_agent": caller,
+            FANOUT_RESULTS_KEY: Overwrite([]),
+        },
+    )
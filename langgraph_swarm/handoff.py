@@ -1,13 +1,25 @@
 import re
+from collections.abc import Sequence
 from dataclasses import is_dataclass
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal, cast
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
-from langchain.messages import ToolMessage
-from langchain.tools import BaseTool, InjectedToolCallId, tool
+from langchain.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
+from langchain.tools import BaseTool, InjectedToolCallId
+from langchain_core.messages import BaseMessage
+from langchain_core.tools import StructuredTool
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import InjectedState, ToolNode
+from langgraph.pregel import Pregel
 from langgraph.types import Command
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, create_model
 
 
 def _get_field(obj: Any, key: str) -> Any:
@@ -33,6 +45,8 @@ def _get_field(obj: Any, key: str) -> Any:
 
 WHITESPACE_RE = re.compile(r"\s+")
 METADATA_KEY_HANDOFF_DESTINATION = "__handoff_destination"
+METADATA_KEY_HANDOFF_BRIEF = "__handoff_brief"
+METADATA_KEY_HIDE_HISTORY = "__handoff_hide_history"
 
 
 def _normalize_agent_name(agent_name: str) -> str:
@@ -40,11 +54,193 @@ def _normalize_agent_name(agent_name: str) -> str:
     return WHITESPACE_RE.sub("_", agent_name.strip()).lower()
 
 
-def create_handoff_tool(
+class _HandoffToolArgs(BaseModel):
+    """Arguments of the handoff tool (all of them are injected)."""
+
+    # Excluded from serialization so that validating the tool input does not
+    # dump the full message history on every handoff.
+    state: Annotated[Any, InjectedState] = Field(exclude=True)
+    tool_call_id: Annotated[str, InjectedToolCallId]
+
+
+def _is_handoff_message(message: AnyMessage) -> bool:
+    """Check if a message is a tool message produced by a handoff tool."""
+    return (
+        isinstance(message, ToolMessage)
+        and METADATA_KEY_HANDOFF_DESTINATION in message.response_metadata
+    )
+
+
+def _get_handoff_delta(messages: Sequence[AnyMessage]) -> list[AnyMessage]:
+    """Get the messages the active agent produced since it was activated.
+
+    An agent is activated either at the start of a turn (after a human message)
+    or by a handoff (after a handoff tool message). Everything before that point
+    is already in the parent graph's message history, so we only walk back as far
+    as the last activation boundary.
+    """
+    start = len(messages)
+    while start > 0:
+        message = messages[start - 1]
+        if isinstance(message, HumanMessage) or _is_handoff_message(message):
+            break
+        start -= 1
+    return list(messages[start:])
+
+
+def _get_trailing_handoffs(
+    messages: Sequence[AnyMessage],
+) -> list[tuple[AIMessage, ToolMessage]]:
+    """Get the consecutive handoff (tool call, tool message) pairs at the end of the history."""
+    handoffs: list[tuple[AIMessage, ToolMessage]] = []
+    end = len(messages)
+    while end >= 2:  # noqa: PLR2004
+        ai_message, tool_message = messages[end - 2], messages[end - 1]
+        if not (
+            isinstance(tool_message, ToolMessage)
+            and _is_handoff_message(tool_message)
+            and isinstance(ai_message, AIMessage)
+            and len(ai_message.tool_calls) == 1
+            and ai_message.tool_calls[0]["id"] == tool_message.tool_call_id
+        ):
+            break
+        handoffs.append((ai_message, tool_message))
+        end -= 2
+    handoffs.reverse()
+    return handoffs
+
+
+def _collapse_handoffs(
+    messages: Sequence[AnyMessage], mode: Literal["compact", "drop"]
+) -> list[BaseMessage]:
+    """Collapse the handoffs at the end of the history.
+
+    Returns the message updates that replace the trailing handoff pairs with a single
+    marker message (`"compact"`) or remove them (`"drop"`). Any text content of the
+    handoff tool calls is kept, and tool calls always stay paired with their results.
+    """
+    handoffs = _get_trailing_handoffs(messages)
+    if not handoffs:
+        return []
+
+    updates: list[BaseMessage] = []
+    if mode == "compact":
+        texts = [ai_message.text for ai_message, _ in handoffs if ai_message.text]
+        path = [
+            handoffs[0][0].name or "",
+            *(
+                tool_message.response_metadata[METADATA_KEY_HANDOFF_DESTINATION]
+                for _, tool_message in handoffs
+            ),
+        ]
+        marker = f"[Handoff: {' -> '.join(name for name in path if name)}]"
+        first_ai_message = handoffs[0][0]
+        updates.append(
+            AIMessage(
+                content="\n\n".join([*texts, marker]),
+                name=first_ai_message.name,
+                id=first_ai_message.id,
+            )
+        )
+        removed = [
+            message
+            for ai_message, tool_message in handoffs
+            for message in (ai_message, tool_message)
+            if message is not first_ai_message
+        ]
+    else:
+        removed = []
+        for ai_message, tool_message in handoffs:
+            if ai_message.text:
+                updates.append(
+                    AIMessage(
+                        content=ai_message.content,
+                        name=ai_message.name,
+                        id=ai_message.id,
+                    )
+                )
+            else:
+                removed.append(ai_message)
+            removed.append(tool_message)
+
+    updates.extend(RemoveMessage(id=cast("str", message.id)) for message in removed)
+    return updates
+
+
+def _format_brief(brief: dict[str, Any]) -> str:
+    """Format the payload of a handoff as a compact brief."""
+    return "\n".join(
+        f"{key}: {value}" for key, value in brief.items() if value is not None
+    )
+
+
+def _get_handoff_brief_message(
+    messages: Sequence[AnyMessage], agent_name: str
+) -> HumanMessage | None:
+    """Get the brief an agent should see instead of the history, if any.
+
+    That is the case if the agent was just activated by a handoff that hides the
+    message history from it.
+    """
+    if not messages or not _is_handoff_message(messages[-1]):
+        return None
+    metadata = messages[-1].response_metadata
+    if metadata[METADATA_KEY_HANDOFF_DESTINATION] != agent_name or not metadata.get(
+        METADATA_KEY_HIDE_HISTORY
+    ):
+        return None
+    return HumanMessage(
+        content=_format_brief(metadata[METADATA_KEY_HANDOFF_BRIEF]),
+        id=str(uuid4()),
+    )
+
+
+def _create_handoff_command(  # noqa: PLR0913
+    agent_name: str,
+    *,
+    state: Any,
+    tool_call_id: str,
+    tool_name: str,
+    transfer_messages: Literal["delta", "full"],
+    brief: dict[str, Any] | None = None,
+    hide_history: bool = False,
+) -> Command:
+    """Create the `Command` that hands off control to the requested agent."""
+    content = f"Successfully transferred to {agent_name}"
+    response_metadata: dict[str, Any] = {METADATA_KEY_HANDOFF_DESTINATION: agent_name}
+    if brief is not None:
+        content += f" with the following brief:\n{_format_brief(brief)}"
+        response_metadata[METADATA_KEY_HANDOFF_BRIEF] = brief
+    if hide_history:
+        response_metadata[METADATA_KEY_HIDE_HISTORY] = True
+
+    tool_message = ToolMessage(
+        content=content,
+        name=tool_name,
+        tool_call_id=tool_call_id,
+        response_metadata=response_metadata,
+    )
+    messages = _get_field(state, "messages")
+    if transfer_messages == "delta":
+        messages = _get_handoff_delta(messages)
+    return Command(
+        goto=agent_name,
+        graph=Command.PARENT,
+        update={
+            "messages": [*messages, tool_message],
+            "active_agent": agent_name,
+        },
+    )
+
+
+def create_handoff_tool(  # noqa: PLR0913
     *,
     agent_name: str,
     name: str | None = None,
     description: str | None = None,
+    transfer_messages: Literal["delta", "full"] = "delta",
+    args_schema: type[BaseModel] | None = None,
+    hide_history: bool = False,
 ) -> BaseTool:
     """Create a tool that can handoff control to the requested agent.
 
@@ -62,56 +258,239 @@ def create_handoff_tool(
         description: Optional description for the handoff tool.
 
             If not provided, the tool description will be `Ask agent <agent_name> for help`.
+        transfer_messages: Which messages to send to the parent graph on handoff.
+
+            - `"delta"` (default): only the messages the calling agent produced
+                since it was activated (including the tool call that triggered the
+                handoff), plus the handoff tool message. This keeps the cost of a
+                handoff independent of the conversation length, and is correct
+                whenever the agent's `messages` are the swarm's `messages`.
+            - `"full"`: the full message history of the calling agent, plus the
+                handoff tool message. Use this if the agent's `messages` are not
+                populated directly from the swarm's `messages` channel.
+        args_schema: Optional Pydantic model of the arguments the model fills in when
+            handing off, e.g. a `task` and its `context`.
+
+            The arguments are delivered to the agent as a compact brief in the
+            handoff tool message.
+        hide_history: Whether to hide the message history from the agent when it
+            is activated by this tool, and show it only the brief instead.
+            Requires an `args_schema`.
+
+            The agent's new messages are still added to the swarm's message history.
+
+    Example:
+        ```python
+        class Brief(BaseModel):
+            task: str = Field(description="What Bob should do.")
+            context: str = Field(description="What Bob needs to know to do it.")
+
+        transfer_to_bob = create_handoff_tool(
+            agent_name="Bob", args_schema=Brief, hide_history=True
+        )
+        ```
 
     """
+    if hide_history and args_schema is None:
+        msg = "hide_history requires an args_schema for the brief"
+        raise ValueError(msg)
+
     if name is None:
         name = f"transfer_to_{_normalize_agent_name(agent_name)}"
 
     if description is None:
         description = f"Ask agent '{agent_name}' for help"
 
-    @tool(name, description=description)
+    tool_name = name
+    tool_args_schema: type[BaseModel] = _HandoffToolArgs
+    if args_schema is not None:
+        tool_args_schema = create_model(name, __base__=(args_schema, _HandoffToolArgs))
+
     def handoff_to_agent(
         # Annotation is typed as Any instead of StateLike. StateLike
         # trigger validation issues from Pydantic / langchain_core interaction.
         # https://github.com/langchain-ai/langchain/issues/32067
         state: Annotated[Any, InjectedState],
         tool_call_id: Annotated[str, InjectedToolCallId],
+        **brief: Any,
     ) -> Command:
-        tool_message = ToolMessage(
-            content=f"Successfully transferred to {agent_name}",
-            name=name,
+        return _create_handoff_command(
+            agent_name,
+            state=state,
             tool_call_id=tool_call_id,
+            tool_name=tool_name,
+            transfer_messages=transfer_messages,
+            brief=brief if args_schema is not None else None,
+            hide_history=hide_history,
         )
-        return Command(
-            goto=agent_name,
-            graph=Command.PARENT,
-            update={
-                "messages": [*_get_field(state, "messages"), tool_message],
-                "active_agent": agent_name,
-            },
+
+    # the coroutine only builds a `Command` as well, but avoids running
+    # the tool in a thread pool executor when the swarm is invoked asynchronously
+    async def ahandoff_to_agent(
+        state: Annotated[Any, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+        **brief: Any,
+    ) -> Command:
+        return handoff_to_agent(state, tool_call_id, **brief)
+
+    metadata: dict[str, Any] = {METADATA_KEY_HANDOFF_DESTINATION: agent_name}
+    if hide_history:
+        metadata[METADATA_KEY_HIDE_HISTORY] = True
+    return StructuredTool.from_function(
+        func=handoff_to_agent,
+        coroutine=ahandoff_to_agent,
+        name=name,
+        description=description,
+        args_schema=tool_args_schema,
+        metadata=metadata,
+    )
+
+
+def create_handoff_directory_tool(
+    *,
+    agent_names: list[str],
+    name: str = "transfer_to_agent",
+    description: str | None = None,
+    agent_descriptions: dict[str, str] | None = None,
+    transfer_messages: Literal["delta", "full"] = "delta",
+) -> BaseTool:
+    """Create a single tool that can handoff control to any of the requested agents.
+
+    Unlike creating one tool per agent with `create_handoff_tool`, this sends a single
+    tool schema to the model, with the destination passed as an `agent` argument
+    (an enum of the agent names). This keeps the prompt small for agents that can
+    hand off to many peers.
+
+    Args:
+        agent_names: The names of the agents to handoff control to, i.e.
+            the names of the agent nodes in the multi-agent graph.
+        name: Optional name of the tool to use for the handoff.
+        description: Optional description for the handoff tool.
+
+            If not provided, the tool description will list the available agents.
+        agent_descriptions: Optional descriptions of the agents, keyed by agent name.
+
+            If provided, they are included in the default tool description.
+        transfer_messages: Which messages to send to the parent graph on handoff.
+            See `create_handoff_tool` for details.
+
+    """
+    if not agent_names:
+        msg = "agent_names list cannot be empty"
+        raise ValueError(msg)
+
+    if description is None:
+        agent_descriptions = agent_descriptions or {}
+        lines = [
+            f"- {agent_name}: {agent_descriptions[agent_name]}"
+            if agent_name in agent_descriptions
+            else f"- {agent_name}"
+            for agent_name in agent_names
+        ]
+        description = "Ask one of the following agents for help:\n" + "\n".join(lines)
+
+    args_schema = create_model(
+        name,
+        __base__=_HandoffToolArgs,
+        agent=(
+            cast("type", Literal.__getitem__(tuple(agent_names))),
+            Field(description="Name of the agent to transfer to."),
+        ),
+    )
+
+    def handoff_to_agent(
+        agent: str,
+        state: Annotated[Any, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+    ) -> Command:
+        return _create_handoff_command(
+            agent,
+            state=state,
+            tool_call_id=tool_call_id,
+            tool_name=name,
+            transfer_messages=transfer_messages,
         )
 
-    handoff_to_agent.metadata = {METADATA_KEY_HANDOFF_DESTINATION: agent_name}
-    return handoff_to_agent
+    async def ahandoff_to_agent(
+        agent: str,
+        state: Annotated[Any, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+    ) -> Command:
+        return handoff_to_agent(agent, state, tool_call_id)
 
+    return StructuredTool.from_function(
+        func=handoff_to_agent,
+        coroutine=ahandoff_to_agent,
+        name=name,
+        description=description,
+        args_schema=args_schema,
+        metadata={METADATA_KEY_HANDOFF_DESTINATION: list(agent_names)},
+    )
 
-def get_handoff_destinations(
-    agent: CompiledStateGraph, tool_node_name: str = "tools"
-) -> list[str]:
-    """Get a list of destinations from agent's handoff tools."""
-    nodes = agent.get_graph().nodes
-    if tool_node_name not in nodes:
-        return []
 
-    tool_node = nodes[tool_node_name].data
-    if not isinstance(tool_node, ToolNode):
+def _get_tool_destinations(tool: BaseTool) -> list[str]:
+    """Get the handoff destinations stored in the tool metadata."""
+    if tool.metadata is None or METADATA_KEY_HANDOFF_DESTINATION not in tool.metadata:
         return []
 
-    tools = tool_node.tools_by_name.values()
+    destination = tool.metadata[METADATA_KEY_HANDOFF_DESTINATION]
+    return [destination] if isinstance(destination, str) else list(destination)
+
+
+# Tools per agent instance and tool node name.
+# Compiled agents are immutable, so the tools never need to be invalidated.
+_AGENT_TOOLS_CACHE: WeakKeyDictionary[Pregel, dict[str, tuple[BaseTool, ...]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _get_tool_node(agent: Pregel, tool_node_name: str) -> ToolNode | None:
+    """Get the agent's tool node, without drawing the agent graph if possible."""
+    tool_node: Any
+    if isinstance(agent, CompiledStateGraph):
+        node_spec = agent.builder.nodes.get(tool_node_name)
+        tool_node = node_spec.runnable if node_spec is not None else None
+    else:
+        nodes = agent.get_graph().nodes
+        tool_node = nodes[tool_node_name].data if tool_node_name in nodes else None
+
+    return tool_node if isinstance(tool_node, ToolNode) else None
+
+
+def _get_agent_tools(agent: Pregel, tool_node_name: str) -> tuple[BaseTool, ...]:
+    """Get the tools of the agent's tool node, cached per agent instance."""
+    tools_by_node = _AGENT_TOOLS_CACHE.setdefault(agent, {})
+    if (tools := tools_by_node.get(tool_node_name)) is None:
+        tool_node = _get_tool_node(agent, tool_node_name)
+        tools = tuple(tool_node.tools_by_name.values()) if tool_node else ()
+        tools_by_node[tool_node_name] = tools
+    return tools
+
+
+def _get_hidden_history_destinations(
+    agent: Pregel, tool_node_name: str = "tools"
+) -> list[str]:
+    """Get the destinations of the agent's handoff tools that hide the history."""
     return [
-        tool.metadata[METADATA_KEY_HANDOFF_DESTINATION]
-        for tool in tools
-        if tool.metadata is not None
-        and METADATA_KEY_HANDOFF_DESTINATION in tool.metadata
+        destination
+        for tool in _get_agent_tools(agent, tool_node_name)
+        if tool.metadata and tool.metadata.get(METADATA_KEY_HIDE_HISTORY)
+        for destination in _get_tool_destinations(tool)
     ]
+
+
+def get_handoff_destinations(
+    agent: CompiledStateGraph, tool_node_name: str = "tools"
+) -> list[str]:
+    """Get a list of destinations from agent's handoff tools.
+
+    Destinations are read directly from the compiled agent's nodes, and the agent's
+    tools are cached per agent instance.
+    """
+    return list(
+        dict.fromkeys(
+            destination
+            for tool in _get_agent_tools(agent, tool_node_name)
+            for destination in _get_tool_destinations(tool)
+        )
+    )
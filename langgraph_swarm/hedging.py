@@ -0,0 +1,352 @@
+import asyncio
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, cast
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from langgraph_swarm.metrics import _get_agent_name
+
+# Runs the model calls of sync hedged calls, so that the caller can stop waiting
+# for a slow call, unless the model has its own executor. Threads are only started
+# when needed, and there are enough of them for the primary and hedge requests of
+# many concurrent calls.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=256, thread_name_prefix="langgraph_swarm_hedge"
+)
+
+_PRIMARY, _HEDGE = 0, 1
+
+
+@dataclass(frozen=True)
+class HedgeInfo:
+    """Statistics of a `HedgedChatModel`."""
+
+    calls: int
+    """Number of model calls."""
+
+    hedged: int
+    """Number of calls for which a hedge request was sent."""
+
+    hedge_wins: int
+    """Number of calls answered by the hedge request."""
+
+    fallbacks: int
+    """Number of calls answered by a fallback model after an error."""
+
+
+class HedgedChatModel(BaseChatModel):
+    """Chat model that hedges slow calls and falls back to other models on errors.
+
+    If a call takes longer than the hedge delay, a duplicate request is sent to the
+    hedge model, and the first response wins. In async runs, the slower request
+    is cancelled; in sync runs, its response is discarded. Unless a fixed
+    `hedge_delay` is provided, the delay is the `hedge_quantile` (p95 by default)
+    of the recent latencies of the model, tracked separately for each swarm agent.
+    If the call still fails, the fallback models are tried in order.
+
+    Give each agent that needs it its own hedged model, and check how often hedging
+    and fallbacks kick in with `info`.
+
+    Example:
+        ```python
+        model = HedgedChatModel(
+            model=init_chat_model("openai:gpt-4.1"),
+            hedge_model=init_chat_model("openai:gpt-4.1"),
+            fallback_models=[init_chat_model("anthropic:claude-sonnet-4-5")],
+        )
+        flight_assistant = create_agent(model, tools=[...], name="flight_assistant")
+        ...
+        print(model.info("flight_assistant"))
+        ```
+
+    """
+
+    model: BaseChatModel
+    """The primary model."""
+
+    hedge_model: BaseChatModel | None = None
+    """Model to send the hedge requests to. Defaults to the primary model."""
+
+    fallback_models: Sequence[BaseChatModel] = ()
+    """Models to try, in order, when the primary and hedge requests fail."""
+
+    hedge_delay: float | None = None
+    """Fixed delay before sending a hedge request, in seconds.
+
+    If not provided, the delay is derived from the recent latencies."""
+
+    hedge_quantile: float = 0.95
+    """Quantile of the recent latencies to use as the hedge delay."""
+
+    min_samples: int = 20
+    """Number of latencies to record before hedging with a derived delay."""
+
+    max_samples: int = 1000
+    """Number of recent latencies to derive the hedge delay from."""
+
+    executor: Executor | None = None
+    """Executor to run the requests of sync calls in, so that slow calls can be hedged.
+
+    Defaults to a thread pool shared by all hedged models. If the executor is too
+    busy to start a request within the hedge delay, the call runs without hedging
+    in the calling thread instead."""
+
+    _bound_models: tuple[Runnable[LanguageModelInput, BaseMessage], ...] | None = (
+        PrivateAttr(default=None)
+    )
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+    _latencies: dict[str, deque[float]] = PrivateAttr(default_factory=dict)
+    _counters: dict[str, Counter[str]] = PrivateAttr(default_factory=dict)
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged"
+
+    def info(self, agent_name: str | None = None) -> HedgeInfo:
+        """Get the statistics of the model.
+
+        Args:
+            agent_name: Optional name of an agent to get the statistics for.
+                Defaults to the statistics of all the calls.
+
+        """
+        with self._lock:
+            counters: Counter[str] = Counter()
+            for name, agent_counters in self._counters.items():
+                if agent_name is None or name == agent_name:
+                    counters.update(agent_counters)
+        return HedgeInfo(
+            calls=counters["calls"],
+            hedged=counters["hedged"],
+            hedge_wins=counters["hedge_wins"],
+            fallbacks=counters["fallbacks"],
+        )
+
+    def _get_models(self) -> tuple[Runnable[LanguageModelInput, BaseMessage], ...]:
+        """Get the primary, hedge and fallback models, in this order."""
+        if self._bound_models is not None:
+            return self._bound_models
+        hedge_model = self.hedge_model if self.hedge_model is not None else self.model
+        return (self.model, hedge_model, *self.fallback_models)
+
+    def _record(self, agent_name: str, event: str) -> None:
+        with self._lock:
+            self._counters.setdefault(agent_name, Counter())[event] += 1
+
+    def _record_latency(self, agent_name: str, seconds: float) -> None:
+        with self._lock:
+            if agent_name not in self._latencies:
+                self._latencies[agent_name] = deque(maxlen=self.max_samples)
+            self._latencies[agent_name].append(seconds)
+
+    def _get_hedge_delay(self, agent_name: str) -> float | None:
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        with self._lock:
+            latencies = sorted(self._latencies.get(agent_name, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        index = min(len(latencies) - 1, int(len(latencies) * self.hedge_quantile))
+        return latencies[index]
+
+    def _fall_back(
+        self, agent_name: str, error: Exception, call: Callable[[int], BaseMessage]
+    ) -> BaseMessage:
+        for index in range(_HEDGE + 1, len(self._get_models())):
+            try:
+                message = call(index)
+            except Exception as e:  # noqa: BLE001, PERF203
+                error = e
+            else:
+                self._record(agent_name, "fallbacks")
+                return message
+        raise error
+
+    async def _afall_back(
+        self,
+        agent_name: str,
+        error: Exception,
+        call: Callable[[int], Awaitable[BaseMessage]],
+    ) -> BaseMessage:
+        for index in range(_HEDGE + 1, len(self._get_models())):
+            try:
+                message = await call(index)
+            except Exception as e:  # noqa: BLE001, PERF203
+                error = e
+            else:
+                self._record(agent_name, "fallbacks")
+                return message
+        raise error
+
+    def _call_hedged(
+        self, agent_name: str, call: Callable[[int], BaseMessage]
+    ) -> BaseMessage:
+        started = Event()
+
+        def call_primary() -> BaseMessage:
+            started.set()
+            start = time.perf_counter()
+            message = call(_PRIMARY)
+            # the call keeps running after a hedge request won, so record it anyway
+            self._record_latency(agent_name, time.perf_counter() - start)
+            return message
+
+        if (delay := self._get_hedge_delay(agent_name)) is None:
+            return call_primary()
+
+        executor = self.executor if self.executor is not None else _EXECUTOR
+        primary = executor.submit(copy_context().run, call_primary)
+        # the time the call waits for a thread doesn't count towards the hedge delay,
+        # and if no thread frees up in time, a hedge request wouldn't start either
+        if not started.wait(timeout=delay) and primary.cancel():
+            return call_primary()
+        if not wait([primary], timeout=delay).done:
+            self._record(agent_name, "hedged")
+            hedge = executor.submit(copy_context().run, call, _HEDGE)
+            futures: dict[Future[BaseMessage], int] = {primary: _PRIMARY, hedge: _HEDGE}
+            error: BaseException | None = None
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if (error := future.exception()) is None:
+                        for other in pending:
+                            other.cancel()
+                        if futures[future] == _HEDGE:
+                            self._record(agent_name, "hedge_wins")
+                        return future.result()
+            raise error  # type: ignore[misc]
+        return primary.result()
+
+    async def _acall_hedged(
+        self, agent_name: str, call: Callable[[int], Awaitable[BaseMessage]]
+    ) -> BaseMessage:
+        async def call_primary() -> BaseMessage:
+            start = time.perf_counter()
+            try:
+                message = await call(_PRIMARY)
+            except asyncio.CancelledError:
+                # the slower call still tells how long the primary model takes
+                self._record_latency(agent_name, time.perf_counter() - start)
+                raise
+            self._record_latency(agent_name, time.perf_counter() - start)
+            return message
+
+        if (delay := self._get_hedge_delay(agent_name)) is None:
+            return await call_primary()
+
+        primary = asyncio.ensure_future(call_primary())
+        tasks: dict[asyncio.Future[BaseMessage], int] = {primary: _PRIMARY}
+        try:
+            finished, _ = await asyncio.wait([primary], timeout=delay)
+            if finished:
+                return primary.result()
+            self._record(agent_name, "hedged")
+            tasks[asyncio.ensure_future(call(_HEDGE))] = _HEDGE
+            error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if (error := task.exception()) is None:
+                        if tasks[task] == _HEDGE:
+                            self._record(agent_name, "hedge_wins")
+                        return task.result()
+            raise error  # type: ignore[misc]
+        finally:
+            for future in tasks:
+                future.cancel()
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        agent_name = _get_agent_name(run_manager.metadata if run_manager else {}) or ""
+        # the inner calls are not traced, the response is traced by this call
+        config: RunnableConfig = {
+            "callbacks": [],
+            "metadata": run_manager.metadata if run_manager else {},
+        }
+        models = self._get_models()
+
+        def call(index: int) -> BaseMessage:
+            return models[index].invoke(messages, config, stop=stop, **kwargs)
+
+        self._record(agent_name, "calls")
+        try:
+            message = self._call_hedged(agent_name, call)
+        except Exception as e:  # noqa: BLE001
+            message = self._fall_back(agent_name, e, call)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        agent_name = _get_agent_name(run_manager.metadata if run_manager else {}) or ""
+        # the inner calls are not traced, the response is traced by this call
+        config: RunnableConfig = {
+            "callbacks": [],
+            "metadata": run_manager.metadata if run_manager else {},
+        }
+        models = self._get_models()
+
+        async def call(index: int) -> BaseMessage:
+            return await models[index].ainvoke(messages, config, stop=stop, **kwargs)
+
+        self._record(agent_name, "calls")
+        try:
+            message = await self._acall_hedged(agent_name, call)
+        except Exception as e:  # noqa: BLE001
+            message = await self._afall_back(agent_name, e, call)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> "HedgedChatModel":
+        # the bound copy shares the latencies and the counters of this model
+        bound = self.model_copy()
+        bound._bound_models = tuple(  # noqa: SLF001
+            cast("BaseChatModel", model).bind_tools(
+                tools, tool_choice=tool_choice, **kwargs
+            )
+            for model in self._get_models()
+        )
+        return bound
@@ -0,0 +1,101 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.pregel import Pregel
+
+
+@dataclass
+class LazyAgent:
+    """An agent that is only constructed when the swarm first routes to it.
+
+    The swarm's routing graph is built from the declared handoff destinations,
+    so the agent (its subgraph, model and tools) is only created by the factory
+    on the first routing or handoff to it, and then reused for all later runs.
+    This keeps the start-up time and memory of large swarms proportional to the
+    agents that are actually used.
+
+    Example:
+        ```python
+        def create_bob() -> Pregel:
+            return create_agent(
+                "openai:gpt-4o",
+                tools=[create_handoff_tool(agent_name="Alice")],
+                name="Bob",
+            )
+
+        workflow = create_swarm(
+            [alice, LazyAgent("Bob", create_bob, destinations=["Alice"])],
+            default_active_agent="Alice",
+        )
+        ```
+
+    An agent with fan-out tools (`create_fanout_tool`) must also declare the
+    agents it can delegate tasks to in `fanout_destinations`.
+
+    """
+
+    name: str
+    """Name of the agent, i.e. the name of the agent node in the swarm."""
+
+    factory: Callable[[], Pregel]
+    """Function that creates the agent. The agent must have the same name."""
+
+    destinations: Sequence[str] = ()
+    """Names of the agents this agent can hand off to."""
+
+    fanout_destinations: Sequence[str] = ()
+    """Names of the agents this agent can delegate tasks to with fan-out tools."""
+
+    _agent: Pregel | None = field(default=None, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the agent has been created."""
+        return self._agent is not None
+
+    @property
+    def agent(self) -> Pregel:
+        """The agent, created by the factory on first access."""
+        if self._agent is None:
+            with self._lock:
+                if self._agent is None:
+                    agent = self.factory()
+                    if agent.name != self.name:
+                        msg = (
+                            f"Agent factory for '{self.name}' returned an agent "
+                            f"named '{agent.name}'"
+                        )
+                        raise ValueError(msg)
+                    self._check_fanout_destinations(agent)
+                    self._agent = agent
+        return self._agent
+
+    def _check_fanout_destinations(self, agent: Pregel) -> None:
+        # imported here, since the fan-out module depends on this one
+        from langgraph_swarm.fanout import (  # noqa: PLC0415
+            _check_fanout_tools,
+            _get_fanout_destinations,
+        )
+
+        _check_fanout_tools(agent)
+        # the swarm only routes to the fan-out node from agents that declare it
+        if undeclared := set(_get_fanout_destinations(agent)) - set(
+            self.fanout_destinations
+        ):
+            msg = (
+                f"Agent '{self.name}' can delegate tasks to {sorted(undeclared)}, "
+                "which are not declared in its fanout_destinations"
+            )
+            raise ValueError(msg)
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None) -> Any:  # noqa: A002
+        """Invoke the agent, creating it if needed."""
+        return self.agent.invoke(input, config)
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None) -> Any:  # noqa: A002
+        """Asynchronously invoke the agent, creating it if needed."""
+        return await self.agent.ainvoke(input, config)
@@ -0,0 +1,136 @@
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Literal, cast
+
+from langchain.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langgraph.graph import END
+from langgraph.types import Command
+
+from langgraph_swarm.handoff import (
+    METADATA_KEY_HANDOFF_DESTINATION,
+    _is_handoff_message,
+)
+
+LimitReason = Literal["max_handoffs", "max_cycles"]
+
+
+@dataclass
+class HandoffLimit:
+    """Limits on the handoffs within a single turn of the swarm.
+
+    A turn starts with the latest human message. When a handoff exceeds one of
+    the limits, the swarm routes to the fallback agent instead of the requested
+    agent, or ends the turn if there is no fallback agent (or it has already
+    responded after the limit was reached).
+
+    Example:
+        ```python
+        limit = HandoffLimit(max_handoffs=5, max_cycles=1, fallback_agent="Alice")
+        workflow = create_swarm(
+            [alice, bob], default_active_agent="Alice", handoff_limit=limit
+        )
+        ...
+        print(limit.counters)  # {"max_handoffs": 0, "max_cycles": 2}
+        ```
+
+    """
+
+    max_handoffs: int | None = None
+    """Maximum number of handoffs per turn."""
+
+    max_cycles: int | None = None
+    """Maximum number of times the same handoff (same source and destination
+    agents) may happen within a turn, e.g. `1` allows `Alice -> Bob -> Alice`,
+    but stops the next `Alice -> Bob`."""
+
+    fallback_agent: str | None = None
+    """Name of the agent to route to when a limit is reached.
+
+    If not provided, the turn ends instead."""
+
+    _counters: Counter[LimitReason] = field(
+        default_factory=Counter, init=False, repr=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def counters(self) -> dict[LimitReason, int]:
+        """Number of times each limit was reached."""
+        with self._lock:
+            return {
+                "max_handoffs": self._counters["max_handoffs"],
+                "max_cycles": self._counters["max_cycles"],
+            }
+
+    def _record(self, reason: LimitReason) -> None:
+        with self._lock:
+            self._counters[reason] += 1
+
+
+def _find_limit_violation(
+    messages: Sequence[AnyMessage], limit: HandoffLimit
+) -> tuple[LimitReason, int] | None:
+    """Find the first handoff of the current turn that exceeds the limit.
+
+    Returns the reason and the index of the handoff tool message, if any.
+    Only walks back to the start of the current turn.
+    """
+    handoffs: list[tuple[int, str | None, str]] = []
+    tool_call_ids: dict[str, int] = {}
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, ToolMessage) and _is_handoff_message(message):
+            destination = message.response_metadata[METADATA_KEY_HANDOFF_DESTINATION]
+            tool_call_ids[message.tool_call_id] = len(handoffs)
+            handoffs.append((index, None, destination))
+        elif isinstance(message, AIMessage):
+            # the handoff source is the agent that made the tool call
+            for tool_call in message.tool_calls:
+                if (
+                    position := tool_call_ids.get(cast("str", tool_call["id"]))
+                ) is not None:
+                    index_, _, destination = handoffs[position]
+                    handoffs[position] = (index_, message.name, destination)
+
+    edge_counts: Counter[tuple[str | None, str]] = Counter()
+    for count, (index, source, destination) in enumerate(reversed(handoffs), 1):
+        edge_counts[source, destination] += 1
+        if limit.max_handoffs is not None and count > limit.max_handoffs:
+            return "max_handoffs", index
+        if (
+            limit.max_cycles is not None
+            and edge_counts[source, destination] > limit.max_cycles
+        ):
+            return "max_cycles", index
+    return None
+
+
+def _apply_handoff_limit(
+    messages: Sequence[AnyMessage], limit: HandoffLimit, agent_name: str
+) -> Command | None:
+    """Check if the agent should be skipped because the handoff limit was reached.
+
+    Returns the `Command` that routes to the fallback agent or ends the turn instead,
+    or `None` if the agent should run.
+    """
+    violation = _find_limit_violation(messages, limit)
+    if violation is None:
+        return None
+
+    reason, index = violation
+    fallback_agent = limit.fallback_agent
+    fallback_responded = fallback_agent is not None and any(
+        isinstance(message, AIMessage) and message.name == fallback_agent
+        for message in messages[index:]
+    )
+    if agent_name == fallback_agent and not fallback_responded:
+        return None
+
+    limit._record(reason)  # noqa: SLF001
+    if fallback_agent is not None and not fallback_responded:
+        return Command(goto=fallback_agent, update={"active_agent": fallback_agent})
+    return Command(goto=END)
@@ -0,0 +1,138 @@
+import hashlib
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+from langchain_core.stores import BaseStore, InMemoryByteStore
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Type prefix of the values whose message lists were replaced by references.
+MESSAGE_REFS_TYPE_PREFIX = "swarm_message_refs+"
+MESSAGE_REFS_KEY = "__swarm_message_refs"
+
+
+def _is_message_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, BaseMessage) for item in value)
+    )
+
+
+class MessageStoreSerializer(SerializerProtocol):
+    """Checkpoint serializer that stores each message once, in a content-addressed store.
+
+    The parent swarm and the agent subgraphs all checkpoint their own copy of the
+    message history, and every step writes it again, so the same messages are stored
+    many times. This serializer replaces the lists of messages in the checkpoints
+    and writes with references (hashes of the serialized messages), and stores the
+    messages themselves in a key-value store, where identical messages are only
+    stored once. The parent and subgraph checkpoints then reference the same stored
+    messages.
+
+    Use it as the `serde` of any checkpointer. Messages are never removed from the
+    store, so use a store with its own expiration policy for long-running deployments:
+    expired messages are written again when a new checkpoint references them, but
+    older checkpoints that reference them can no longer be loaded.
+    The store is called synchronously, also from async checkpointers.
+
+    Example:
+        ```python
+        from langchain_core.stores import InMemoryByteStore
+        from langgraph.checkpoint.sqlite import SqliteSaver
+
+        serde = MessageStoreSerializer(InMemoryByteStore())
+        checkpointer = SqliteSaver(conn, serde=serde)
+        app = create_swarm([alice, bob], default_active_agent="Alice").compile(
+            checkpointer=checkpointer
+        )
+        ```
+
+    """
+
+    def __init__(
+        self,
+        store: BaseStore[str, bytes] | None = None,
+        *,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            store: Key-value store for the messages. Defaults to an in-memory store.
+            serde: Serializer for the messages and the rest of the checkpoints.
+                Defaults to the serializer used by the LangGraph checkpointers.
+
+        """
+        self.store = store if store is not None else InMemoryByteStore()
+        self.serde = serde if serde is not None else JsonPlusSerializer()
+
+    def _store_messages(
+        self, messages: list[BaseMessage], pending: dict[str, bytes]
+    ) -> dict[str, list[str]]:
+        keys = []
+        for message in messages:
+            type_, data = self.serde.dumps_typed(message)
+            value = type_.encode() + b"\0" + data
+            key = hashlib.sha256(value).hexdigest()[:32]
+            pending[key] = value
+            keys.append(key)
+        return {MESSAGE_REFS_KEY: keys}
+
+    def _replace_messages(self, obj: Any, pending: dict[str, bytes]) -> Any:
+        if _is_message_list(obj):
+            return self._store_messages(obj, pending)
+        if isinstance(obj, dict):
+            replaced = {
+                key: self._replace_messages(value, pending)
+                for key, value in obj.items()
+            }
+            # keep the original object if it has no messages to replace
+            if all(replaced[key] is value for key, value in obj.items()):
+                return obj
+            return replaced
+        return obj
+
+    def _resolve_messages(self, obj: Any) -> Any:
+        if not isinstance(obj, dict):
+            return obj
+        if MESSAGE_REFS_KEY not in obj:
+            return {key: self._resolve_messages(value) for key, value in obj.items()}
+
+        keys = obj[MESSAGE_REFS_KEY]
+        messages = []
+        for key, value in zip(keys, self.store.mget(keys), strict=True):
+            if value is None:
+                msg = f"Message '{key}' not found in the message store"
+                raise ValueError(msg)
+            type_, _, data = value.partition(b"\0")
+            messages.append(self.serde.loads_typed((type_.decode(), data)))
+        return messages
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        """Serialize an object, storing the messages it contains in the message store."""
+        pending: dict[str, bytes] = {}
+        replaced = self._replace_messages(obj, pending)
+        if replaced is obj:
+            return self.serde.dumps_typed(obj)
+
+        # only write the messages that aren't in the store (anymore)
+        keys = list(pending)
+        if missing := [
+            (key, pending[key])
+            for key, value in zip(keys, self.store.mget(keys), strict=True)
+            if value is None
+        ]:
+            self.store.mset(missing)
+        type_, data = self.serde.dumps_typed(replaced)
+        return MESSAGE_REFS_TYPE_PREFIX + type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        """Deserialize an object, loading the messages it references from the message store."""
+        type_, payload = data
+        if not type_.startswith(MESSAGE_REFS_TYPE_PREFIX):
+            return self.serde.loads_typed(data)
+        obj = self.serde.loads_typed(
+            (type_.removeprefix(MESSAGE_REFS_TYPE_PREFIX), payload)
+        )
+        return self._resolve_messages(obj)
@@ -0,0 +1,347 @@
+import json
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, cast
+from uuid import UUID
+
+from langchain.messages import AIMessage, ToolMessage
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langgraph.types import Command
+from typing_extensions import override
+
+from langgraph_swarm.handoff import (
+    METADATA_KEY_HANDOFF_DESTINATION,
+    _is_handoff_message,
+)
+
+ROUTER_RUN_NAME = "route_to_active_agent"
+
+
+@dataclass
+class AgentMetrics:
+    """Metrics recorded for a single agent."""
+
+    runs: int = 0
+    """Number of times the agent was activated."""
+
+    wall_seconds: float = 0.0
+    """Total wall time of the agent's runs."""
+
+    llm_calls: int = 0
+    """Number of LLM calls made by the agent."""
+
+    llm_seconds: float = 0.0
+    """Total wall time of the agent's LLM calls."""
+
+    input_tokens: int = 0
+    """Total number of input tokens of the agent's LLM calls."""
+
+    output_tokens: int = 0
+    """Total number of output tokens of the agent's LLM calls."""
+
+
+def _get_agent_name(metadata: dict[str, Any] | None) -> str | None:
+    """Get the name of the swarm agent a run belongs to."""
+    if not metadata:
+        return None
+    if agent_name := metadata.get("lc_agent_name"):
+        return cast("str", agent_name)
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns")
+    if not checkpoint_ns:
+        return None
+    return cast("str", checkpoint_ns.split("|")[0].split(":")[0])
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class SwarmMetricsCallbackHandler(BaseCallbackHandler):
+    """Callback handler that records per-agent metrics of a swarm.
+
+    Records per-agent wall time and LLM time, input and output tokens, handoffs
+    by (source, destination) agents and the router's decisions at the start of
+    each turn. Attach it through the `callbacks` of the run config; the metrics
+    are accumulated across runs and can be exported with `to_prometheus` or `to_json`.
+
+    Example:
+        ```python
+        metrics = SwarmMetricsCallbackHandler()
+        app = create_swarm([alice, bob], default_active_agent="Alice").compile()
+        app.invoke(
+            {"messages": [{"role": "user", "content": "hi"}]},
+            {"callbacks": [metrics]},
+        )
+        print(metrics.to_prometheus())
+        ```
+
+    """
+
+    # the handler only updates counters, so it is cheaper to run it inline
+    # than to dispatch it to an executor in async runs
+    run_inline = True
+
+    def __init__(self) -> None:
+        """Initialize the handler with empty metrics."""
+        self._lock = Lock()
+        self.turns = 0
+        self.agents: dict[str, AgentMetrics] = {}
+        self.handoffs: Counter[tuple[str, str]] = Counter()
+        self.router_decisions: Counter[str] = Counter()
+        self._agent_runs: dict[UUID, tuple[str, float]] = {}
+        # parents of the chain runs in progress, to find their enclosing agent run
+        self._chain_parents: dict[UUID, UUID] = {}
+        self._llm_runs: dict[UUID, tuple[str, float]] = {}
+        self._router_runs: set[UUID] = set()
+        self._tool_runs: dict[UUID, str] = {}
+
+    def _get_agent_metrics(self, agent_name: str) -> AgentMetrics:
+        if agent_name not in self.agents:
+            self.agents[agent_name] = AgentMetrics()
+        return self.agents[agent_name]
+
+    def _is_in_agent_run(self, run_id: UUID | None) -> bool:
+        while run_id is not None:
+            if run_id in self._agent_runs:
+                return True
+            run_id = self._chain_parents.get(run_id)
+        return False
+
+    @override
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record the start of a turn, an agent run or a router run."""
+        with self._lock:
+            if parent_run_id is None:
+                self.turns += 1
+                return
+            self._chain_parents[run_id] = parent_run_id
+            if kwargs.get("name") == ROUTER_RUN_NAME:
+                self._router_runs.add(run_id)
+                return
+
+            metadata = metadata or {}
+            node = metadata.get("langgraph_node")
+            checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+            if (
+                node is None
+                or node.startswith("__")
+                or "|" in checkpoint_ns
+                # the agent's graph runs within the node's run, possibly wrapped
+                or self._is_in_agent_run(parent_run_id)
+            ):
+                return
+            self._agent_runs[run_id] = (node, time.perf_counter())
+
+    def _end_chain(self, run_id: UUID, outputs: Any = None) -> None:
+        with self._lock:
+            self._chain_parents.pop(run_id, None)
+            if run_id in self._router_runs:
+                self._router_runs.discard(run_id)
+                if isinstance(outputs, str):
+                    self.router_decisions[outputs] += 1
+                return
+            if (agent_run := self._agent_runs.pop(run_id, None)) is not None:
+                agent_name, start = agent_run
+                agent_metrics = self._get_agent_metrics(agent_name)
+                agent_metrics.runs += 1
+                agent_metrics.wall_seconds += time.perf_counter() - start
+
+    @override
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record the end of an agent run or a router decision."""
+        self._end_chain(run_id, outputs)
+
+    @override
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Record the end of an agent run that handed off control or failed."""
+        self._end_chain(run_id)
+
+    def _start_llm(self, run_id: UUID, metadata: dict[str, Any] | None) -> None:
+        if (agent_name := _get_agent_name(metadata)) is not None:
+            with self._lock:
+                self._llm_runs[run_id] = (agent_name, time.perf_counter())
+
+    @override
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record the start of an LLM call."""
+        self._start_llm(run_id, metadata)
+
+    @override
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record the start of a chat model call."""
+        self._start_llm(run_id, metadata)
+
+    @override
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record the duration and the token usage of an LLM call."""
+        with self._lock:
+            if (llm_run := self._llm_runs.pop(run_id, None)) is None:
+                return
+            agent_name, start = llm_run
+            agent_metrics = self._get_agent_metrics(agent_name)
+            agent_metrics.llm_calls += 1
+            agent_metrics.llm_seconds += time.perf_counter() - start
+            for generations in response.generations:
+                for generation in generations:
+                    if not isinstance(generation, ChatGeneration):
+                        continue
+                    message = generation.message
+                    if isinstance(message, AIMessage) and message.usage_metadata:
+                        usage = message.usage_metadata
+                        agent_metrics.input_tokens += usage["input_tokens"]
+                        agent_metrics.output_tokens += usage["output_tokens"]
+
+    @override
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Discard a failed LLM call."""
+        with self._lock:
+            self._llm_runs.pop(run_id, None)
+
+    @override
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record the agent that calls a tool."""
+        if (agent_name := _get_agent_name(metadata)) is not None:
+            with self._lock:
+                self._tool_runs[run_id] = agent_name
+
+    @override
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record a handoff, if the tool handed off control to another agent."""
+        with self._lock:
+            source = self._tool_runs.pop(run_id, None)
+            if (
+                source is None
+                or not isinstance(output, Command)
+                or not isinstance(output.update, dict)
+            ):
+                return
+            messages = output.update.get("messages") or []
+            if messages and isinstance(messages[-1], ToolMessage):
+                tool_message = messages[-1]
+                if _is_handoff_message(tool_message):
+                    destination = tool_message.response_metadata[
+                        METADATA_KEY_HANDOFF_DESTINATION
+                    ]
+                    self.handoffs[source, destination] += 1
+
+    @override
+    def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Discard a failed tool call."""
+        with self._lock:
+            self._tool_runs.pop(run_id, None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "turns": self.turns,
+                "agents": {
+                    agent_name: asdict(agent_metrics)
+                    for agent_name, agent_metrics in self.agents.items()
+                },
+                "handoffs": [
+                    {"source": source, "destination": destination, "count": count}
+                    for (source, destination), count in self.handoffs.items()
+                ],
+                "router_decisions": dict(self.router_decisions),
+            }
+
+    def to_json(self) -> str:
+        """Export the metrics as a JSON string."""
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self, prefix: str = "swarm") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names.
+
+        """
+        metrics = self.to_dict()
+        lines = [
+            f"# HELP {prefix}_turns_total Number of swarm runs.",
+            f"# TYPE {prefix}_turns_total counter",
+            f"{prefix}_turns_total {metrics['turns']}",
+        ]
+        for field_name, help_text in (
+            ("runs", "Number of agent activations."),
+            ("wall_seconds", "Wall time of the agent runs."),
+            ("llm_calls", "Number of LLM calls."),
+            ("llm_seconds", "Wall time of the LLM calls."),
+            ("input_tokens", "Number of LLM input tokens."),
+            ("output_tokens", "Number of LLM output tokens."),
+        ):
+            name = f"{prefix}_agent_{field_name}_total"
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} counter"))
+            lines.extend(
+                f'{name}{{agent="{_escape_label(agent_name)}"}} {agent_metrics[field_name]}'
+                for agent_name, agent_metrics in metrics["agents"].items()
+            )
+
+        name = f"{prefix}_handoffs_total"
+        lines.extend(
+            (
+                f"# HELP {name} Number of handoffs between agents.",
+                f"# TYPE {name} counter",
+            )
+        )
+        lines.extend(
+            f'{name}{{source="{_escape_label(handoff["source"])}",'
+            f'destination="{_escape_label(handoff["destination"])}"}} {handoff["count"]}'
+            for handoff in metrics["handoffs"]
+        )
+
+        name = f"{prefix}_router_decisions_total"
+        lines.extend(
+            (
+                f"# HELP {name} Number of turns routed to each agent.",
+                f"# TYPE {name} counter",
+            )
+        )
+        lines.extend(
+            f'{name}{{agent="{_escape_label(agent_name)}"}} {count}'
+            for agent_name, count in metrics["router_decisions"].items()
+        )
+        return "\n".join(lines) + "\n"
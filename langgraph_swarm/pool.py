@@ -0,0 +1,337 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import pickle
+import threading
+import zlib
+from collections.abc import Callable
+from concurrent.futures import Future
+from multiprocessing import connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.pregel import Pregel
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+AppFactory = Callable[[], Pregel]
+"""Function that creates the compiled swarm in each worker process."""
+
+
+def _dump_result(request_id: int, error: BaseException | None, output: Any) -> bytes:
+    try:
+        return pickle.dumps((request_id, error, output))
+    except Exception as e:  # noqa: BLE001
+        error = RuntimeError(f"Result of the run can't be sent back: {e!r}")
+        return pickle.dumps((request_id, error, None))
+
+
+async def _serve(
+    app_factory: AppFactory,
+    requests: "Queue[bytes | None]",
+    results: "Queue[tuple[int, bytes] | int | None]",
+    max_concurrency: int,
+) -> None:
+    """Run the requests of a worker process until it receives `None`."""
+    app: Pregel | None = None
+    app_error: BaseException | None = None
+    try:
+        app = app_factory()
+    except Exception as e:  # noqa: BLE001
+        # report the error to every request instead of hanging them
+        app_error = e
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    running: set[asyncio.Task[None]] = set()
+
+    async def run(request_id: int, input_: Any, config: RunnableConfig) -> None:
+        error, output = app_error, None
+        if app is not None:
+            async with semaphore:
+                try:
+                    output = await app.ainvoke(input_, config)
+                except Exception as e:  # noqa: BLE001
+                    error = e
+        results.put((request_id, _dump_result(request_id, error, output)))
+
+    while (request := await loop.run_in_executor(None, requests.get)) is not None:
+        task = asyncio.create_task(run(*pickle.loads(request)))  # noqa: S301
+        running.add(task)
+        task.add_done_callback(running.discard)
+    if running:
+        await asyncio.wait(running)
+
+
+def _run_worker(
+    app_factory: AppFactory,
+    requests: "Queue[bytes | None]",
+    results: "Queue[tuple[int, bytes] | int | None]",
+    max_concurrency: int,
+) -> None:
+    asyncio.run(_serve(app_factory, requests, results, max_concurrency))
+
+
+class SwarmWorkerPool:
+    """Serve a compiled swarm from several worker processes.
+
+    A single process is limited by the GIL for CPU-bound work (e.g. serializing
+    checkpoints, applying reducers, running tools). The pool runs one copy of the
+    swarm per worker process, created by `app_factory`, and always sends the runs
+    of a thread (by `thread_id`) to the same worker, so that in-process state
+    (e.g. an `InMemorySaver` checkpointer or a `SwarmResponseCache`) stays local to
+    the thread. Runs without a `thread_id` are spread across the workers.
+
+    Each worker runs up to `max_concurrency` runs concurrently. Submitting a run to
+    a worker that already has `max_pending` runs waits for one of them to finish,
+    so a slow worker pushes back on its callers instead of queueing without bound.
+
+    If a worker process exits unexpectedly (e.g. it crashes or is killed), its
+    pending runs fail with a `RuntimeError`, and the worker is restarted with a new
+    copy of the swarm, without the in-process state of the old one.
+
+    `app_factory` must be picklable (e.g. a module-level function), and so must the
+    inputs, configs and outputs of the runs. Callbacks in the config are not
+    supported, since they would run in the worker processes.
+
+    Example:
+        ```python
+        # my_app.py
+        def make_app():
+            return create_swarm([alice, bob], default_active_agent="Alice").compile(
+                checkpointer=InMemorySaver()
+            )
+
+        # main.py
+        with SwarmWorkerPool(make_app, workers=4) as pool:
+            result = pool.invoke(
+                {"messages": [{"role": "user", "content": "hi"}]},
+                {"configurable": {"thread_id": "1"}},
+            )
+        ```
+
+    """
+
+    def __init__(
+        self,
+        app_factory: AppFactory,
+        *,
+        workers: int | None = None,
+        max_concurrency: int = 16,
+        max_pending: int = 64,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Start the worker processes.
+
+        Args:
+            app_factory: Function that creates the compiled swarm, called once in each
+                worker process.
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            max_concurrency: Maximum number of runs to run concurrently in each worker.
+            max_pending: Maximum number of submitted runs per worker that haven't
+                finished yet. Further submissions to the worker wait.
+            mp_context: Optional multiprocessing context to start the workers with.
+                Defaults to the `"spawn"` context.
+
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        for name, value in (
+            ("workers", workers),
+            ("max_concurrency", max_concurrency),
+            ("max_pending", max_pending),
+        ):
+            if value < 1:
+                msg = f"{name} must be a positive integer"
+                raise ValueError(msg)
+
+        self.workers = workers
+        self._app_factory = app_factory
+        self._max_concurrency = max_concurrency
+        self._context: Any = mp_context or multiprocessing.get_context("spawn")
+        # the results of the runs, and the indexes of the workers that exited
+        self._results: Queue[tuple[int, bytes] | int | None] = self._context.Queue()
+        self._slots = [threading.BoundedSemaphore(max_pending) for _ in range(workers)]
+        self._futures: dict[int, tuple[int, Future[Any]]] = {}
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._round_robin = itertools.count()
+        self._closed = False
+        self._requests: list[Queue[bytes | None]] = []
+        self._processes: list[BaseProcess] = []
+        self._watchers: dict[int, threading.Thread] = {}
+        for worker in range(workers):
+            self._requests.append(self._context.Queue())
+            self._processes.append(self._start_worker(worker, self._requests[worker]))
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def _start_worker(
+        self, worker: int, requests: "Queue[bytes | None]"
+    ) -> BaseProcess:
+        """Start the process of a worker, and a thread that reports when it exits."""
+        process: BaseProcess = self._context.Process(
+            target=_run_worker,
+            args=(self._app_factory, requests, self._results, self._max_concurrency),
+            daemon=True,
+        )
+        process.start()
+        watcher = threading.Thread(
+            target=self._watch, args=(worker, process), daemon=True
+        )
+        watcher.start()
+        self._watchers[worker] = watcher
+        return process
+
+    def _watch(self, worker: int, process: BaseProcess) -> None:
+        # wait on the sentinel instead of joining, so that `close` can join the process
+        connection.wait([process.sentinel])
+        # the results the worker sent before exiting are ahead in the queue
+        self._results.put(worker)
+
+    def _get_worker(self, config: RunnableConfig | None) -> int:
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
+        if thread_id is None:
+            return next(self._round_robin) % self.workers
+        # unlike `hash`, crc32 is stable across processes and restarts
+        return zlib.crc32(str(thread_id).encode()) % self.workers
+
+    def _restart_worker(self, worker: int) -> None:
+        """Fail the pending runs of a worker that exited, and restart it unless closed."""
+        with self._lock:
+            exitcode = self._processes[worker].exitcode
+            failed = [
+                request_id
+                for request_id, (request_worker, _) in self._futures.items()
+                if request_worker == worker
+            ]
+            futures = [self._futures.pop(request_id)[1] for request_id in failed]
+            if not self._closed:
+                # the requests the worker didn't take are failed with it
+                self._requests[worker].cancel_join_thread()
+                self._requests[worker] = self._context.Queue()
+                self._processes[worker] = self._start_worker(
+                    worker, self._requests[worker]
+                )
+        for future in futures:
+            self._slots[worker].release()
+            msg = f"Worker {worker} exited unexpectedly with exit code {exitcode}"
+            future.set_exception(RuntimeError(msg))
+
+    def _collect(self) -> None:
+        """Resolve the futures of the runs as the workers return their results."""
+        while (result := self._results.get()) is not None:
+            if isinstance(result, int):
+                self._restart_worker(result)
+                continue
+            request_id, payload = result
+            with self._lock:
+                worker, future = self._futures.pop(request_id)
+            self._slots[worker].release()
+            try:
+                _, error, output = pickle.loads(payload)  # noqa: S301
+            except Exception as e:  # noqa: BLE001
+                error = RuntimeError(f"Result of the run can't be loaded: {e!r}")
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(output)
+
+    def submit(
+        self,
+        input: Any,  # noqa: A002
+        config: RunnableConfig | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Future[Any]:
+        """Submit a run to the worker of its thread.
+
+        Args:
+            input: Input of the swarm.
+            config: Optional config of the run, with the `thread_id` to route by.
+            timeout: Maximum time to wait for the worker to accept the run, if it
+                already has `max_pending` runs. Defaults to waiting indefinitely.
+
+        Returns:
+            A future with the output of the swarm.
+
+        Raises:
+            TimeoutError: If the worker didn't accept the run within `timeout`.
+
+        """
+        if self._closed:
+            msg = "Cannot submit runs to a closed worker pool"
+            raise RuntimeError(msg)
+        worker = self._get_worker(config)
+        request_id = next(self._request_ids)
+        # pickle in the caller, so that unpicklable inputs fail here
+        request = pickle.dumps((request_id, input, config or {}))
+        if not self._slots[worker].acquire(timeout=timeout):
+            msg = f"Worker {worker} has too many pending runs"
+            raise TimeoutError(msg)
+
+        future: Future[Any] = Future()
+        # register and send the run together, so that the run goes to the current
+        # process of the worker, or fails with it if it exits
+        with self._lock:
+            self._futures[request_id] = (worker, future)
+            self._requests[worker].put(request)
+        return future
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None) -> Any:  # noqa: A002
+        """Run the swarm in the worker of the thread and wait for its output.
+
+        Args:
+            input: Input of the swarm.
+            config: Optional config of the run, with the `thread_id` to route by.
+
+        """
+        return self.submit(input, config).result()
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None) -> Any:  # noqa: A002
+        """Run the swarm in the worker of the thread and wait for its output.
+
+        Waiting for the worker to accept the run doesn't block the event loop.
+        Cancelling the call doesn't cancel the run in the worker.
+
+        Args:
+            input: Input of the swarm.
+            config: Optional config of the run, with the `thread_id` to route by.
+
+        """
+        future = await asyncio.to_thread(self.submit, input, config)
+        return await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """Wait for the submitted runs to finish and stop the worker processes."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for requests in self._requests:
+            requests.put(None)
+        for process in self._processes:
+            process.join()
+        # wait until the exits of the workers are reported
+        for watcher in self._watchers.values():
+            watcher.join()
+        self._results.put(None)
+        self._collector.join()
+
+    def __enter__(self) -> Self:
+        """Use the pool as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pool."""
+        self.close()
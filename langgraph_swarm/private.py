@@ -0,0 +1,186 @@
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+from uuid import uuid4
+
+from langchain.messages import AIMessage, AnyMessage, ToolMessage
+from langgraph.errors import ParentCommand
+from langgraph.types import Send
+
+from langgraph_swarm.fanout import FANOUT_NODE
+from langgraph_swarm.handoff import _get_field, _get_trailing_handoffs
+
+# State key of the agents' private message histories.
+PRIVATE_MESSAGES_KEY = "agent_messages"
+# Response metadata key of the shared messages a private message was added after.
+METADATA_KEY_SEEN_MESSAGES = "__swarm_seen_messages"
+
+
+def _merge_private_messages(
+    left: dict[str, list[AnyMessage]] | None,
+    right: dict[str, list[AnyMessage]] | None,
+) -> dict[str, list[AnyMessage]]:
+    """Reducer of the private message histories: replace the histories of the updated agents."""
+    return {**(left or {}), **(right or {})}
+
+
+def _get_private_messages(state: Any, agent_name: str) -> list[AnyMessage]:
+    if isinstance(state, dict):
+        private_messages = state.get(PRIVATE_MESSAGES_KEY)
+    else:
+        private_messages = getattr(state, PRIVATE_MESSAGES_KEY, None)
+    return list((private_messages or {}).get(agent_name, []))
+
+
+def _get_private_history(state: Any, agent_name: str) -> list[AnyMessage]:
+    """Get an agent's view of the history: the shared history with its private messages.
+
+    The private history only holds the agent's own tool calls and results, each
+    marked with the last shared message the agent had seen when it added them. They
+    are interleaved with the shared messages after that message, and replace the
+    published copies of the agent's handoffs.
+    """
+    messages: list[AnyMessage] = _get_field(state, "messages")
+    private_messages = _get_private_messages(state, agent_name)
+    if not private_messages:
+        return list(messages)
+
+    positions = {message.id: i for i, message in enumerate(messages)}
+    private_ids = {message.id for message in private_messages}
+    following: dict[int, list[AnyMessage]] = {}
+    position = -1
+    for message in private_messages:
+        seen_ids = message.response_metadata.get(METADATA_KEY_SEEN_MESSAGES, [])
+        # the last messages may have been removed since, e.g. collapsed handoffs
+        seen_positions = [positions[id_] for id_ in seen_ids if id_ in positions]
+        if seen_positions:
+            position = max(position, seen_positions[-1])
+        following.setdefault(position, []).append(message)
+
+    history = following.get(-1, [])
+    for i, message in enumerate(messages):
+        if message.id not in private_ids:
+            history.append(message)
+        history.extend(following.get(i, []))
+    return history
+
+
+def _add_private_messages(
+    state: Any, agent_name: str, messages: Sequence[AnyMessage]
+) -> dict[str, list[AnyMessage]]:
+    """Get the update that adds an agent's new messages to its private history.
+
+    The final responses are only kept in the shared history. The other messages are
+    marked with the last shared messages: the trailing handoffs, if any, and the
+    message before them, so that they can still be placed once the handoffs are
+    collapsed.
+    """
+    shared_messages: list[AnyMessage] = _get_field(state, "messages")
+    handoffs = _get_trailing_handoffs(shared_messages)
+    seen_ids = [message.id for message in shared_messages[-(2 * len(handoffs) + 1) :]]
+    published_ids = {message.id for message in _get_published_messages(messages)}
+    new_messages = [
+        message.model_copy(
+            update={
+                "response_metadata": {
+                    **message.response_metadata,
+                    METADATA_KEY_SEEN_MESSAGES: seen_ids,
+                }
+            }
+        )
+        for message in messages
+        if message.id not in published_ids
+    ]
+    return {agent_name: [*_get_private_messages(state, agent_name), *new_messages]}
+
+
+def _get_published_messages(messages: Sequence[AnyMessage]) -> list[AnyMessage]:
+    """Get the messages an agent publishes to the shared history: its final responses."""
+    return [
+        message
+        for message in messages
+        if isinstance(message, AIMessage) and not message.tool_calls
+    ]
+
+
+def _get_tool_call_message(
+    messages: Sequence[AnyMessage], tool_call_id: str
+) -> AIMessage | None:
+    """Get the message with a tool call, without the other tool calls it contains."""
+    for message in reversed(messages):
+        if not isinstance(message, AIMessage):
+            continue
+        tool_calls = [
+            tool_call
+            for tool_call in message.tool_calls
+            if tool_call["id"] == tool_call_id
+        ]
+        if tool_calls:
+            # the results of the other tool calls stay private
+            return message.model_copy(update={"tool_calls": tool_calls})
+    return None
+
+
+def _with_ids(messages: Sequence[AnyMessage]) -> list[AnyMessage]:
+    """Give the messages IDs, so that the shared and private copies have the same ones."""
+    return [
+        message
+        if message.id is not None
+        else message.model_copy(update={"id": str(uuid4())})
+        for message in messages
+    ]
+
+
+def _publish_handoff(
+    error: ParentCommand,
+    state: Any,
+    agent_name: str,
+    known_messages: Sequence[AnyMessage],
+) -> ParentCommand:
+    """Keep the tool traffic of a handoff or fan-out made by an agent with a private history.
+
+    Only the handoff itself (the handoff tool call and tool message), or the fan-out
+    tool call, is published to the shared history, and the rest of the messages
+    transferred by the command are added to the agent's private history instead.
+    """
+    command = error.args[0]
+    known_ids = {message.id for message in known_messages}
+    if isinstance(command.update, dict) and "messages" in command.update:
+        messages = _with_ids(command.update["messages"])
+        published: list[AnyMessage] = []
+        if messages and isinstance(tool_message := messages[-1], ToolMessage):
+            tool_call_id = tool_message.tool_call_id
+            if (message := _get_tool_call_message(messages, tool_call_id)) is not None:
+                published.append(message)
+            published.append(tool_message)
+        update = {**command.update, "messages": published}
+    else:
+        gotos = command.goto if isinstance(command.goto, list) else [command.goto]
+        sends = [
+            goto
+            for goto in gotos
+            if isinstance(goto, Send)
+            and goto.node == FANOUT_NODE
+            and "messages" in goto.arg
+        ]
+        if not sends:
+            return error
+        # the messages of a fan-out are passed along with its first task
+        task = sends[0].arg
+        messages = _with_ids(task["messages"])
+        message = _get_tool_call_message(messages, task["tool_call_id"])
+        first_send = Send(
+            FANOUT_NODE,
+            {**task, "messages": [] if message is None else [message]},
+        )
+        command = replace(
+            command,
+            goto=[first_send if goto is sends[0] else goto for goto in gotos],
+        )
+        update = dict(command.update or {})
+
+    new_messages = [message for message in messages if message.id not in known_ids]
+    update[PRIVATE_MESSAGES_KEY] = _add_private_messages(
+        state, agent_name, new_messages
+    )
+    return ParentCommand(replace(command, update=update))
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langgraph.config import get_config
+from typing_extensions import override
+
+from langgraph_swarm.metrics import _get_agent_name
+
+# Default maximum number of responses to keep in memory.
+RESPONSE_CACHE_SIZE = 1024
+
+# Message fields that don't change the response, e.g. token usage reported by the provider.
+_IGNORED_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+
+@dataclass(frozen=True)
+class ResponseCacheInfo:
+    """Statistics of a `SwarmResponseCache`."""
+
+    hits: int
+    """Number of lookups that returned a cached response."""
+
+    misses: int
+    """Number of lookups that didn't find a (fresh) cached response."""
+
+    size: int
+    """Number of responses in the in-memory cache."""
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Normalize a serialized model input, so that equivalent inputs get the same key."""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+    for message in messages:
+        kwargs = message.get("kwargs") if isinstance(message, dict) else None
+        if isinstance(kwargs, dict):
+            for field in _IGNORED_MESSAGE_FIELDS:
+                kwargs.pop(field, None)
+    return json.dumps(messages, sort_keys=True)
+
+
+def _get_current_agent_name() -> str:
+    """Get the name of the swarm agent making the current model call, if any."""
+    try:
+        config = get_config()
+    except RuntimeError:
+        return ""
+    return _get_agent_name(config.get("metadata")) or ""
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    return json.dumps(
+        [
+            {
+                "message": message_to_dict(
+                    # a fresh id is assigned to each cached response when it is added
+                    # to the history, so that repeated responses don't replace each other
+                    generation.message.model_copy(update={"id": None})
+                ),
+                "generation_info": generation.generation_info,
+            }
+            if isinstance(generation, ChatGeneration)
+            else {
+                "text": generation.text,
+                "generation_info": generation.generation_info,
+            }
+            for generation in generations
+        ],
+        default=str,
+    )
+
+
+def _load_generations(value: str) -> list[Generation]:
+    generations: list[Generation] = []
+    for item in json.loads(value):
+        if "message" in item:
+            (message,) = messages_from_dict([item["message"]])
+            generations.append(
+                ChatGeneration(message=message, generation_info=item["generation_info"])
+            )
+        else:
+            generations.append(
+                Generation(text=item["text"], generation_info=item["generation_info"])
+            )
+    return generations
+
+
+class SwarmResponseCache(BaseCache):
+    """Exact-match cache of the responses of the swarm agents' models.
+
+    Responses are keyed by a hash of the name of the agent making the call and of
+    the normalized model input: the messages (including the system prompt), the
+    bound tools and the model parameters. Message ids and provider metadata (e.g.
+    token usage) are ignored, so replaying the same conversation hits the cache.
+    Cached responses contain the same tool calls, including handoffs, so the swarm
+    routes exactly as it did the first time.
+
+    Responses are kept in memory, with least-recently-used eviction, and optionally
+    persisted in a SQLite database, so they survive restarts. The on-disk cache is
+    not bounded in size, but expired responses are removed when they are looked up.
+
+    Pass the cache to the agents' chat models, or use it for all models with
+    `set_llm_cache`.
+
+    Example:
+        ```python
+        cache = SwarmResponseCache(path="responses.sqlite", ttl=24 * 60 * 60)
+        alice = create_agent(
+            ChatOpenAI(model="gpt-4o", cache=cache),
+            tools=[create_handoff_tool(agent_name="Bob")],
+            name="Alice",
+        )
+        ...
+        print(cache.info())
+        ```
+
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        path: str | Path | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep in memory.
+            path: Optional path of a SQLite database to persist the responses in.
+            ttl: Optional time to live of the cached responses, in seconds.
+
+        """
+        if maxsize < 1:
+            msg = "maxsize must be a positive integer"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS swarm_response_cache "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+
+    def _get_key(self, prompt: str, llm_string: str) -> str:
+        payload = "\0".join(
+            (_get_current_agent_name(), _normalize_prompt(prompt), llm_string)
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _get(self, key: str) -> str | None:
+        if (entry := self._entries.get(key)) is None and self._connection is not None:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM swarm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                entry = self._entries[key] = row
+        if entry is None:
+            return None
+
+        value, created_at = entry
+        if self._is_expired(created_at):
+            self._delete(key)
+            return None
+        self._entries.move_to_end(key)
+        self._evict()
+        return value
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._connection is not None:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM swarm_response_cache WHERE key = ?", (key,)
+                )
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @override
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Look up the cached response of a model input."""
+        key = self._get_key(prompt, llm_string)
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return _load_generations(value)
+
+    @override
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Cache the response of a model input."""
+        key = self._get_key(prompt, llm_string)
+        value = _dump_generations(return_val)
+        created_at = time.time()
+        with self._lock:
+            self._entries[key] = (value, created_at)
+            self._entries.move_to_end(key)
+            self._evict()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO swarm_response_cache VALUES (?, ?, ?)",
+                        (key, value, created_at),
+                    )
+
+    @override
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all cached responses, also from disk, and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM swarm_response_cache")
+
+    def info(self) -> ResponseCacheInfo:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return ResponseCacheInfo(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
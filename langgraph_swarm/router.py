@@ -0,0 +1,74 @@
+import re
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain.messages import HumanMessage
+
+from langgraph_swarm.handoff import _get_field
+
+PreRouter = Callable[[Any], str | None]
+"""A function that picks the agent to route to at the start of a turn.
+
+It is called with the swarm state and returns the name of the agent to route to,
+or `None` to route to the currently active agent.
+"""
+
+
+def create_keyword_router(
+    rules: dict[str, Sequence[str | re.Pattern[str]]],
+    *,
+    case_sensitive: bool = False,
+) -> PreRouter:
+    """Create a pre-router that routes based on keywords or regular expressions.
+
+    The rules are checked against the latest human message, in order, and the
+    first agent with a matching rule is selected. If the latest message is not a
+    human message, or no rule matches, the currently active agent is used.
+
+    Args:
+        rules: Keywords or regular expressions, keyed by agent name.
+
+            Keywords match whole words, e.g. `"flight"` matches
+            `"book a flight"`, but not `"flights"`.
+        case_sensitive: Whether keywords are matched case-sensitively.
+            Compiled regular expressions are used as is.
+
+    Example:
+        ```python
+        router = create_keyword_router(
+            {
+                "flights": ["flight", "airport", re.compile(r"[A-Z]{2}[0-9]{3,4}")],
+                "hotels": ["hotel", "room"],
+            }
+        )
+        workflow = create_swarm(
+            [flights, hotels, triage],
+            default_active_agent="triage",
+            pre_router=router,
+        )
+        ```
+
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    patterns: list[tuple[str, list[re.Pattern[str]]]] = []
+    for agent_name, agent_rules in rules.items():
+        keywords = [rule for rule in agent_rules if isinstance(rule, str)]
+        agent_patterns = [rule for rule in agent_rules if isinstance(rule, re.Pattern)]
+        if keywords:
+            # all keywords of an agent are matched with a single regular expression
+            keyword_pattern = "|".join(rf"\b{re.escape(word)}\b" for word in keywords)
+            agent_patterns.insert(0, re.compile(keyword_pattern, flags))
+        patterns.append((agent_name, agent_patterns))
+
+    def route(state: Any) -> str | None:
+        messages = _get_field(state, "messages")
+        if not messages or not isinstance(messages[-1], HumanMessage):
+            return None
+
+        text = messages[-1].text
+        for agent_name, agent_patterns in patterns:
+            if any(pattern.search(text) for pattern in agent_patterns):
+                return agent_name
+        return None
+
+    return route
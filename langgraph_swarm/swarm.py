@@ -1,13 +1,61 @@
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from types import UnionType
-from typing import Literal, Union, cast, get_args, get_origin
+from typing import Annotated, Literal, Union, cast, get_args, get_origin
 from warnings import warn
 
+from langchain.messages import AnyMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph._internal._typing import DeprecatedKwargs
+from langgraph.errors import GraphBubbleUp, ParentCommand
 from langgraph.graph import START, MessagesState, StateGraph
 from langgraph.pregel import Pregel
+from langgraph.types import Command
+from pydantic import BaseModel
 from typing_extensions import Any, TypeVar, Unpack
 
-from langgraph_swarm.handoff import get_handoff_destinations
+from langgraph_swarm.context import ContextPolicy
+from langgraph_swarm.deadline import (
+    TurnDeadline,
+    _DeadlineExceededError,
+    _end_turn_at_deadline,
+    _wait_until_deadline,
+    get_remaining_time,
+)
+from langgraph_swarm.ephemeral import _get_ephemeral_config
+from langgraph_swarm.fallback import (
+    AgentFallbacks,
+    _apply_agent_fallback,
+    _validate_agent_fallbacks,
+)
+from langgraph_swarm.fanout import (
+    FANOUT_JOIN_NODE,
+    FANOUT_NODE,
+    FanoutState,
+    _check_fanout_tools,
+    _create_fanout_node,
+    _join_fanout_results,
+    has_fanout_tools,
+)
+from langgraph_swarm.handoff import (
+    _collapse_handoffs,
+    _get_field,
+    _get_handoff_brief_message,
+    _get_hidden_history_destinations,
+    get_handoff_destinations,
+)
+from langgraph_swarm.lazy import LazyAgent
+from langgraph_swarm.limits import HandoffLimit, _apply_handoff_limit
+from langgraph_swarm.private import (
+    PRIVATE_MESSAGES_KEY,
+    _add_private_messages,
+    _get_private_history,
+    _get_published_messages,
+    _merge_private_messages,
+    _publish_handoff,
+)
+from langgraph_swarm.router import PreRouter
 
 
 class SwarmState(MessagesState):
@@ -18,16 +66,34 @@ class SwarmState(MessagesState):
     # If active agent is typed as a `str`, we turn it into enum of all active agent names.
     active_agent: str | None
 
+    # NOTE: only used by agents with private message histories (see `create_swarm`).
+    agent_messages: Annotated[dict[str, list[AnyMessage]], _merge_private_messages]
+
 
 StateSchema = TypeVar("StateSchema", bound=SwarmState)
 StateSchemaType = type[StateSchema]
 
 
+# Maximum number of specialized state schemas to keep around.
+STATE_SCHEMA_CACHE_SIZE = 128
+
+
 def _update_state_schema_agent_names(
     state_schema: StateSchemaType,
     agent_names: list[str],
 ) -> StateSchemaType:
-    """Update the state schema to use `Literal` with agent names for 'active_agent'."""
+    """Update the state schema to use `Literal` with agent names for 'active_agent'.
+
+    Specialized schemas are interned, so identical swarms share a single schema class.
+    """
+    return _specialize_state_schema(state_schema, tuple(agent_names))  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=STATE_SCHEMA_CACHE_SIZE)
+def _specialize_state_schema(
+    state_schema: StateSchemaType,
+    agent_names: tuple[str, ...],
+) -> StateSchemaType:
     active_agent_annotation = state_schema.__annotations__.get("active_agent")
     if active_agent_annotation is None:
         msg = "Missing required key 'active_agent' in state_schema"
@@ -58,7 +124,7 @@ def _update_state_schema_agent_names(
     )
 
     # Create the Literal type with agent names
-    literal_type = cast("type", Literal.__getitem__(tuple(agent_names)))
+    literal_type = cast("type", Literal.__getitem__(agent_names))
 
     # If it was Optional[str], make it Optional[Literal[...]]
     if is_optional_str:
@@ -69,11 +135,183 @@ def _update_state_schema_agent_names(
     return updated_schema
 
 
+def _state_to_dict(state: Any) -> dict[str, Any]:
+    """Shallow-convert a dictionary, dataclass or Pydantic model state to a dictionary."""
+    if isinstance(state, dict):
+        return state
+    if isinstance(state, BaseModel):
+        return dict(state)
+    if is_dataclass(state):
+        return {field.name: getattr(state, field.name) for field in fields(state)}
+    msg = f"Unsupported type for state: {type(state)}"
+    raise TypeError(msg)
+
+
+def _create_agent_node(  # noqa: C901, PLR0913, PLR0915
+    agent: Pregel | LazyAgent,
+    *,
+    context_policy: ContextPolicy | None = None,
+    handoff_messages: Literal["keep", "compact", "drop"] = "keep",
+    handoff_limit: HandoffLimit | None = None,
+    private_messages: bool = False,
+    ephemeral: bool = False,
+    turn_deadline: TurnDeadline | None = None,
+    agent_fallbacks: AgentFallbacks | None = None,
+) -> RunnableLambda:
+    """Wrap an agent to control which messages it sees and which ones it writes back.
+
+    The agent sees the messages selected by its context policy (or the full history),
+    and its output is reduced to the messages it produced, so the swarm's message
+    history stays intact. When the agent replies, it becomes the active agent, and
+    if requested, the handoffs that led to the agent are collapsed.
+
+    If the agent was activated by a handoff that hides the message history, it only
+    sees the handoff's brief instead.
+
+    If the agent has a private message history, it sees the shared history with its
+    private messages interleaved, and only publishes its final responses and handoffs
+    to the shared history. Its tool calls and results stay in its private history.
+
+    If the handoff that led to the agent exceeds the handoff limit, the agent is not
+    invoked, and the swarm routes to the fallback agent or ends the turn instead.
+
+    If the agent is ephemeral, it runs without checkpoints.
+
+    If the turn's deadline is near, the agent is not invoked, and the turn ends with
+    the best partial answer instead. In async runs, the agent is also cancelled when
+    the deadline passes.
+
+    If the agent fails and has a fallback agent, the swarm routes to the fallback
+    agent instead.
+    """
+
+    def _check_handoff_limit(state: Any) -> Command | None:
+        if handoff_limit is None:
+            return None
+        messages = _get_field(state, "messages")
+        return _apply_handoff_limit(messages, handoff_limit, agent.name)
+
+    def _check_deadline(state: Any, remaining: float | None) -> Command | None:
+        if turn_deadline is None or remaining is None:
+            return None
+        if remaining > turn_deadline.min_remaining_seconds:
+            return None
+        return _end_turn_at_deadline(_get_field(state, "messages"), turn_deadline)
+
+    def _fall_back(error: Exception) -> Command:
+        if agent_fallbacks is None or (
+            (command := _apply_agent_fallback(agent_fallbacks, agent.name, error))
+            is None
+        ):
+            raise error
+        return command
+
+    def _get_history(state: Any) -> list[AnyMessage]:
+        if private_messages:
+            return _get_private_history(state, agent.name)
+        return cast("list[AnyMessage]", _get_field(state, "messages"))
+
+    def _prepare_input(
+        state: Any, history: list[AnyMessage]
+    ) -> tuple[Any, list[AnyMessage]]:
+        messages = _get_field(state, "messages")
+        if (brief := _get_handoff_brief_message(messages, agent.name)) is not None:
+            window: list[AnyMessage] = [brief]
+        elif context_policy is not None:
+            window = context_policy(history, agent.name)
+        elif not private_messages:
+            return state, messages
+        else:
+            window = history
+        return {**_state_to_dict(state), "messages": window}, window
+
+    def _prepare_output(output: Any, state: Any, window: list[AnyMessage]) -> Any:
+        if not isinstance(output, dict) or "messages" not in output:
+            return output
+
+        window_ids = {message.id for message in window}
+        new_messages = [
+            message for message in output["messages"] if message.id not in window_ids
+        ]
+        update: dict[str, Any] = {}
+        if private_messages:
+            update[PRIVATE_MESSAGES_KEY] = _add_private_messages(
+                state, agent.name, new_messages
+            )
+            new_messages = _get_published_messages(new_messages)
+        if handoff_messages != "keep":
+            new_messages = [
+                *_collapse_handoffs(_get_field(state, "messages"), handoff_messages),
+                *new_messages,
+            ]
+        # the agent may have been selected by a pre-router instead of a handoff
+        return {
+            **output,
+            **update,
+            "messages": new_messages,
+            "active_agent": agent.name,
+        }
+
+    def call_agent(state: Any, config: RunnableConfig) -> Any:
+        if (command := _check_handoff_limit(state)) is not None:
+            return command
+        remaining = get_remaining_time(config) if turn_deadline else None
+        if (command := _check_deadline(state, remaining)) is not None:
+            return command
+        history = _get_history(state)
+        agent_input, window = _prepare_input(state, history)
+        if ephemeral:
+            config = _get_ephemeral_config(config)
+        try:
+            output = agent.invoke(agent_input, config)
+        except ParentCommand as e:
+            if not private_messages:
+                raise
+            known_messages = [*history, *window]
+            raise _publish_handoff(e, state, agent.name, known_messages) from None
+        except GraphBubbleUp:
+            raise
+        except Exception as e:  # noqa: BLE001
+            return _fall_back(e)
+        return _prepare_output(output, state, window)
+
+    async def acall_agent(state: Any, config: RunnableConfig) -> Any:
+        if (command := _check_handoff_limit(state)) is not None:
+            return command
+        remaining = get_remaining_time(config) if turn_deadline else None
+        if (command := _check_deadline(state, remaining)) is not None:
+            return command
+        history = _get_history(state)
+        agent_input, window = _prepare_input(state, history)
+        if ephemeral:
+            config = _get_ephemeral_config(config)
+        try:
+            output = await _wait_until_deadline(
+                agent.ainvoke(agent_input, config), remaining
+            )
+        except _DeadlineExceededError:
+            messages = _get_field(state, "messages")
+            return _end_turn_at_deadline(messages, cast("TurnDeadline", turn_deadline))
+        except ParentCommand as e:
+            if not private_messages:
+                raise
+            known_messages = [*history, *window]
+            raise _publish_handoff(e, state, agent.name, known_messages) from None
+        except GraphBubbleUp:
+            raise
+        except Exception as e:  # noqa: BLE001
+            return _fall_back(e)
+        return _prepare_output(output, state, window)
+
+    return RunnableLambda(call_agent, afunc=acall_agent, name=agent.name)
+
+
 def add_active_agent_router(
     builder: StateGraph,
     *,
     route_to: list[str],
     default_active_agent: str,
+    pre_router: PreRouter | None = None,
 ) -> StateGraph:
     """Add a router to the currently active agent to the `StateGraph`.
 
@@ -81,6 +319,14 @@ def add_active_agent_router(
         builder: The graph builder (`StateGraph`) to add the router to.
         route_to: A list of agent (node) names to route to.
         default_active_agent: Name of the agent to route to by default (if no agents are currently active).
+        pre_router: Optional function that picks the agent to route to at the start of a turn,
+            before falling back to the currently active agent.
+
+            It is called with the graph state and returns the name of an agent,
+            or `None` to route to the currently active agent. Use it to send requests
+            that obviously belong to a specific agent straight to that agent
+            (e.g. with `create_keyword_router`), saving an LLM call to the active agent.
+            The agent nodes are responsible for updating `active_agent`.
 
     Returns:
         `StateGraph` with the router added.
@@ -161,18 +407,31 @@ def add_active_agent_router(
         )
 
     def route_to_active_agent(state: dict) -> str:
+        if pre_router is not None and (agent_name := pre_router(state)) is not None:
+            if agent_name not in route_to:
+                msg = f"Pre-router returned agent '{agent_name}' not found in routes {route_to}"
+                raise ValueError(msg)
+            return agent_name
         return cast("str", state.get("active_agent", default_active_agent))
 
     builder.add_conditional_edges(START, route_to_active_agent, path_map=route_to)
     return builder
 
 
-def create_swarm(  # noqa: D417
-    agents: list[Pregel],
+def create_swarm(  # noqa: C901, PLR0912, PLR0913, PLR0915
+    agents: Sequence[Pregel | LazyAgent],
     *,
     default_active_agent: str,
     state_schema: StateSchemaType = SwarmState,
     context_schema: type[Any] | None = None,
+    context_policies: dict[str, ContextPolicy] | None = None,
+    handoff_messages: Literal["keep", "compact", "drop"] = "keep",
+    handoff_limit: HandoffLimit | None = None,
+    pre_router: PreRouter | None = None,
+    private_messages: bool | Sequence[str] = False,
+    ephemeral_agents: bool = False,
+    turn_deadline: TurnDeadline | None = None,
+    agent_fallbacks: AgentFallbacks | None = None,
     **deprecated_kwargs: Unpack[DeprecatedKwargs],
 ) -> StateGraph:
     """Create a multi-agent swarm.
@@ -183,9 +442,76 @@ def create_swarm(  # noqa: D417
             An agent can be a LangGraph [`CompiledStateGraph`][langgraph.graph.state.CompiledStateGraph],
             a functional API [workflow][langgraph.func.entrypoint],
             or any other [Pregel][langgraph.pregel.Pregel] object.
+
+            An agent can also be a `LazyAgent`, which is only created when the swarm
+            first routes to it. Its handoff and fan-out destinations are declared
+            up front instead of being read from its tools.
         default_active_agent: Name of the agent to route to by default (if no agents are currently active).
         state_schema: State schema to use for the multi-agent graph.
         context_schema: Specifies the schema for the context object that will be passed to the workflow.
+        context_policies: Optional context policies, keyed by agent name.
+
+            A context policy selects the messages an agent sees when it is activated,
+            for example the last N messages (`keep_last_messages`), the messages
+            within a token budget (`keep_messages_within_tokens`), or the messages
+            since the agent was last active (`keep_messages_since_last_active`).
+            The swarm's message history is not modified. Agents without a policy
+            see the full message history.
+        handoff_messages: What to do with the handoff messages (the tool call that
+            triggered a handoff and the handoff tool message) once the agent that
+            received control replies.
+
+            - `"keep"` (default): keep them in the message history.
+            - `"compact"`: replace consecutive handoffs with a single marker message,
+                for example `[Handoff: Alice -> Bob]`.
+            - `"drop"`: remove them from the message history.
+
+            Text content of the handoff tool calls is always kept, and tool calls
+            always stay paired with their tool messages.
+        handoff_limit: Optional limits on the number of handoffs per turn and on
+            repeated handoffs between the same agents (ping-pong).
+
+            When a handoff exceeds the limits, the swarm routes to the limit's
+            fallback agent or ends the turn. See `HandoffLimit` for details.
+        pre_router: Optional function that picks the agent to route to at the start of a turn,
+            before falling back to the currently active agent.
+
+            It is called with the swarm state and returns the name of an agent, or `None`
+            to route to the currently active agent. Use it to send requests that obviously
+            belong to a specific agent straight to that agent, saving an LLM call to the
+            active agent. See `create_keyword_router` for a keyword/regex based pre-router.
+        private_messages: Whether agents keep their tool calls and results in private
+            message histories, either `True` for all agents or a list of agent names.
+
+            An agent with a private history only publishes its final responses and
+            its handoffs to the shared message history, so its tool traffic doesn't
+            end up in the other agents' prompts. It sees the shared history with its
+            own tool calls and results interleaved where it made them.
+            The private histories are stored in the `agent_messages` state key, and
+            only hold each agent's own messages.
+        ephemeral_agents: Whether to run the agent subgraphs without checkpoints.
+
+            By default, with a checkpointer, each agent subgraph writes a checkpoint
+            at every internal step (model call, tool call). With ephemeral agents,
+            only the swarm's own state (`messages`, `active_agent`, ...) is
+            checkpointed, which reduces the checkpoint writes and the latency of
+            each step. Conversations still resume with the last active agent, but an
+            agent can't be interrupted or resumed mid-run (e.g. with `interrupt`).
+            Invoke the swarm with `durability="exit"` to only checkpoint its state
+            at the end of each turn.
+        turn_deadline: Optional enforcement of the turn deadline set at invoke time
+            with `with_deadline`.
+
+            The deadline is carried through handoffs, and each agent can read its
+            remaining budget with `get_remaining_time`. When the deadline is near,
+            the swarm stops handing off and ends the turn with the best partial
+            answer instead of starting another agent. See `TurnDeadline` for details.
+        agent_fallbacks: Optional agents to route to when an agent fails, for
+            example because its model provider is down.
+
+            The fallback agent becomes the active agent and handles the same
+            messages. See `AgentFallbacks` for details, and `HedgedChatModel`
+            to hedge and fall back on the model calls of a single agent instead.
 
     Returns:
         A multi-agent swarm `StateGraph`.
@@ -267,23 +593,118 @@ def create_swarm(  # noqa: D417
         msg = f"Default active agent '{default_active_agent}' not found in agent names {agent_names}"
         raise ValueError(msg)
 
+    context_policies = context_policies or {}
+    if unknown_agents := set(context_policies) - set(agent_names):
+        msg = f"Context policies provided for unknown agents {sorted(unknown_agents)}"
+        raise ValueError(msg)
+
+    fallback_agent = handoff_limit.fallback_agent if handoff_limit else None
+    if fallback_agent is not None and fallback_agent not in agent_names:
+        msg = (
+            f"Fallback agent '{fallback_agent}' not found in agent names {agent_names}"
+        )
+        raise ValueError(msg)
+
+    if private_messages is True:
+        private_agents = set(agent_names)
+    else:
+        private_agents = set(private_messages or ())
+    if unknown_agents := private_agents - set(agent_names):
+        msg = f"Private messages requested for unknown agents {sorted(unknown_agents)}"
+        raise ValueError(msg)
+
+    if agent_fallbacks is not None:
+        _validate_agent_fallbacks(agent_fallbacks, agent_names)
+
     state_schema = _update_state_schema_agent_names(state_schema, agent_names)
     builder = StateGraph(state_schema, context_schema)
+    if private_agents and PRIVATE_MESSAGES_KEY not in builder.schemas[state_schema]:
+        msg = f"Missing required key '{PRIVATE_MESSAGES_KEY}' in state_schema"
+        raise ValueError(msg)
     add_active_agent_router(
         builder,
         route_to=agent_names,
         default_active_agent=default_active_agent,
+        pre_router=pre_router,
     )
+    # agents that only see a brief when they are activated by some handoffs.
+    # The tools of lazy agents are unknown up front, so any of their handoffs may.
+    brief_only_agents = {
+        destination
+        for agent in agents
+        for destination in (
+            agent.destinations
+            if isinstance(agent, LazyAgent)
+            else _get_hidden_history_destinations(agent)
+        )
+    }
+    fanout_callers: list[str] = []
     for agent in agents:
+        if isinstance(agent, LazyAgent):
+            # don't create the agent just to discover its handoff destinations
+            destinations = list(agent.destinations)
+        else:
+            # Need to update implementation to support Pregel objects
+            destinations = get_handoff_destinations(agent)  # type: ignore[arg-type]
+        if fallback_agent is not None and fallback_agent not in destinations:
+            destinations.append(fallback_agent)
+        if (
+            agent_fallbacks is not None
+            and (error_agent := agent_fallbacks.fallbacks.get(agent.name)) is not None
+            and error_agent not in destinations
+        ):
+            destinations.append(error_agent)
+        if not isinstance(agent, LazyAgent):
+            _check_fanout_tools(agent)
+        if (
+            agent.fanout_destinations
+            if isinstance(agent, LazyAgent)
+            else has_fanout_tools(agent)
+        ):
+            fanout_callers.append(agent.name)
+            destinations.append(FANOUT_NODE)
+
         builder.add_node(
             agent.name,
             # We need to update the type signatures in add_node to match
             # the fact that more flexible Pregel objects are allowed.
-            agent,
-            destinations=tuple(
-                # Need to update implementation to support Pregel objects
-                get_handoff_destinations(agent)  # type: ignore[arg-type]
-            ),
+            _create_agent_node(
+                agent,
+                context_policy=context_policies.get(agent.name),
+                handoff_messages=handoff_messages,
+                handoff_limit=handoff_limit,
+                private_messages=agent.name in private_agents,
+                ephemeral=ephemeral_agents,
+                turn_deadline=turn_deadline,
+                agent_fallbacks=agent_fallbacks,
+            )
+            if ephemeral_agents
+            or turn_deadline is not None
+            or (agent_fallbacks is not None and agent.name in agent_fallbacks.fallbacks)
+            or isinstance(agent, LazyAgent)
+            or agent.name in context_policies
+            or agent.name in private_agents
+            or agent.name in brief_only_agents
+            or handoff_messages != "keep"
+            or handoff_limit is not None
+            or pre_router is not None
+            else agent,
+            destinations=tuple(destinations),
+        )
+
+    if fanout_callers:
+        # tasks dispatched by fan-out tools run in parallel and are joined
+        # into a single tool message before returning to the calling agent
+        builder.add_node(
+            FANOUT_NODE,
+            _create_fanout_node(agents, fanout_callers, ephemeral=ephemeral_agents),
+        )
+        builder.add_node(
+            FANOUT_JOIN_NODE,
+            _join_fanout_results,
+            input_schema=FanoutState,
+            destinations=tuple(fanout_callers),
         )
+        builder.add_edge(FANOUT_NODE, FANOUT_JOIN_NODE)
 
     return builder
@@ -0,0 +1,303 @@
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from langchain.messages import ToolMessage
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langgraph.errors import ParentCommand
+from langgraph.types import Command
+from typing_extensions import override
+
+from langgraph_swarm.handoff import (
+    METADATA_KEY_HANDOFF_DESTINATION,
+    _is_handoff_message,
+)
+from langgraph_swarm.metrics import ROUTER_RUN_NAME, _get_agent_name
+
+SWARM_LANE = "swarm"
+
+
+class SwarmTraceCallbackHandler(BaseCallbackHandler):
+    """Callback handler that records a timeline of swarm runs as trace events.
+
+    Records a span for each run of the swarm, the router, the agents and their
+    nodes, LLM calls and tool calls, and an instant event for each handoff. Spans
+    are grouped into one lane (thread) per agent, so nested agent subgraphs and
+    parallel branches are easy to follow. The events use the Chrome trace event
+    format, and can be opened in Perfetto (https://ui.perfetto.dev) or
+    `chrome://tracing`.
+
+    Example:
+        ```python
+        tracer = SwarmTraceCallbackHandler()
+        app = create_swarm([alice, bob], default_active_agent="Alice").compile()
+        app.invoke(
+            {"messages": [{"role": "user", "content": "hi"}]},
+            {"callbacks": [tracer]},
+        )
+        tracer.save("swarm_trace.json")
+        ```
+
+    """
+
+    # recording an event is cheap, so it is run inline in async runs
+    run_inline = True
+
+    def __init__(self) -> None:
+        """Initialize the handler with an empty timeline."""
+        self._lock = Lock()
+        self._pid = os.getpid()
+        self._start = time.perf_counter()
+        self._events: list[dict[str, Any]] = []
+        self._lanes: dict[str, int] = {}
+        self._spans: dict[UUID, dict[str, Any]] = {}
+        # parents of the chain runs in progress, to find their enclosing span
+        self._chain_parents: dict[UUID, UUID] = {}
+        self._tool_lanes: dict[UUID, str] = {}
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """The recorded trace events."""
+        with self._lock:
+            return list(self._events)
+
+    def _now(self) -> float:
+        """Get the current timestamp in microseconds."""
+        return (time.perf_counter() - self._start) * 1_000_000
+
+    def _get_lane(self, name: str) -> int:
+        if name not in self._lanes:
+            self._lanes[name] = len(self._lanes) + 1
+            self._events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": self._lanes[name],
+                    "args": {"name": name},
+                }
+            )
+        return self._lanes[name]
+
+    def _start_span(
+        self,
+        run_id: UUID,
+        name: str,
+        category: str,
+        lane: str,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        with self._lock:
+            self._spans[run_id] = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": self._now(),
+                "pid": self._pid,
+                "tid": self._get_lane(lane),
+                "args": args or {},
+            }
+
+    def _end_span(self, run_id: UUID, args: dict[str, Any] | None = None) -> None:
+        with self._lock:
+            if (span := self._spans.pop(run_id, None)) is None:
+                return
+            span["dur"] = self._now() - span["ts"]
+            span["args"].update(args or {})
+            self._events.append(span)
+
+    def _end_span_with_error(self, run_id: UUID, error: BaseException) -> None:
+        # a `ParentCommand` is how agents hand off control, not a failure
+        if isinstance(error, ParentCommand):
+            self._end_span(run_id)
+        else:
+            self._end_span(run_id, {"error": repr(error)})
+
+    def _get_enclosing_span(self, run_id: UUID | None) -> dict[str, Any] | None:
+        while run_id is not None:
+            if (span := self._spans.get(run_id)) is not None:
+                return span
+            run_id = self._chain_parents.get(run_id)
+        return None
+
+    @override
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start a span for the swarm run, the router, or a (sub)graph node."""
+        name = kwargs.get("name") or "chain"
+        if parent_run_id is None:
+            self._start_span(run_id, name, "swarm", SWARM_LANE)
+            return
+        with self._lock:
+            self._chain_parents[run_id] = parent_run_id
+        if name == ROUTER_RUN_NAME:
+            self._start_span(run_id, name, "router", SWARM_LANE)
+            return
+
+        metadata = metadata or {}
+        node = metadata.get("langgraph_node")
+        # only record the nodes' runs, not the runnables they are made of
+        if node is None or name != node or node.startswith("__"):
+            return
+        with self._lock:
+            parent = self._get_enclosing_span(parent_run_id)
+        # the agent's graph runs within the node's run (possibly wrapped), with the
+        # same name
+        if parent is not None and parent["name"] == name:
+            return
+        lane = _get_agent_name(metadata) or SWARM_LANE
+        category = (
+            "agent"
+            if "|" not in metadata.get("langgraph_checkpoint_ns", "")
+            else "node"
+        )
+        self._start_span(run_id, name, category, lane)
+
+    @override
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """End the span of a chain run."""
+        with self._lock:
+            self._chain_parents.pop(run_id, None)
+        self._end_span(run_id, {"route": outputs} if isinstance(outputs, str) else None)
+
+    @override
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """End the span of a chain run that handed off control or failed."""
+        with self._lock:
+            self._chain_parents.pop(run_id, None)
+        self._end_span_with_error(run_id, error)
+
+    def _start_llm(
+        self, run_id: UUID, metadata: dict[str, Any] | None, serialized: Any
+    ) -> None:
+        name = (serialized or {}).get("name") or "llm"
+        self._start_span(run_id, name, "llm", _get_agent_name(metadata) or SWARM_LANE)
+
+    @override
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start the span of an LLM call."""
+        self._start_llm(run_id, metadata, serialized)
+
+    @override
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start the span of a chat model call."""
+        self._start_llm(run_id, metadata, serialized)
+
+    @override
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """End the span of an LLM call."""
+        self._end_span(run_id)
+
+    @override
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """End the span of a failed LLM call."""
+        self._end_span_with_error(run_id, error)
+
+    @override
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start the span of a tool call."""
+        name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+        lane = _get_agent_name(metadata) or SWARM_LANE
+        with self._lock:
+            self._tool_lanes[run_id] = lane
+        self._start_span(run_id, name, "tool", lane)
+
+    @override
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """End the span of a tool call, and record the handoff it made, if any."""
+        self._end_span(run_id)
+        with self._lock:
+            source = self._tool_lanes.pop(run_id, SWARM_LANE)
+        if not isinstance(output, Command) or not isinstance(output.update, dict):
+            return
+        messages = output.update.get("messages") or []
+        if not messages or not isinstance(messages[-1], ToolMessage):
+            return
+        if not _is_handoff_message(messages[-1]):
+            return
+
+        destination = messages[-1].response_metadata[METADATA_KEY_HANDOFF_DESTINATION]
+        with self._lock:
+            self._events.append(
+                {
+                    "name": f"handoff {source} -> {destination}",
+                    "cat": "handoff",
+                    "ph": "i",
+                    "s": "g",
+                    "ts": self._now(),
+                    "pid": self._pid,
+                    "tid": self._get_lane(source),
+                    "args": {"source": source, "destination": destination},
+                }
+            )
+
+    @override
+    def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """End the span of a failed tool call."""
+        with self._lock:
+            self._tool_lanes.pop(run_id, None)
+        self._end_span_with_error(run_id, error)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the timeline as a Chrome trace event JSON object."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> None:
+        """Write the timeline to a Chrome trace event JSON file.
+
+        Args:
+            path: Path of the file to write.
+
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), default=str))
+
+    def clear(self) -> None:
+        """Discard the recorded events."""
+        with self._lock:
+            self._start = time.perf_counter()
+            self._events = [event for event in self._events if event["ph"] == "M"]
+            self._spans.clear()
+            self._tool_lanes.clear()
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.chat_models import BaseChatModel
+from langchain.messages import AIMessage
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.messages.base import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.checkpoint.memory import MemorySaver
+from typing_extensions import override
+
+from langgraph_swarm import BatchStats, astream_batch, create_swarm
+
+
+class EchoChatModel(BaseChatModel):
+    """Fake chat model that echoes the last message, after an optional delay."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "echo-model"
+
+    def _reply(self, messages: list[BaseMessage]) -> ChatResult:
+        text = messages[-1].text
+        if text == "fail":
+            msg = "model error"
+            raise ValueError(msg)
+        message = AIMessage(content=f"echo: {text}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = messages[-1].text
+        if text.startswith("sleep"):
+            time.sleep(float(text.split()[1]))
+        return self._reply(messages)
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = messages[-1].text
+        if text.startswith("sleep"):
+            await asyncio.sleep(float(text.split()[1]))
+        return self._reply(messages)
+
+
+async def _collect(app: Any, items: Any, **kwargs: Any) -> list[Any]:
+    return [result async for result in astream_batch(app, items, **kwargs)]
+
+
+def test_astream_batch() -> None:
+    agent = create_agent(EchoChatModel(), tools=[], name="Alice")
+    app = create_swarm([agent], default_active_agent="Alice").compile(
+        checkpointer=MemorySaver()
+    )
+    contents = ["sleep 0.2", "hi", "fail", "sleep 5", "hello"]
+    items = [
+        (f"thread-{i}", {"messages": [{"role": "user", "content": content}]})
+        for i, content in enumerate(contents)
+    ]
+
+    stats = BatchStats()
+    results = asyncio.run(
+        _collect(app, items, max_concurrency=2, timeout=1, stats=stats)
+    )
+
+    # results are yielded in completion order
+    assert [result.thread_id for result in results] == [
+        "thread-1",
+        "thread-2",
+        "thread-0",
+        "thread-4",
+        "thread-3",
+    ]
+    by_thread = {result.thread_id: result for result in results}
+    assert by_thread["thread-1"].output["messages"][-1].content == "echo: hi"
+    assert isinstance(by_thread["thread-2"].error, ValueError)
+    assert isinstance(by_thread["thread-3"].error, asyncio.TimeoutError)
+    assert (stats.completed, stats.failed, stats.timed_out) == (3, 1, 1)
+    assert stats.threads_per_second > 0
+
+    # threads are checkpointed separately
+    config: Any = {"configurable": {"thread_id": "thread-4"}}
+    assert len(app.get_state(config).values["messages"]) == 2
+
+    # the same swarm also runs synchronously
+    result = app.invoke({"messages": [{"role": "user", "content": "sync"}]}, config)
+    assert result["messages"][-1].content == "echo: sync"
@@ -0,0 +1,86 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraph_swarm import SwarmCache, create_handoff_tool, keep_last_messages
+from tests.test_swarm import FakeChatModel
+
+
+def _make_agents() -> list[Any]:
+    model = FakeChatModel(responses=[])
+    return [
+        create_agent(
+            model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+        ),
+        create_agent(
+            model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+        ),
+    ]
+
+
+def test_swarm_cache() -> None:
+    agents = _make_agents()
+    checkpointer = MemorySaver()
+    cache = SwarmCache(maxsize=2)
+
+    app = cache.get_or_compile(
+        agents, default_active_agent="Alice", checkpointer=checkpointer
+    )
+    assert (
+        cache.get_or_compile(
+            list(agents), default_active_agent="Alice", checkpointer=checkpointer
+        )
+        is app
+    )
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+    assert info.memory_bytes > 0
+
+    # different options, agents or checkpointers are cached separately
+    policy = keep_last_messages(10)
+    other = cache.get_or_compile(
+        agents,
+        default_active_agent="Alice",
+        checkpointer=checkpointer,
+        context_policies={"Bob": policy},
+    )
+    assert other is not app
+    assert (
+        cache.get_or_compile(
+            agents,
+            default_active_agent="Alice",
+            checkpointer=checkpointer,
+            context_policies={"Bob": policy},
+        )
+        is other
+    )
+    cache.get_or_compile(agents, default_active_agent="Bob", checkpointer=checkpointer)
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (2, 3, 1, 2)
+
+    # the least recently used swarm was evicted
+    assert (
+        cache.get_or_compile(
+            agents, default_active_agent="Alice", checkpointer=checkpointer
+        )
+        is not app
+    )
+
+    cache.clear()
+    assert cache.info().size == 0
+
+
+def test_swarm_cache_memory_limit() -> None:
+    cache = SwarmCache(max_memory_bytes=1)
+    cache.get_or_compile(_make_agents(), default_active_agent="Alice")
+    cache.get_or_compile(_make_agents(), default_active_agent="Alice")
+    # the most recent swarm is always kept
+    info = cache.info()
+    assert (info.size, info.evictions) == (1, 1)
+
+
+def test_swarm_cache_invalid_size() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        SwarmCache(maxsize=0)
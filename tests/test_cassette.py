@@ -0,0 +1,89 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.chat_models import BaseChatModel
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import (
+    Cassette,
+    CassetteRecorder,
+    ReplayChatModel,
+    create_handoff_tool,
+    create_swarm,
+)
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app(model: BaseChatModel) -> Any:
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    return create_swarm([alice, bob], default_active_agent="Alice").compile(
+        checkpointer=InMemorySaver()
+    )
+
+
+INPUT = {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]}
+
+
+def test_record_and_replay(tmp_path: Path) -> None:
+    model = FakeChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob"),
+        ]
+    )
+    recorder = CassetteRecorder()
+    recorded = _make_app(model).invoke(
+        INPUT, {"configurable": {"thread_id": "1"}, "callbacks": [recorder]}
+    )
+    assert {agent: len(r) for agent, r in recorder.cassette.responses.items()} == {
+        "Alice": 1,
+        "Bob": 1,
+    }
+    recorder.cassette.save(tmp_path / "cassette.json")
+
+    replay_model = ReplayChatModel(cassette=Cassette.load(tmp_path / "cassette.json"))
+    app = _make_app(replay_model)
+
+    async def replay() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                app.ainvoke(INPUT, {"configurable": {"thread_id": str(i)}})
+                for i in range(3)
+            )
+        )
+
+    results = [
+        app.invoke(INPUT, {"configurable": {"thread_id": "a"}}),
+        *asyncio.run(replay()),
+    ]
+    # each thread replays the responses from the start
+    for result in results:
+        assert [m.content for m in result["messages"]] == [
+            m.content for m in recorded["messages"]
+        ]
+        assert result["messages"][1].tool_calls[0]["name"] == "transfer_to_bob"
+        assert result["active_agent"] == "Bob"
+    # no cursors are kept for the threads that replayed all the responses
+    assert replay_model._cursors == {}  # noqa: SLF001
+
+
+def test_replay_without_recorded_responses(tmp_path: Path) -> None:
+    app = _make_app(ReplayChatModel(cassette=Cassette(responses={"Bob": []})))
+    with pytest.raises(ValueError, match="No recorded responses for agent 'Alice'"):
+        app.invoke(INPUT, {"configurable": {"thread_id": "1"}})
+
+    (tmp_path / "cassette.json").write_text('{"version": 0}')
+    with pytest.raises(ValueError, match="Unsupported cassette version"):
+        Cassette.load(tmp_path / "cassette.json")
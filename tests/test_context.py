@@ -0,0 +1,152 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages.base import BaseMessage
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraph_swarm import (
+    create_handoff_tool,
+    create_swarm,
+    keep_last_messages,
+    keep_messages_since_last_active,
+    keep_messages_within_tokens,
+)
+from tests.test_swarm import FakeChatModel
+
+
+class RecordingChatModel(FakeChatModel):
+    inputs: list[list[BaseMessage]] = []  # noqa: RUF012
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> Any:
+        self.inputs.append(messages)
+        return super()._generate(messages, *args, **kwargs)
+
+
+def _make_history() -> list:
+    return [
+        HumanMessage(content="hi", id="1"),
+        AIMessage(
+            content="",
+            name="Alice",
+            id="2",
+            tool_calls=[{"name": "add", "args": {"a": 1, "b": 2}, "id": "call_1"}],
+        ),
+        ToolMessage(content="3", id="3", tool_call_id="call_1"),
+        AIMessage(
+            content="",
+            name="Alice",
+            id="4",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_2"}],
+        ),
+        ToolMessage(
+            content="Successfully transferred to Bob",
+            id="5",
+            tool_call_id="call_2",
+            response_metadata={"__handoff_destination": "Bob"},
+        ),
+        AIMessage(content="Hi, I'm Bob", name="Bob", id="6"),
+        HumanMessage(content="thanks", id="7"),
+    ]
+
+
+def test_keep_last_messages() -> None:
+    history = _make_history()
+    assert [m.id for m in keep_last_messages(1)(history, "Bob")] == ["7"]
+    # windows that don't start with a user message start with a note instead
+    window = keep_last_messages(2)(history, "Bob")
+    assert isinstance(window[0], HumanMessage)
+    assert window[0].content == "5 earlier messages of the conversation are not shown."
+    assert [m.id for m in window[1:]] == ["6", "7"]
+    # tool messages are kept together with their tool call
+    window = keep_last_messages(3)(history, "Bob")
+    assert window[0].content == "3 earlier messages of the conversation are not shown."
+    assert [m.id for m in window[1:]] == ["4", "5", "6", "7"]
+    window = keep_last_messages(5)(history, "Bob")
+    assert [m.id for m in window[1:]] == ["2", "3", "4", "5", "6", "7"]
+    assert len(keep_last_messages(100)(history, "Bob")) == len(history)
+
+    with pytest.raises(ValueError, match="n must be a positive integer"):
+        keep_last_messages(0)
+
+
+def test_keep_messages_within_tokens() -> None:
+    history = _make_history()
+    policy = keep_messages_within_tokens(2, token_counter=len)
+    window = policy(history, "Bob")
+    assert window[0].content == "5 earlier messages of the conversation are not shown."
+    assert [m.id for m in window[1:]] == ["6", "7"]
+    # the last message is always kept
+    policy = keep_messages_within_tokens(0, token_counter=len)
+    assert [m.id for m in policy(history, "Bob")] == ["7"]
+
+
+def test_keep_messages_since_last_active() -> None:
+    history = _make_history()
+    window = keep_messages_since_last_active()(history, "Alice")
+    assert [m.id for m in window[1:]] == ["4", "5", "6", "7"]
+    assert window[0].content == (
+        "3 earlier messages of the conversation are not shown. "
+        "Handoffs since you were last active: Bob."
+    )
+
+    window = keep_messages_since_last_active(summarize=False)(history, "Alice")
+    assert [m.id for m in window] == ["4", "5", "6", "7"]
+    # agents that have not been active yet see the full history
+    assert keep_messages_since_last_active()(history, "Charlie") == history
+
+
+def test_swarm_with_context_policy() -> None:
+    model = RecordingChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob", name="Bob"),
+        ]
+    )
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    workflow = create_swarm(
+        [alice, bob],
+        default_active_agent="Alice",
+        context_policies={"Bob": keep_last_messages(1)},
+    )
+    app = workflow.compile(checkpointer=MemorySaver())
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]},  # type: ignore[arg-type]
+        {"configurable": {"thread_id": "1"}},
+    )
+
+    # Bob only sees the handoff...
+    assert [m.content for m in model.inputs[1]] == [
+        "1 earlier messages of the conversation are not shown.",
+        "",
+        "Successfully transferred to Bob",
+    ]
+    # ...while the swarm keeps the full history
+    assert [m.content for m in result["messages"]] == [
+        "i'd like to speak to Bob",
+        "",
+        "Successfully transferred to Bob",
+        "Hi, I'm Bob",
+    ]
+    assert result["active_agent"] == "Bob"
+
+
+def test_context_policy_for_unknown_agent() -> None:
+    alice: Any = create_agent(FakeChatModel(responses=[]), tools=[], name="Alice")
+    with pytest.raises(ValueError, match="unknown agents"):
+        create_swarm(
+            [alice],
+            default_active_agent="Alice",
+            context_policies={"Bob": keep_last_messages(1)},
+        )
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import (
+    TurnDeadline,
+    create_handoff_tool,
+    create_swarm,
+    get_remaining_time,
+    with_deadline,
+)
+from tests.test_swarm import FakeChatModel
+
+INPUT = {"messages": [{"role": "user", "content": "book a flight and a hotel"}]}
+
+
+def _make_app(model: FakeChatModel, tool: Any, *, deadline: TurnDeadline) -> Any:
+    alice: Any = create_agent(
+        model, tools=[tool, create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(model, tools=[tool], name="Bob")
+    return create_swarm(
+        [alice, bob], default_active_agent="Alice", turn_deadline=deadline
+    ).compile(checkpointer=InMemorySaver())
+
+
+def test_deadline_stops_handoffs() -> None:
+    budgets: list[float | None] = []
+
+    def book_flight() -> str:
+        """Book a flight."""
+        budgets.append(get_remaining_time())
+        time.sleep(0.6)
+        return "Booked"
+
+    def make_model() -> FakeChatModel:
+        return FakeChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "book_flight", "args": {}, "id": "call_1"}],
+                ),
+                AIMessage(
+                    content="Your flight is booked.",
+                    name="Alice",
+                    tool_calls=[
+                        {"name": "transfer_to_bob", "args": {}, "id": "call_2"}
+                    ],
+                ),
+                AIMessage(content="Your hotel is booked.", name="Bob"),
+            ]
+        )
+
+    deadline = TurnDeadline(min_remaining_seconds=0.5)
+    model = make_model()
+    result = _make_app(model, book_flight, deadline=deadline).invoke(
+        INPUT, with_deadline(1.0, {"configurable": {"thread_id": "1"}})
+    )
+    # Bob is not started, the turn ends with Alice's partial answer
+    assert model.idx == 2
+    assert [m.content for m in result["messages"]] == [
+        "book a flight and a hotel",
+        "",
+        "Booked",
+        "Your flight is booked.",
+        "Successfully transferred to Bob",
+    ]
+    assert result["active_agent"] == "Bob"
+    assert budgets[0] is not None
+    assert 0.5 < budgets[0] <= 1.0
+
+    # without a deadline, the turn runs to completion
+    model = make_model()
+    result = _make_app(model, book_flight, deadline=deadline).invoke(
+        INPUT, {"configurable": {"thread_id": "1"}}
+    )
+    assert model.idx == 3
+    assert result["messages"][-1].content == "Your hotel is booked."
+    assert budgets[-1] is None
+
+
+def test_deadline_cancels_running_agent() -> None:
+    async def book_hotel() -> str:
+        """Book a hotel."""
+        await asyncio.sleep(5)
+        return "Booked"
+
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "book_hotel", "args": {}, "id": "call_2"}],
+            ),
+        ]
+    )
+    deadline = TurnDeadline(message="Out of time")
+    app = _make_app(model, book_hotel, deadline=deadline)
+
+    start = time.perf_counter()
+    result = asyncio.run(
+        app.ainvoke(INPUT, with_deadline(0.3, {"configurable": {"thread_id": "1"}}))
+    )
+    assert time.perf_counter() - start < 2
+    assert result["messages"][-1].content == "Out of time"
+    assert result["active_agent"] == "Bob"
+
+
+def test_deadline_ignores_agent_timeouts() -> None:
+    async def book_hotel() -> str:
+        """Book a hotel."""
+        msg = "The booking service timed out"
+        raise TimeoutError(msg)
+
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "book_hotel", "args": {}, "id": "call_1"}],
+            ),
+        ]
+    )
+    app = _make_app(model, book_hotel, deadline=TurnDeadline())
+
+    # the agent's own timeouts fail the turn instead of ending it at the deadline
+    with pytest.raises(TimeoutError, match="The booking service timed out"):
+        asyncio.run(
+            app.ainvoke(INPUT, with_deadline(30, {"configurable": {"thread_id": "1"}}))
+        )
@@ -0,0 +1,65 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import create_handoff_tool, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app(checkpointer: InMemorySaver, *, ephemeral_agents: bool) -> Any:
+    model = FakeChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob", name="Bob"),
+            AIMessage(content="Still Bob", name="Bob"),
+        ]
+    )
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    return create_swarm(
+        [alice, bob], default_active_agent="Alice", ephemeral_agents=ephemeral_agents
+    ).compile(checkpointer=checkpointer)
+
+
+@pytest.mark.parametrize("ephemeral_agents", [False, True])
+def test_swarm_with_ephemeral_agents(*, ephemeral_agents: bool) -> None:
+    checkpointer = InMemorySaver()
+    app = _make_app(checkpointer, ephemeral_agents=ephemeral_agents)
+    config: Any = {"configurable": {"thread_id": "1"}}
+
+    app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]},  # type: ignore[arg-type]
+        config,
+    )
+    # the next turn resumes with the last active agent
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "who are you?"}]},  # type: ignore[arg-type]
+        config,
+    )
+
+    assert [m.content for m in result["messages"]] == [
+        "i'd like to speak to Bob",
+        "",
+        "Successfully transferred to Bob",
+        "Hi, I'm Bob",
+        "who are you?",
+        "Still Bob",
+    ]
+    assert result["active_agent"] == "Bob"
+    namespaces = set(checkpointer.storage["1"])
+    if ephemeral_agents:
+        # only the swarm itself is checkpointed
+        assert namespaces == {""}
+    else:
+        assert len(namespaces) > 1
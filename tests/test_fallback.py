@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import AgentFallbacks, create_handoff_tool, create_swarm
+from tests.test_hedging import DelayedChatModel
+from tests.test_swarm import FakeChatModel
+
+
+def test_fallback_agent_on_errors() -> None:
+    alice: Any = create_agent(
+        DelayedChatModel(content="Alice", delays=[None]),
+        tools=[create_handoff_tool(agent_name="Bob")],
+        name="Alice",
+    )
+    bob: Any = create_agent(
+        FakeChatModel(responses=[AIMessage(content="Hi, I'm Bob", name="Bob")]),  # type: ignore[arg-type]
+        tools=[],
+        name="Bob",
+    )
+    fallbacks = AgentFallbacks({"Alice": "Bob"})
+    app = create_swarm(
+        [alice, bob], default_active_agent="Alice", agent_fallbacks=fallbacks
+    ).compile(checkpointer=InMemorySaver())
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]},  # type: ignore[arg-type]
+        {"configurable": {"thread_id": "1"}},
+    )
+    assert [m.content for m in result["messages"]] == ["hi", "Hi, I'm Bob"]
+    assert result["active_agent"] == "Bob"
+    assert fallbacks.counters == {"Alice": 1}
+
+    # other errors fail the turn
+    app = create_swarm(
+        [alice, bob],
+        default_active_agent="Alice",
+        agent_fallbacks=AgentFallbacks({"Alice": "Bob"}, errors=(TimeoutError,)),
+    ).compile()
+    with pytest.raises(RuntimeError, match="Alice is down"):
+        app.invoke({"messages": [{"role": "user", "content": "hi"}]})  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_fallback_agent_on_timeouts(*, use_async: bool) -> None:
+    def search() -> str:
+        """Search the web."""
+        msg = "Search timed out"
+        raise TimeoutError(msg)
+
+    alice: Any = create_agent(
+        FakeChatModel(
+            responses=[  # type: ignore[arg-type]
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "search", "args": {}, "id": "call_1"}],
+                )
+            ]
+        ),
+        tools=[search],
+        name="Alice",
+    )
+    bob: Any = create_agent(
+        FakeChatModel(responses=[AIMessage(content="Bob here", name="Bob")]),  # type: ignore[arg-type]
+        tools=[],
+        name="Bob",
+    )
+    app = create_swarm(
+        [alice, bob],
+        default_active_agent="Alice",
+        agent_fallbacks=AgentFallbacks({"Alice": "Bob"}),
+    ).compile()
+
+    inputs: Any = {"messages": [{"role": "user", "content": "hi"}]}
+    result = asyncio.run(app.ainvoke(inputs)) if use_async else app.invoke(inputs)
+    assert result["messages"][-1].content == "Bob here"
+    assert result["active_agent"] == "Bob"
+
+
+def test_invalid_agent_fallbacks() -> None:
+    model = FakeChatModel(responses=[])
+    alice: Any = create_agent(model, tools=[], name="Alice")
+    bob: Any = create_agent(model, tools=[], name="Bob")
+
+    with pytest.raises(ValueError, match="unknown agent 'Charlie'"):
+        create_swarm(
+            [alice, bob],
+            default_active_agent="Alice",
+            agent_fallbacks=AgentFallbacks({"Alice": "Charlie"}),
+        )
+    with pytest.raises(ValueError, match="Agent fallbacks of 'Alice' contain a cycle"):
+        create_swarm(
+            [alice, bob],
+            default_active_agent="Alice",
+            agent_fallbacks=AgentFallbacks({"Alice": "Bob", "Bob": "Alice"}),
+        )
@@ -0,0 +1,177 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import START, MessagesState, StateGraph
+
+from langgraph_swarm import (
+    LazyAgent,
+    create_fanout_tool,
+    create_handoff_tool,
+    create_swarm,
+)
+from langgraph_swarm.fanout import FANOUT_NODE
+from tests.test_swarm import FakeChatModel
+
+if TYPE_CHECKING:
+    from langchain_core.runnables.config import RunnableConfig
+
+
+def _make_agents(**worker_responses: list[Any]) -> list[Any]:
+    coordinator_model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                name="Coordinator",
+                tool_calls=[
+                    {
+                        "name": "delegate_to_agents",
+                        "args": {
+                            "tasks": [
+                                {"agent": "Flights", "task": "find a flight"},
+                                {"agent": "Hotels", "task": "find a hotel"},
+                            ]
+                        },
+                        "id": "call_1",
+                    },
+                ],
+            ),
+            AIMessage(content="Your trip is booked.", name="Coordinator"),
+        ]
+    )
+    coordinator = create_agent(
+        coordinator_model,
+        tools=[create_fanout_tool(agent_names=["Flights", "Hotels"])],
+        name="Coordinator",
+    )
+    workers = [
+        create_agent(
+            FakeChatModel(responses=responses),
+            tools=[create_handoff_tool(agent_name="Coordinator")],
+            name=name,
+        )
+        for name, responses in worker_responses.items()
+    ]
+    return [coordinator, *workers]
+
+
+def test_fanout_merges_results() -> None:
+    agents = _make_agents(
+        Flights=[AIMessage(content="Flight LH123 at 9am.", name="Flights")],
+        Hotels=[AIMessage(content="Hotel Adlon, 2 nights.", name="Hotels")],
+    )
+    workflow = create_swarm(agents, default_active_agent="Coordinator")
+    assert FANOUT_NODE in workflow.nodes["Coordinator"].ends  # type: ignore[operator]
+    app = workflow.compile(checkpointer=MemorySaver())
+
+    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "plan my trip"}]},  # type: ignore[arg-type]
+        config,
+    )
+    assert [m.type for m in result["messages"]] == ["human", "ai", "tool", "ai"]
+    assert result["messages"][1].tool_calls[0]["id"] == "call_1"
+    tool_message = result["messages"][-2]
+    assert isinstance(tool_message, ToolMessage)
+    assert tool_message.tool_call_id == "call_1"
+    assert tool_message.content == (
+        "Result from Flights:\nFlight LH123 at 9am.\n\n"
+        "Result from Hotels:\nHotel Adlon, 2 nights."
+    )
+    assert result["messages"][-1].content == "Your trip is booked."
+    assert result["active_agent"] == "Coordinator"
+    assert "swarm_fanout_results" not in result
+
+
+def test_fanout_reports_handoff_attempts() -> None:
+    agents = _make_agents(
+        Flights=[AIMessage(content="Flight LH123 at 9am.", name="Flights")],
+        Hotels=[
+            AIMessage(
+                content="",
+                name="Hotels",
+                tool_calls=[
+                    {"name": "transfer_to_coordinator", "args": {}, "id": "call_2"}
+                ],
+            )
+        ],
+    )
+    app = create_swarm(agents, default_active_agent="Coordinator").compile()
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "plan my trip"}]}  # type: ignore[arg-type]
+    )
+    assert result["messages"][-2].content == (
+        "Result from Flights:\nFlight LH123 at 9am.\n\n"
+        "Result from Hotels:\nAgent 'Hotels' tried to hand off control "
+        "instead of responding"
+    )
+    assert result["active_agent"] == "Coordinator"
+
+
+def test_fanout_from_lazy_agent() -> None:
+    def make_agents() -> list[Any]:
+        return _make_agents(
+            Flights=[AIMessage(content="Flight LH123 at 9am.", name="Flights")],
+            Hotels=[AIMessage(content="Hotel Adlon, 2 nights.", name="Hotels")],
+        )
+
+    coordinator, *workers = make_agents()
+    lazy_coordinator = LazyAgent(
+        "Coordinator",
+        lambda: coordinator,
+        fanout_destinations=["Flights", "Hotels"],
+    )
+    workflow = create_swarm(
+        [lazy_coordinator, *workers], default_active_agent="Coordinator"
+    )
+    assert FANOUT_NODE in workflow.nodes["Coordinator"].ends  # type: ignore[operator]
+    result = workflow.compile().invoke(
+        {"messages": [{"role": "user", "content": "plan my trip"}]}  # type: ignore[arg-type]
+    )
+    assert result["messages"][-2].content == (
+        "Result from Flights:\nFlight LH123 at 9am.\n\n"
+        "Result from Hotels:\nHotel Adlon, 2 nights."
+    )
+    assert result["messages"][-1].content == "Your trip is booked."
+
+    # undeclared fan-out destinations fail instead of silently dropping the tasks
+    coordinator, *workers = make_agents()
+    app = create_swarm(
+        [LazyAgent("Coordinator", lambda: coordinator), *workers],
+        default_active_agent="Coordinator",
+    ).compile()
+    with pytest.raises(ValueError, match=r"\['Flights', 'Hotels'\], which are not"):
+        app.invoke({"messages": [{"role": "user", "content": "plan my trip"}]})  # type: ignore[arg-type]
+
+
+def test_fanout_from_nested_graph() -> None:
+    inner, *workers = _make_agents(
+        Flights=[AIMessage(content="Flight LH123 at 9am.", name="Flights")],
+        Hotels=[AIMessage(content="Hotel Adlon, 2 nights.", name="Hotels")],
+    )
+    coordinator = (
+        StateGraph(MessagesState)
+        .add_node("inner", inner)
+        .add_edge(START, "inner")
+        .compile(name="Coordinator")
+    )
+    # the fan-out tool would dispatch its tasks to the coordinator graph
+    with pytest.raises(ValueError, match="fan-out tools in its nested graph 'inner'"):
+        create_swarm([coordinator, *workers], default_active_agent="Coordinator")
+
+    app = create_swarm(
+        [
+            LazyAgent(
+                "Coordinator",
+                lambda: coordinator,
+                fanout_destinations=["Flights", "Hotels"],
+            ),
+            *workers,
+        ],
+        default_active_agent="Coordinator",
+    ).compile()
+    with pytest.raises(ValueError, match="fan-out tools in its nested graph 'inner'"):
+        app.invoke({"messages": [{"role": "user", "content": "plan my trip"}]})  # type: ignore[arg-type]
@@ -0,0 +1,286 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.types import Command
+from pydantic import BaseModel, Field
+
+from langgraph_swarm import (
+    LazyAgent,
+    create_handoff_directory_tool,
+    create_handoff_tool,
+    create_swarm,
+)
+from langgraph_swarm.handoff import _collapse_handoffs, get_handoff_destinations
+from tests.test_context import RecordingChatModel
+from tests.test_swarm import FakeChatModel
+
+
+def _invoke_handoff_tool(tool: BaseTool, messages: list[AnyMessage]) -> Command:
+    command = tool.invoke(
+        {
+            "type": "tool_call",
+            "name": tool.name,
+            "args": {"state": {"messages": messages}},
+            "id": "call_handoff",
+        }
+    )
+    assert isinstance(command, Command)
+    return command
+
+
+def _get_update(command: Command) -> dict[str, Any]:
+    assert isinstance(command.update, dict)
+    return command.update
+
+
+def _make_history() -> list[AnyMessage]:
+    return [
+        HumanMessage(content="hi", id="1"),
+        AIMessage(
+            content="",
+            id="2",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+        ),
+        ToolMessage(
+            content="Successfully transferred to Bob",
+            id="3",
+            tool_call_id="call_1",
+            response_metadata={"__handoff_destination": "Bob"},
+        ),
+        AIMessage(
+            content="",
+            id="4",
+            tool_calls=[{"name": "add", "args": {"a": 1, "b": 2}, "id": "call_2"}],
+        ),
+        ToolMessage(content="3", id="5", tool_call_id="call_2"),
+        AIMessage(
+            content="",
+            id="6",
+            tool_calls=[{"name": "transfer_to_alice", "args": {}, "id": "call_3"}],
+        ),
+    ]
+
+
+def test_handoff_delta() -> None:
+    tool = create_handoff_tool(agent_name="Alice")
+    command = _invoke_handoff_tool(tool, _make_history())
+
+    update = _get_update(command)
+    messages = update["messages"]
+    # only the messages produced by the active agent since the last handoff
+    assert [m.id for m in messages[:-1]] == ["4", "5", "6"]
+    assert messages[-1].content == "Successfully transferred to Alice"
+    assert messages[-1].response_metadata == {"__handoff_destination": "Alice"}
+    assert update["active_agent"] == "Alice"
+    assert command.goto == "Alice"
+
+
+def test_handoff_delta_stops_at_human_message() -> None:
+    tool = create_handoff_tool(agent_name="Bob")
+    history = [
+        *_make_history()[:3],
+        HumanMessage(content="what's 1 + 2?", id="7"),
+        AIMessage(
+            content="",
+            id="8",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_4"}],
+        ),
+    ]
+    command = _invoke_handoff_tool(tool, history)
+    assert [m.id for m in _get_update(command)["messages"][:-1]] == ["8"]
+
+
+def test_handoff_full() -> None:
+    tool = create_handoff_tool(agent_name="Alice", transfer_messages="full")
+    history = _make_history()
+    command = _invoke_handoff_tool(tool, history)
+    assert [m.id for m in _get_update(command)["messages"][:-1]] == [
+        m.id for m in history
+    ]
+
+
+def test_get_handoff_destinations(monkeypatch: pytest.MonkeyPatch) -> None:
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    agent: Any = create_agent(
+        FakeChatModel(responses=[]),
+        tools=[
+            add,
+            create_handoff_tool(agent_name="Bob"),
+            create_handoff_tool(agent_name="Charlie"),
+        ],
+        name="Alice",
+    )
+
+    def _fail() -> None:
+        msg = "destinations should be read without drawing the graph"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(agent, "get_graph", _fail)
+    assert get_handoff_destinations(agent) == ["Bob", "Charlie"]
+    assert get_handoff_destinations(agent, tool_node_name="missing") == []
+
+    # cached per agent instance
+    monkeypatch.setattr(agent.builder, "nodes", {})
+    assert get_handoff_destinations(agent) == ["Bob", "Charlie"]
+
+
+def test_handoff_directory_tool() -> None:
+    tool = create_handoff_directory_tool(
+        agent_names=["Alice", "Bob"],
+        agent_descriptions={"Bob": "a pirate"},
+    )
+    assert tool.name == "transfer_to_agent"
+    assert "- Alice\n- Bob: a pirate" in tool.description
+    schema = tool.tool_call_schema.model_json_schema()  # type: ignore[union-attr]
+    assert list(schema["properties"]) == ["agent"]
+    assert schema["properties"]["agent"]["enum"] == ["Alice", "Bob"]
+
+    command = tool.invoke(
+        {
+            "type": "tool_call",
+            "name": tool.name,
+            "args": {"agent": "Alice", "state": {"messages": _make_history()}},
+            "id": "call_handoff",
+        }
+    )
+    assert command.goto == "Alice"
+    assert command.update["active_agent"] == "Alice"
+    assert command.update["messages"][-1].content == "Successfully transferred to Alice"
+
+    agent: Any = create_agent(
+        FakeChatModel(responses=[]),
+        tools=[tool, create_handoff_tool(agent_name="Bob")],
+        name="Charlie",
+    )
+    assert get_handoff_destinations(agent) == ["Alice", "Bob"]
+
+
+def test_collapse_handoffs_keeps_text() -> None:
+    history: list[AnyMessage] = [
+        HumanMessage(content="hi", id="1"),
+        AIMessage(
+            content="Let me get Bob.",
+            name="Alice",
+            id="2",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+        ),
+        ToolMessage(
+            content="Successfully transferred to Bob",
+            id="3",
+            tool_call_id="call_1",
+            response_metadata={"__handoff_destination": "Bob"},
+        ),
+    ]
+
+    updates = _collapse_handoffs(history, "drop")
+    assert [(type(m).__name__, m.id) for m in updates] == [
+        ("AIMessage", "2"),
+        ("RemoveMessage", "3"),
+    ]
+    assert updates[0].content == "Let me get Bob."
+    assert not updates[0].tool_calls  # type: ignore[attr-defined]
+
+    updates = _collapse_handoffs(history, "compact")
+    assert updates[0].content == "Let me get Bob.\n\n[Handoff: Alice -> Bob]"
+    assert [m.id for m in updates] == ["2", "3"]
+
+    # nothing to collapse if the history does not end with a handoff
+    assert _collapse_handoffs(history[:1], "drop") == []
+
+
+def test_handoff_tool_async() -> None:
+    tool = create_handoff_tool(agent_name="Alice")
+    # the async path runs the coroutine directly instead of using a thread pool
+    assert tool.coroutine is not None  # type: ignore[attr-defined]
+
+    command = asyncio.run(
+        tool.ainvoke(
+            {
+                "type": "tool_call",
+                "name": tool.name,
+                "args": {"state": {"messages": _make_history()}},
+                "id": "call_handoff",
+            }
+        )
+    )
+    assert command == _invoke_handoff_tool(tool, _make_history())
+
+
+class Brief(BaseModel):
+    task: str = Field(description="What the agent should do.")
+    context: str | None = None
+
+
+def test_handoff_tool_with_brief() -> None:
+    tool = create_handoff_tool(agent_name="Bob", args_schema=Brief)
+    assert tool.tool_call_schema.model_json_schema()["required"] == ["task"]  # type: ignore[union-attr]
+
+    command = tool.invoke(
+        {
+            "type": "tool_call",
+            "name": tool.name,
+            "args": {"task": "book a flight", "state": {"messages": _make_history()}},
+            "id": "call_handoff",
+        }
+    )
+    tool_message = command.update["messages"][-1]
+    assert tool_message.content == (
+        "Successfully transferred to Bob with the following brief:\ntask: book a flight"
+    )
+    assert tool_message.response_metadata["__handoff_brief"] == {
+        "task": "book a flight",
+        "context": None,
+    }
+
+    with pytest.raises(ValueError, match="hide_history requires an args_schema"):
+        create_handoff_tool(agent_name="Bob", hide_history=True)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_handoff_with_hidden_history(*, lazy: bool) -> None:
+    model = RecordingChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[
+                    {
+                        "name": "transfer_to_bob",
+                        "args": {"task": "book a flight", "context": "to Paris"},
+                        "id": "call_1",
+                    }
+                ],
+            ),
+            AIMessage(content="Booked.", name="Bob"),
+        ]
+    )
+    model.inputs.clear()
+    alice = create_agent(
+        model,
+        tools=[
+            create_handoff_tool(agent_name="Bob", args_schema=Brief, hide_history=True)
+        ],
+        name="Alice",
+    )
+    bob = create_agent(model, tools=[], name="Bob")
+    agents: list[Any] = [alice, bob]
+    if lazy:
+        # the swarm can't read the hidden-history handoffs of a lazy agent up front
+        agents[0] = LazyAgent("Alice", lambda: alice, destinations=["Bob"])
+    app = create_swarm(agents, default_active_agent="Alice").compile()
+
+    result = app.invoke({"messages": [{"role": "user", "content": "hi"}]})  # type: ignore[arg-type]
+    # Bob only sees the brief
+    assert [m.content for m in model.inputs[1]] == [
+        "task: book a flight\ncontext: to Paris"
+    ]
+    # the history is kept, without the brief
+    assert [m.type for m in result["messages"]] == ["human", "ai", "tool", "ai"]
+    assert result["messages"][-1].content == "Booked."
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.memory import InMemorySaver
+from typing_extensions import override
+
+from langgraph_swarm import HedgedChatModel, HedgeInfo, create_swarm
+
+
+class DelayedChatModel(BaseChatModel):
+    """Fake model that replies after the given delays, or fails if a delay is None."""
+
+    content: str
+    delays: Sequence[float | None]
+    calls: int = 0
+    cancelled: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-delayed-model"
+
+    def _next_delay(self) -> float | None:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        return delay
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if (delay := self._next_delay()) is None:
+            msg = f"{self.content} is down"
+            raise RuntimeError(msg)
+        time.sleep(delay)
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=self.content))]
+        )
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if (delay := self._next_delay()) is None:
+            msg = f"{self.content} is down"
+            raise RuntimeError(msg)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=self.content))]
+        )
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> "DelayedChatModel":
+        return self
+
+
+def test_hedged_call_cancels_slow_request() -> None:
+    primary = DelayedChatModel(content="primary", delays=[2.0])
+    hedge = DelayedChatModel(content="hedge", delays=[0.01])
+    model = HedgedChatModel(model=primary, hedge_model=hedge, hedge_delay=0.05)
+
+    start = time.perf_counter()
+    response = asyncio.run(model.ainvoke("hi"))
+    assert time.perf_counter() - start < 1
+    assert response.content == "hedge"
+    assert primary.cancelled == 1
+    assert model.info() == HedgeInfo(calls=1, hedged=1, hedge_wins=1, fallbacks=0)
+
+
+def test_concurrent_sync_calls_are_not_hedged() -> None:
+    primary = DelayedChatModel(content="primary", delays=[0.3])
+    hedge = DelayedChatModel(content="hedge", delays=[0.0])
+    model = HedgedChatModel(model=primary, hedge_model=hedge, hedge_delay=0.5)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=40) as executor:
+        responses = list(executor.map(model.invoke, ["hi"] * 40))
+    # the calls run concurrently, and none of them waits long enough to be hedged
+    assert time.perf_counter() - start < 1
+    assert {response.content for response in responses} == {"primary"}
+    assert model.info() == HedgeInfo(calls=40, hedged=0, hedge_wins=0, fallbacks=0)
+
+
+def test_sync_call_with_busy_executor() -> None:
+    primary = DelayedChatModel(content="primary", delays=[0.1])
+    hedge = DelayedChatModel(content="hedge", delays=[0.0])
+    release = Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(release.wait)
+        model = HedgedChatModel(
+            model=primary, hedge_model=hedge, hedge_delay=0.05, executor=executor
+        )
+        # the call doesn't wait for the busy executor, and isn't hedged
+        response = model.invoke("hi")
+        release.set()
+    assert response.content == "primary"
+    assert hedge.calls == 0
+    assert model.info() == HedgeInfo(calls=1, hedged=0, hedge_wins=0, fallbacks=0)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_hedge_delay_from_agent_latencies(*, use_async: bool) -> None:
+    # the first calls are fast, then the primary model slows down
+    primary = DelayedChatModel(content="primary", delays=[0.01] * 5 + [1.0])
+    hedge = DelayedChatModel(content="hedge", delays=[0.01])
+    model = HedgedChatModel(model=primary, hedge_model=hedge, min_samples=5)
+    alice: Any = create_agent(model, tools=[], name="Alice")
+    app = create_swarm([alice], default_active_agent="Alice").compile(
+        checkpointer=InMemorySaver()
+    )
+
+    for turn in range(6):
+        inputs: Any = {"messages": [{"role": "user", "content": "hi"}]}
+        config: Any = {"configurable": {"thread_id": str(turn)}}
+        start = time.perf_counter()
+        if use_async:
+            result = asyncio.run(app.ainvoke(inputs, config))
+        else:
+            result = app.invoke(inputs, config)
+        assert time.perf_counter() - start < 0.5
+    assert result["messages"][-1].content == "hedge"
+    assert model.info("Alice") == HedgeInfo(
+        calls=6, hedged=1, hedge_wins=1, fallbacks=0
+    )
+    assert model.info("Bob") == HedgeInfo(calls=0, hedged=0, hedge_wins=0, fallbacks=0)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_fallback_model_on_errors(*, use_async: bool) -> None:
+    primary = DelayedChatModel(content="primary", delays=[None])
+    fallbacks = [
+        DelayedChatModel(content="fallback 1", delays=[None]),
+        DelayedChatModel(content="fallback 2", delays=[0.0]),
+    ]
+    model = HedgedChatModel(model=primary, fallback_models=fallbacks)
+
+    response = asyncio.run(model.ainvoke("hi")) if use_async else model.invoke("hi")
+    assert response.content == "fallback 2"
+    assert model.info().fallbacks == 1
+
+    model = HedgedChatModel(model=primary, fallback_models=fallbacks[:1])
+    with pytest.raises(RuntimeError, match="fallback 1 is down"):
+        model.invoke("hi")
+    assert model.info().fallbacks == 0
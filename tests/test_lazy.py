@@ -0,0 +1,62 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraph_swarm import LazyAgent, create_handoff_tool, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def test_lazy_agent() -> None:
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob.", name="Bob"),
+            AIMessage(content="Still Bob.", name="Bob"),
+        ]
+    )
+    created: list[str] = []
+
+    def make_factory(name: str, destinations: list[str]) -> Any:
+        def factory() -> Any:
+            created.append(name)
+            return create_agent(
+                model,
+                tools=[create_handoff_tool(agent_name=d) for d in destinations],
+                name=name,
+            )
+
+        return factory
+
+    alice = LazyAgent("Alice", make_factory("Alice", ["Bob"]), destinations=["Bob"])
+    bob = LazyAgent("Bob", make_factory("Bob", ["Alice"]), destinations=["Alice"])
+    charlie = LazyAgent("Charlie", make_factory("Charlie", []))
+
+    workflow = create_swarm([alice, bob, charlie], default_active_agent="Alice")
+    assert workflow.nodes["Alice"].ends == ("Bob",)
+    app = workflow.compile(checkpointer=MemorySaver())
+    assert created == []
+
+    config: Any = {"configurable": {"thread_id": "1"}}
+    result = app.invoke({"messages": [{"role": "user", "content": "hi"}]}, config)
+    assert result["messages"][-1].content == "Hi, I'm Bob."
+    assert result["active_agent"] == "Bob"
+
+    result = app.invoke({"messages": [{"role": "user", "content": "hi"}]}, config)
+    assert result["messages"][-1].content == "Still Bob."
+    # agents are created on first use, and only once
+    assert created == ["Alice", "Bob"]
+    assert not charlie.is_materialized
+
+
+def test_lazy_agent_name_mismatch() -> None:
+    model = FakeChatModel(responses=[])
+    agent = LazyAgent("Alice", lambda: create_agent(model, tools=[], name="Bob"))
+    with pytest.raises(ValueError, match="returned an agent named 'Bob'"):
+        agent.invoke({"messages": []})
@@ -0,0 +1,86 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, HumanMessage
+from langchain_core.stores import InMemoryByteStore
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import MessageStoreSerializer, create_handoff_tool, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def test_message_store_serializer_round_trip() -> None:
+    store = InMemoryByteStore()
+    serde = MessageStoreSerializer(store)
+    messages = [HumanMessage(content="hi", id="1"), AIMessage(content="hello", id="2")]
+
+    data = serde.dumps_typed({"messages": messages, "active_agent": "Alice"})
+    assert data[0].startswith("swarm_message_refs+")
+    assert b"hello" not in data[1]
+    assert serde.loads_typed(data) == {"messages": messages, "active_agent": "Alice"}
+    assert len(store.store) == 2
+
+    # identical messages are only stored once
+    serde.dumps_typed([*messages, AIMessage(content="bye", id="3")])
+    assert len(store.store) == 3
+
+    # values without messages are serialized as usual
+    data = serde.dumps_typed({"active_agent": "Alice", "messages": []})
+    assert not data[0].startswith("swarm_message_refs+")
+    assert serde.loads_typed(data) == {"active_agent": "Alice", "messages": []}
+
+    # expired messages are written again, but older values can't be loaded
+    data = serde.dumps_typed(messages)
+    store.mdelete(list(store.yield_keys()))
+    assert serde.loads_typed(serde.dumps_typed(messages[:1])) == messages[:1]
+    assert len(store.store) == 1
+    with pytest.raises(ValueError, match="not found in the message store"):
+        serde.loads_typed(data)
+
+
+def test_swarm_with_message_store_serializer() -> None:
+    model = FakeChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob", name="Bob"),
+        ]
+    )
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(model, tools=[], name="Bob")
+    store = InMemoryByteStore()
+    serde = MessageStoreSerializer(store)
+    app = create_swarm([alice, bob], default_active_agent="Alice").compile(
+        checkpointer=InMemorySaver(serde=serde)
+    )
+    config: Any = {"configurable": {"thread_id": "1"}}
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]},  # type: ignore[arg-type]
+        config,
+    )
+
+    state = app.get_state(config)
+    assert state.values["messages"] == result["messages"]
+    assert [m.content for m in state.values["messages"]] == [
+        "i'd like to speak to Bob",
+        "",
+        "Successfully transferred to Bob",
+        "Hi, I'm Bob",
+    ]
+    # the messages are stored once, even though they were checkpointed
+    # by both the swarm and the agents (some writes may be checkpointed
+    # before the message ids are assigned)
+    stored_messages = [
+        serde.serde.loads_typed((type_.decode(), data))
+        for type_, _, data in (value.partition(b"\0") for value in store.store.values())
+    ]
+    assert sorted(m.id for m in stored_messages if m.id is not None) == sorted(
+        m.id for m in result["messages"]
+    )
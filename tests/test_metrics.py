@@ -0,0 +1,83 @@
+import json
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+
+from langgraph_swarm import (
+    SwarmMetricsCallbackHandler,
+    create_handoff_tool,
+    create_swarm,
+)
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app(**kwargs: Any) -> Any:
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+                usage_metadata={
+                    "input_tokens": 10,
+                    "output_tokens": 2,
+                    "total_tokens": 12,
+                },
+            ),
+            AIMessage(
+                content="Hi, I'm Bob.",
+                usage_metadata={
+                    "input_tokens": 20,
+                    "output_tokens": 5,
+                    "total_tokens": 25,
+                },
+            ),
+        ]
+    )
+    alice = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob = create_agent(model, tools=[], name="Bob")
+    return create_swarm([alice, bob], default_active_agent="Alice", **kwargs).compile()
+
+
+def test_swarm_metrics() -> None:
+    metrics = SwarmMetricsCallbackHandler()
+    app = _make_app()
+    app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]},
+        {"callbacks": [metrics]},
+    )
+
+    result = metrics.to_dict()
+    assert result["turns"] == 1
+    assert result["router_decisions"] == {"Alice": 1}
+    assert result["handoffs"] == [{"source": "Alice", "destination": "Bob", "count": 1}]
+    alice, bob = result["agents"]["Alice"], result["agents"]["Bob"]
+    assert (alice["runs"], alice["llm_calls"]) == (1, 1)
+    assert (alice["input_tokens"], alice["output_tokens"]) == (10, 2)
+    assert (bob["runs"], bob["llm_calls"]) == (1, 1)
+    assert (bob["input_tokens"], bob["output_tokens"]) == (20, 5)
+    assert alice["wall_seconds"] >= alice["llm_seconds"] > 0
+    assert json.loads(metrics.to_json()) == result
+
+    prometheus = metrics.to_prometheus()
+    assert "swarm_turns_total 1\n" in prometheus
+    assert 'swarm_agent_input_tokens_total{agent="Bob"} 20\n' in prometheus
+    assert 'swarm_handoffs_total{source="Alice",destination="Bob"} 1\n' in prometheus
+    assert 'swarm_router_decisions_total{agent="Alice"} 1\n' in prometheus
+
+
+def test_swarm_metrics_with_wrapped_agents() -> None:
+    metrics = SwarmMetricsCallbackHandler()
+    # with a pre-router, the agents run within wrapper nodes
+    app = _make_app(pre_router=lambda state: None)
+    app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]},
+        {"callbacks": [metrics]},
+    )
+
+    alice, bob = metrics.agents["Alice"], metrics.agents["Bob"]
+    assert (alice.runs, alice.llm_calls) == (1, 1)
+    assert (bob.runs, bob.llm_calls) == (1, 1)
+    assert metrics.handoffs == {("Alice", "Bob"): 1}
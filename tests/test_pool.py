@@ -0,0 +1,98 @@
+import asyncio
+import os
+import time
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, MessagesState, StateGraph
+
+from langgraph_swarm import SwarmWorkerPool, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app() -> Any:
+    # every reply tells which worker process it came from
+    model = FakeChatModel(
+        responses=[AIMessage(content=str(os.getpid())) for _ in range(100)]
+    )
+    alice: Any = create_agent(model, tools=[], name="Alice")
+    return create_swarm([alice], default_active_agent="Alice").compile(
+        checkpointer=InMemorySaver()
+    )
+
+
+def _make_broken_app() -> Any:
+    time.sleep(0.5)
+    msg = "Can't create the swarm"
+    raise ValueError(msg)
+
+
+def _reply_or_exit(state: MessagesState) -> dict[str, Any]:
+    if state["messages"][-1].content == "exit":
+        os._exit(1)
+    return {"messages": [AIMessage(content=str(os.getpid()))]}
+
+
+def _make_fragile_app() -> Any:
+    builder = StateGraph(MessagesState)
+    builder.add_node("reply", _reply_or_exit)
+    builder.add_edge(START, "reply")
+    return builder.compile()
+
+
+def test_worker_pool_thread_affinity() -> None:
+    with SwarmWorkerPool(_make_app, workers=2) as pool:
+        inputs: Any = {"messages": [{"role": "user", "content": "hi"}]}
+        configs: list[Any] = [{"configurable": {"thread_id": str(i)}} for i in range(4)]
+        first_turns = [pool.submit(inputs, config) for config in configs]
+        first_results = [future.result() for future in first_turns]
+
+        async def second_turns() -> list[Any]:
+            return await asyncio.gather(
+                *(pool.ainvoke(inputs, config) for config in configs)
+            )
+
+        second_results = asyncio.run(second_turns())
+
+    for first, second in zip(first_results, second_results, strict=True):
+        # the thread's history is kept by the checkpointer of its worker
+        assert [m.content for m in second["messages"]] == [
+            "hi",
+            first["messages"][-1].content,
+            "hi",
+            first["messages"][-1].content,
+        ]
+    assert len({r["messages"][-1].content for r in first_results}) <= 2
+
+
+def test_worker_pool_backpressure() -> None:
+    with SwarmWorkerPool(_make_broken_app, workers=1, max_pending=1) as pool:
+        future = pool.submit({"messages": []})
+        with pytest.raises(TimeoutError, match="Worker 0 has too many pending runs"):
+            pool.submit({"messages": []}, timeout=0.01)
+        with pytest.raises(ValueError, match="Can't create the swarm"):
+            future.result()
+        with pytest.raises(ValueError, match="Can't create the swarm"):
+            pool.invoke({"messages": []})
+
+    with pytest.raises(RuntimeError, match="closed worker pool"):
+        pool.submit({"messages": []})
+
+
+def test_worker_pool_restarts_dead_workers() -> None:
+    with SwarmWorkerPool(_make_fragile_app, workers=1, max_pending=1) as pool:
+        first = pool.submit({"messages": [{"role": "user", "content": "hi"}]})
+        pid = first.result(timeout=30)["messages"][-1].content
+
+        future = pool.submit({"messages": [{"role": "user", "content": "exit"}]})
+        with pytest.raises(RuntimeError, match="Worker 0 exited unexpectedly"):
+            future.result(timeout=30)
+
+        # the slot of the failed run is released, and the worker is restarted
+        future = pool.submit(
+            {"messages": [{"role": "user", "content": "hi"}]}, timeout=30
+        )
+        assert future.result(timeout=30)["messages"][-1].content != pid
@@ -0,0 +1,203 @@
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import MessagesState
+
+from langgraph_swarm import create_fanout_tool, create_handoff_tool, create_swarm
+from langgraph_swarm.private import _get_private_history, _merge_private_messages
+from tests.test_context import RecordingChatModel
+from tests.test_swarm import FakeChatModel
+
+
+@tool
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def test_get_private_history() -> None:
+    seen = {"__swarm_seen_messages": ["1"]}
+    agent_messages: dict[str, list[AnyMessage]] = {
+        "Alice": [
+            AIMessage(content="", id="2", response_metadata=seen),
+            ToolMessage(
+                content="3", tool_call_id="call_1", id="3", response_metadata=seen
+            ),
+        ]
+    }
+    state: dict[str, Any] = {
+        "messages": [
+            HumanMessage(content="hi", id="1"),
+            AIMessage(content="hello", id="4"),
+        ],
+        "agent_messages": agent_messages,
+    }
+    assert [m.id for m in _get_private_history(state, "Alice")] == ["1", "2", "3", "4"]
+    # agents without a private history see the shared history
+    assert [m.id for m in _get_private_history(state, "Bob")] == ["1", "4"]
+    # private messages follow the last shared message they were added after
+    state["messages"] = [HumanMessage(content="hi", id="0"), *state["messages"]]
+    assert [m.id for m in _get_private_history(state, "Alice")] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    assert _merge_private_messages(
+        {"Alice": [], "Bob": []}, {"Bob": state["messages"]}
+    ) == {
+        "Alice": [],
+        "Bob": state["messages"],
+    }
+
+
+def test_swarm_with_private_messages() -> None:
+    model = RecordingChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "add", "args": {"a": 1, "b": 2}, "id": "call_1"}],
+            ),
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_2"}],
+            ),
+            AIMessage(content="Hi, I'm Bob", name="Bob"),
+            AIMessage(
+                content="",
+                name="Bob",
+                tool_calls=[{"name": "transfer_to_alice", "args": {}, "id": "call_3"}],
+            ),
+            AIMessage(content="1 + 2 is 3", name="Alice"),
+        ]
+    )
+    alice: Any = create_agent(
+        model, tools=[add, create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    app = create_swarm(
+        [alice, bob], default_active_agent="Alice", private_messages=["Alice"]
+    ).compile(checkpointer=MemorySaver())
+    config: Any = {"configurable": {"thread_id": "1"}}
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "what's 1 + 2?"}]},  # type: ignore[arg-type]
+        config,
+    )
+
+    # Alice's tool call and result stay private, only her handoff is published...
+    assert [m.content for m in result["messages"]] == [
+        "what's 1 + 2?",
+        "",
+        "Successfully transferred to Bob",
+        "Hi, I'm Bob",
+    ]
+    assert result["messages"][1].tool_calls[0]["name"] == "transfer_to_bob"
+    # ...so Bob doesn't see them
+    assert len(model.inputs[2]) == 3
+    # Alice's private history only holds her own messages
+    assert [m.content for m in result["agent_messages"]["Alice"]] == [
+        "",
+        "3",
+        "",
+        "Successfully transferred to Bob",
+    ]
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "back to Alice please"}]},  # type: ignore[arg-type]
+        config,
+    )
+
+    # Alice sees her private messages where she made them
+    assert [m.content for m in model.inputs[4]] == [
+        "what's 1 + 2?",
+        "",
+        "3",
+        "",
+        "Successfully transferred to Bob",
+        "Hi, I'm Bob",
+        "back to Alice please",
+        "",
+        "Successfully transferred to Alice",
+    ]
+    assert result["messages"][-1].content == "1 + 2 is 3"
+    assert result["active_agent"] == "Alice"
+    # her final response is only kept in the shared history
+    assert len(result["agent_messages"]["Alice"]) == 4
+
+
+def test_fanout_from_private_agent() -> None:
+    model = RecordingChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[{"name": "add", "args": {"a": 1, "b": 2}, "id": "call_1"}],
+            ),
+            AIMessage(
+                content="",
+                name="Alice",
+                tool_calls=[
+                    {
+                        "name": "delegate_to_agents",
+                        "args": {"tasks": [{"agent": "Bob", "task": "double 3"}]},
+                        "id": "call_2",
+                    }
+                ],
+            ),
+            AIMessage(content="6", name="Bob"),
+            AIMessage(content="1 + 2 doubled is 6", name="Alice"),
+        ]
+    )
+    alice: Any = create_agent(
+        model,
+        tools=[add, create_fanout_tool(agent_names=["Bob"])],
+        name="Alice",
+    )
+    bob: Any = create_agent(model, tools=[], name="Bob")
+    app = create_swarm(
+        [alice, bob], default_active_agent="Alice", private_messages=["Alice"]
+    ).compile()
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "what's 1 + 2, doubled?"}]}  # type: ignore[arg-type]
+    )
+
+    # only the fan-out tool call and its results are published
+    assert [m.type for m in result["messages"]] == ["human", "ai", "tool", "ai"]
+    assert result["messages"][1].tool_calls[0]["id"] == "call_2"
+    assert result["messages"][-1].content == "1 + 2 doubled is 6"
+    # Alice sees her tool call and result before the fan-out
+    assert [m.content for m in model.inputs[-1]] == [
+        "what's 1 + 2, doubled?",
+        "",
+        "3",
+        "",
+        "Result from Bob:\n6",
+    ]
+
+
+def test_private_messages_validation() -> None:
+    alice: Any = create_agent(FakeChatModel(responses=[]), tools=[], name="Alice")
+    with pytest.raises(ValueError, match="unknown agents"):
+        create_swarm([alice], default_active_agent="Alice", private_messages=["Bob"])
+
+    class State(MessagesState):
+        active_agent: str | None
+
+    with pytest.raises(ValueError, match="Missing required key 'agent_messages'"):
+        create_swarm(
+            [alice],
+            default_active_agent="Alice",
+            state_schema=State,  # type: ignore[type-var]
+            private_messages=True,
+        )
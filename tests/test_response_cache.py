@@ -0,0 +1,103 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+from langchain_core.caches import BaseCache
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_swarm import SwarmResponseCache, create_handoff_tool, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app(cache: BaseCache, responses: list[AIMessage]) -> Any:
+    model = FakeChatModel(responses=responses, cache=cache)  # type: ignore[arg-type]
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    return create_swarm([alice, bob], default_active_agent="Alice").compile(
+        checkpointer=InMemorySaver()
+    )
+
+
+def _run(app: Any, thread_id: str) -> Any:
+    return app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Bob"}]},
+        {"configurable": {"thread_id": thread_id}},
+    )
+
+
+RESPONSES = [
+    AIMessage(
+        content="",
+        name="Alice",
+        tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+    ),
+    AIMessage(content="Hi, I'm Bob", name="Bob"),
+]
+
+
+def test_cached_responses_route_identically() -> None:
+    cache = SwarmResponseCache()
+    first = _run(_make_app(cache, RESPONSES), "1")
+    assert cache.info().misses == 2
+
+    # the model has no responses left, so the second run only uses the cache
+    second = _run(_make_app(cache, []), "2")
+
+    assert [m.content for m in second["messages"]] == [
+        m.content for m in first["messages"]
+    ]
+    assert second["messages"][1].tool_calls[0]["name"] == "transfer_to_bob"
+    assert second["active_agent"] == "Bob"
+    # cached responses get new message ids
+    assert second["messages"][-1].id != first["messages"][-1].id
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (2, 2, 2)
+
+
+def test_response_cache_key() -> None:
+    cache = SwarmResponseCache(maxsize=1)
+    prompt = '[{"kwargs": {"content": "hi", "response_metadata": {"a": 1}}}]'
+    cache.update(prompt, "model", [])
+    # message metadata is ignored
+    assert cache.lookup('[{"kwargs": {"content": "hi"}}]', "model") == []
+    assert cache.lookup('[{"kwargs": {"content": "hi"}}]', "other model") is None
+
+    cache.update("other prompt", "model", [])
+    assert cache.info().size == 1
+    assert cache.lookup(prompt, "model") is None
+
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        SwarmResponseCache(maxsize=0)
+
+
+def test_response_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langgraph_swarm.response_cache.time.time", lambda: now)
+    cache = SwarmResponseCache(ttl=10)
+    cache.update("prompt", "model", [])
+    now += 5
+    assert cache.lookup("prompt", "model") == []
+    now += 10
+    assert cache.lookup("prompt", "model") is None
+    assert cache.info().size == 0
+
+
+def test_response_cache_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "responses.sqlite"
+    cache = SwarmResponseCache(path=path)
+    _run(_make_app(cache, RESPONSES), "1")
+
+    # a new cache (e.g. after a restart) loads the responses from disk
+    cache = SwarmResponseCache(path=path)
+    result = _run(_make_app(cache, []), "1")
+    assert result["messages"][-1].content == "Hi, I'm Bob"
+    assert cache.info().hits == 2
+
+    cache.clear()
+    assert SwarmResponseCache(path=path).lookup("prompt", "model") is None
@@ -0,0 +1,75 @@
+import re
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraph_swarm import create_handoff_tool, create_keyword_router, create_swarm
+from tests.test_swarm import FakeChatModel
+
+
+def test_keyword_router() -> None:
+    router = create_keyword_router(
+        {
+            "flights": ["flight", "airport", re.compile(r"[A-Z]{2}[0-9]{3,4}")],
+            "hotels": ["hotel"],
+        }
+    )
+
+    def route(content: str) -> str | None:
+        return router({"messages": [HumanMessage(content=content)]})
+
+    assert route("I need to book a Flight") == "flights"
+    assert route("what's the status of LH1234?") == "flights"
+    assert route("find me a hotel near the airport") == "flights"
+    assert route("find me a hotel") == "hotels"
+    # keywords match whole words only
+    assert route("hotels") is None
+    assert route("hello") is None
+    # only the latest human message is considered
+    assert router({"messages": [AIMessage(content="hotel")]}) is None
+
+
+def test_swarm_with_pre_router() -> None:
+    model = FakeChatModel(
+        responses=[  # type: ignore[arg-type]
+            AIMessage(content="Bob here, how can I help with your hotel?", name="Bob"),
+            AIMessage(content="Bob again.", name="Bob"),
+        ]
+    )
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    workflow = create_swarm(
+        [alice, bob],
+        default_active_agent="Alice",
+        pre_router=create_keyword_router({"Bob": ["hotel"]}),
+    )
+    app = workflow.compile(checkpointer=MemorySaver())
+    config: Any = {"configurable": {"thread_id": "1"}}
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "I need a hotel"}]}, config
+    )
+    # routed straight to Bob, without a call to Alice
+    assert model.idx == 1
+    assert result["messages"][-1].content == "Bob here, how can I help with your hotel?"
+    assert result["active_agent"] == "Bob"
+
+    # the next turn continues with Bob
+    result = app.invoke({"messages": [{"role": "user", "content": "thanks"}]}, config)
+    assert result["messages"][-1].content == "Bob again."
+
+
+def test_pre_router_unknown_agent() -> None:
+    alice: Any = create_agent(FakeChatModel(responses=[]), tools=[], name="Alice")
+    app = create_swarm(
+        [alice], default_active_agent="Alice", pre_router=lambda _: "Bob"
+    ).compile()
+    with pytest.raises(ValueError, match="Pre-router returned agent 'Bob'"):
+        app.invoke({"messages": [{"role": "user", "content": "hi"}]})
@@ -1,6 +1,7 @@
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
+import pytest
 from langchain.agents import AgentState, create_agent
 from langchain.chat_models import BaseChatModel
 from langchain.messages import AIMessage
@@ -10,7 +11,12 @@ from langchain_core.messages.base import BaseMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
 from langgraph.checkpoint.memory import MemorySaver
 
-from langgraph_swarm import create_handoff_tool, create_swarm
+from langgraph_swarm import (
+    HandoffLimit,
+    create_handoff_directory_tool,
+    create_handoff_tool,
+    create_swarm,
+)
 
 if TYPE_CHECKING:
     from langchain_core.runnables.config import RunnableConfig
@@ -272,3 +278,196 @@ def test_basic_swarm_pydantic() -> None:
     assert turn_2["messages"][-2].content == "12"
     assert turn_2["messages"][-1].content == recorded_messages[4].content
     assert turn_2["active_agent"] == "Alice"
+
+
+def test_state_schema_is_interned() -> None:
+    model = FakeChatModel(responses=[])
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+
+    first = create_swarm([alice, bob], default_active_agent="Alice")
+    second = create_swarm([alice, bob], default_active_agent="Bob")
+    assert first.state_schema is second.state_schema
+
+    reordered = create_swarm([bob, alice], default_active_agent="Alice")
+    assert reordered.state_schema is not first.state_schema
+
+
+def test_swarm_with_handoff_directory_tool() -> None:
+    recorded_messages = [
+        AIMessage(
+            content="",
+            name="Alice",
+            tool_calls=[
+                {
+                    "name": "transfer_to_agent",
+                    "args": {"agent": "Charlie"},
+                    "id": "call_1",
+                },
+            ],
+        ),
+        AIMessage(content="Hi, I'm Charlie.", name="Charlie"),
+    ]
+    model = FakeChatModel(responses=recorded_messages)  # type: ignore[arg-type]
+    alice: Any = create_agent(
+        model,
+        tools=[create_handoff_directory_tool(agent_names=["Bob", "Charlie"])],
+        name="Alice",
+    )
+    bob: Any = create_agent(model, tools=[], name="Bob")
+    charlie: Any = create_agent(model, tools=[], name="Charlie")
+
+    workflow = create_swarm([alice, bob, charlie], default_active_agent="Alice")
+    assert workflow.nodes["Alice"].ends == ("Bob", "Charlie")
+    app = workflow.compile(checkpointer=MemorySaver())
+
+    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Charlie"}]},  # type: ignore[arg-type]
+        config,
+    )
+    assert result["messages"][-2].content == "Successfully transferred to Charlie"
+    assert result["messages"][-1].content == "Hi, I'm Charlie."
+    assert result["active_agent"] == "Charlie"
+
+
+@pytest.mark.parametrize(
+    ("handoff_messages", "expected"),
+    [
+        (
+            "keep",
+            [
+                "i'd like to speak to Charlie",
+                "",
+                "Successfully transferred to Bob",
+                "",
+                "Successfully transferred to Charlie",
+                "Hi, I'm Charlie.",
+            ],
+        ),
+        (
+            "compact",
+            [
+                "i'd like to speak to Charlie",
+                "[Handoff: Alice -> Bob -> Charlie]",
+                "Hi, I'm Charlie.",
+            ],
+        ),
+        ("drop", ["i'd like to speak to Charlie", "Hi, I'm Charlie."]),
+    ],
+)
+def test_swarm_collapse_handoffs(handoff_messages: Any, expected: list[str]) -> None:
+    recorded_messages = [
+        AIMessage(
+            content="",
+            name="Alice",
+            tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+        ),
+        AIMessage(
+            content="",
+            name="Bob",
+            tool_calls=[{"name": "transfer_to_charlie", "args": {}, "id": "call_2"}],
+        ),
+        AIMessage(content="Hi, I'm Charlie.", name="Charlie"),
+    ]
+    model = FakeChatModel(responses=recorded_messages)  # type: ignore[arg-type]
+    alice: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob: Any = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Charlie")], name="Bob"
+    )
+    charlie: Any = create_agent(model, tools=[], name="Charlie")
+
+    workflow = create_swarm(
+        [alice, bob, charlie],
+        default_active_agent="Alice",
+        handoff_messages=handoff_messages,
+    )
+    app = workflow.compile(checkpointer=MemorySaver())
+
+    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "i'd like to speak to Charlie"}]},  # type: ignore[arg-type]
+        config,
+    )
+    assert [m.content for m in result["messages"]] == expected
+    assert app.get_state(config).values["messages"] == result["messages"]
+    assert result["active_agent"] == "Charlie"
+
+
+def _make_ping_pong_agents(model: FakeChatModel) -> list[Any]:
+    alice = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Alice")], name="Bob"
+    )
+    charlie = create_agent(model, tools=[], name="Charlie")
+    return [alice, bob, charlie]
+
+
+def _make_ping_pong_responses(count: int) -> list[BaseMessage]:
+    return [
+        AIMessage(
+            content="",
+            name=name,
+            tool_calls=[
+                {
+                    "name": f"transfer_to_{other.lower()}",
+                    "args": {},
+                    "id": f"call_{i}",
+                },
+            ],
+        )
+        for i, (name, other) in enumerate(
+            [("Alice", "Bob"), ("Bob", "Alice")] * (count // 2)
+        )
+    ]
+
+
+def test_handoff_limit_ends_turn() -> None:
+    model = FakeChatModel(responses=_make_ping_pong_responses(10))
+    limit = HandoffLimit(max_cycles=1)
+    workflow = create_swarm(
+        _make_ping_pong_agents(model),
+        default_active_agent="Alice",
+        handoff_limit=limit,
+    )
+    app = workflow.compile()
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]}  # type: ignore[arg-type]
+    )
+    # Alice -> Bob -> Alice -> (Bob is not invoked again)
+    assert model.idx == 3
+    assert len(result["messages"]) == 7
+    assert limit.counters == {"max_handoffs": 0, "max_cycles": 1}
+
+
+def test_handoff_limit_routes_to_fallback() -> None:
+    model = FakeChatModel(
+        responses=[
+            *_make_ping_pong_responses(2),
+            AIMessage(content="Charlie here, let me help.", name="Charlie"),
+        ]
+    )
+    limit = HandoffLimit(max_handoffs=1, fallback_agent="Charlie")
+    workflow = create_swarm(
+        _make_ping_pong_agents(model),
+        default_active_agent="Alice",
+        handoff_limit=limit,
+    )
+    assert "Charlie" in workflow.nodes["Alice"].ends  # type: ignore[operator]
+    app = workflow.compile()
+
+    result = app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]}  # type: ignore[arg-type]
+    )
+    assert result["messages"][-1].content == "Charlie here, let me help."
+    assert result["active_agent"] == "Charlie"
+    assert limit.counters == {"max_handoffs": 1, "max_cycles": 0}
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain.agents import create_agent
+from langchain.messages import AIMessage
+
+from langgraph_swarm import (
+    SwarmTraceCallbackHandler,
+    create_handoff_tool,
+    create_swarm,
+)
+from tests.test_swarm import FakeChatModel
+
+
+def _make_app(**kwargs: Any) -> Any:
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "transfer_to_bob", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Hi, I'm Bob."),
+        ]
+    )
+    alice = create_agent(
+        model, tools=[create_handoff_tool(agent_name="Bob")], name="Alice"
+    )
+    bob = create_agent(model, tools=[], name="Bob")
+    return create_swarm([alice, bob], default_active_agent="Alice", **kwargs).compile()
+
+
+# with a pre-router, the agents run within wrapper nodes
+@pytest.mark.parametrize("wrapped", [False, True])
+def test_swarm_trace(tmp_path: Path, *, wrapped: bool) -> None:
+    tracer = SwarmTraceCallbackHandler()
+    app = _make_app(pre_router=lambda state: None) if wrapped else _make_app()
+    app.invoke(
+        {"messages": [{"role": "user", "content": "hi"}]},
+        {"callbacks": [tracer]},
+    )
+
+    lanes = {
+        event["tid"]: event["args"]["name"]
+        for event in tracer.events
+        if event["ph"] == "M"
+    }
+    spans = [
+        (lanes[event["tid"]], event["cat"], event["name"])
+        for event in sorted(tracer.events, key=lambda event: event.get("ts", 0))
+        if event["ph"] == "X"
+    ]
+    assert spans == [
+        ("swarm", "swarm", "LangGraph"),
+        ("swarm", "router", "route_to_active_agent"),
+        ("Alice", "agent", "Alice"),
+        ("Alice", "node", "model"),
+        ("Alice", "llm", "FakeChatModel"),
+        ("Alice", "node", "tools"),
+        ("Alice", "tool", "transfer_to_bob"),
+        ("Bob", "agent", "Bob"),
+        ("Bob", "node", "model"),
+        ("Bob", "llm", "FakeChatModel"),
+    ]
+    span_end = {
+        event["name"]: event["ts"] + event["dur"]
+        for event in tracer.events
+        if event["ph"] == "X"
+    }
+    handoff = next(event for event in tracer.events if event.get("cat") == "handoff")
+    assert handoff["args"] == {"source": "Alice", "destination": "Bob"}
+    assert handoff["ts"] >= span_end["transfer_to_bob"]
+
+    path = tmp_path / "trace.json"
+    tracer.save(path)
+    assert json.loads(path.read_text())["traceEvents"] == json.loads(
+        json.dumps(tracer.events, default=str)
+    )